@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ aperçu par items image du canvas (un par morceau de calque)
+
+Mode de rendu « items » (EDITOR_RENDER_MODE) : au lieu d'aplatir les calques dans
+une image PIL à chaque rafraîchissement, chaque calque est affiché par ses
+propres items image du canvas, avec une PhotoImage créée à partir de son
+raster d'affichage (Layer.display_raster). Tk compose lui-même les items
+(canal alpha compris) sur le fond du canvas.
+
+- un déplacement est un canvas.move() du tag du calque, sans travail PIL ;
+- une modification du calque (version) recrée ses seules PhotoImage ;
+- un changement d'ordre de la pile est appliqué par tag_raise() ;
+- la couleur de fond est celle du canvas.
+
+L'aplatissement PIL complet reste utilisé pour l'export (save_image).
+"""
+
+import logging
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Préfixe des tags d'items de calque sur le canvas
+LAYER_TAG_PREFIX = 'layer-'
+
+
+class _LayerItems:
+    """Items et PhotoImage affichant un calque."""
+
+    __slots__ = ('layer', 'tag', 'version', 'visible', 'origin', 'photos')
+
+    def __init__(self, layer, tag):
+        self.layer = layer
+        self.tag = tag
+        self.version = None
+        self.visible = None
+        self.origin = None
+        self.photos = []
+
+
+class CanvasLayerView:
+    """Affiche une pile de calques par items image d'un canvas Tk."""
+
+    def __init__(self, canvas, photo_factory=None):
+        """
+        Args:
+            canvas (tk.Canvas): canvas d'édition.
+            photo_factory (callable): crée la PhotoImage d'une image PIL
+                (défaut : ImageTk.PhotoImage, importé à la demande).
+        """
+        self.canvas = canvas
+        self.photo_factory = photo_factory
+        self._items = {}
+        self._order = []
+        self._background = None
+        # Suivi : PhotoImage créées, déplacements et réordonnancements
+        self.photos_created = 0
+        self.moves = 0
+        self.restacks = 0
+
+    def _create_photo(self, image):
+        if self.photo_factory is not None:
+            return self.photo_factory(image)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(image)
+
+    def _pieces(self, layer):
+        """Morceaux RGBA (alpha = masque) du calque, relatifs à son origine."""
+        pieces = layer.display_raster()
+        if pieces is None:
+            # calque sans raster : dessiné sur une image transparente de la taille du canvas
+            image = Image.new('RGBA', (layer.CANVA_W, layer.CANVA_H), (0, 0, 0, 0))
+            layer.draw_on_image(image, export=False)
+            ox, oy = layer.display_origin()
+            return [(image, (-ox, -oy))]
+        result = []
+        for piece, offset, mask in pieces:
+            if mask is not piece:
+                piece = piece.copy()
+                piece.putalpha(mask)
+            result.append((piece, offset))
+        return result
+
+    def _rebuild(self, layer, entry, origin):
+        """Recrée les items d'un calque (nouveau ou modifié)."""
+        canvas = self.canvas
+        canvas.delete(entry.tag)
+        entry.photos = []
+        state = 'normal' if layer.visible else 'hidden'
+        for piece, (x, y) in self._pieces(layer):
+            photo = self._create_photo(piece)
+            self.photos_created += 1
+            entry.photos.append(photo)
+            canvas.create_image(origin[0] + x, origin[1] + y, anchor='nw', image=photo,
+                                state=state, tags=(entry.tag,))
+
+    def sync(self, layers, background):
+        """
+        Met les items du canvas en accord avec la pile de calques.
+
+        Args:
+            layers (list): pile de calques (index 0 = calque du dessus).
+            background (str): couleur de fond (celle du canvas).
+        """
+        canvas = self.canvas
+        if background != self._background:
+            canvas.config(background=background)
+            self._background = background
+
+        present = {id(layer) for layer in layers}
+        for key in [k for k in self._items if k not in present]:
+            canvas.delete(self._items.pop(key).tag)
+
+        rebuilt = []
+        for index, layer in enumerate(layers):
+            origin = layer.display_origin()
+            entry = self._items.get(id(layer))
+            if entry is None or entry.layer is not layer:
+                if entry is not None:
+                    canvas.delete(entry.tag)
+                entry = self._items[id(layer)] = _LayerItems(layer, f"{LAYER_TAG_PREFIX}{id(layer)}")
+            # calque sans raster : pas de version fiable, recréé à chaque fois
+            if entry.version != layer.version or layer.display_raster() is None:
+                self._rebuild(layer, entry, origin)
+                rebuilt.append(index)
+            else:
+                if entry.visible != layer.visible:
+                    canvas.itemconfigure(entry.tag, state='normal' if layer.visible else 'hidden')
+                if origin != entry.origin:
+                    canvas.move(entry.tag, origin[0] - entry.origin[0], origin[1] - entry.origin[1])
+                    self.moves += 1
+            entry.version, entry.visible, entry.origin = layer.version, layer.visible, origin
+
+        order = [id(layer) for layer in layers]
+        if order != self._order:
+            # du bas vers le haut : le dernier relevé est au-dessus
+            for layer in reversed(layers):
+                canvas.tag_raise(self._items[id(layer)].tag)
+            self.restacks += 1
+            self._order = order
+        else:
+            # items recréés (au sommet) : les replacer juste sous le calque du dessus
+            for index in rebuilt:
+                above = self._tag_above(layers, index)
+                if above is not None:
+                    canvas.tag_lower(self._items[id(layers[index])].tag, above)
+
+    def _tag_above(self, layers, index):
+        """Tag du plus proche calque au-dessus de layers[index] ayant des items (None = sommet)."""
+        for layer in reversed(layers[:index]):
+            entry = self._items.get(id(layer))
+            if entry is not None and entry.photos:
+                return entry.tag
+        return None
+
+    def clear(self):
+        """Supprime tous les items de calque du canvas."""
+        for entry in self._items.values():
+            self.canvas.delete(entry.tag)
+        self._items.clear()
+        self._order = []
+
+
+__all__ = ['CanvasLayerView', 'LAYER_TAG_PREFIX']
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ composition de l'aperçu avec images pré-aplaties
+
+L'aperçu est la superposition du fond et de la pile de calques (le dernier
+calque de la liste est dessiné en premier). Pendant un déplacement ou un
+redimensionnement, seul le calque actif change : les calques situés sous lui
+(fond compris) et ceux situés au-dessus sont aplatis une fois dans deux
+images gardées en cache. Une image de l'aperçu coûte alors une copie de
+l'image du dessous, un collage du calque actif et une composition de
+l'image du dessus, quel que soit le nombre de calques.
+
+Les images en cache sont recalculées quand la couleur de fond, l'ordre des
+calques, le calque actif ou l'état d'un calque aplati (version, visibilité,
+position) change. Un calque sans raster d'affichage (display_raster() None)
+est redessiné à chaque image.
+
+update() garde l'aperçu précédent et, quand seul le calque actif a changé,
+ne recompose que la zone modifiée : l'union de ses rectangles avant et
+après (rectangle « sale »), à recopier ensuite dans la PhotoImage affichée.
+Le travail par interaction dépend alors de la surface modifiée, pas de la
+taille du canvas.
+"""
+
+import logging
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+def union_box(a, b):
+    """Union de deux rectangles (x0, y0, x1, y1) ; un rectangle vide est ignoré."""
+    if a is None or a[2] <= a[0] or a[3] <= a[1]:
+        return b
+    if b is None or b[2] <= b[0] or b[3] <= b[1]:
+        return a
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def clip_box(box, size):
+    """Rectangle rogné aux dimensions `size`, ou None s'il est vide."""
+    if box is None:
+        return None
+    x0, y0 = max(0, int(box[0])), max(0, int(box[1]))
+    x1, y1 = min(size[0], int(box[2])), min(size[1], int(box[3]))
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1, y1
+
+
+def _alpha_composite_clipped(dst, src, pos):
+    """alpha_composite de `src` sur `dst` en (x, y), en rognant ce qui dépasse."""
+    x, y = pos
+    left, top = max(0, -x), max(0, -y)
+    right = min(src.width, dst.width - x)
+    bottom = min(src.height, dst.height - y)
+    if right <= left or bottom <= top:
+        return
+    dst.alpha_composite(src, dest=(x + left, y + top), source=(left, top, right, bottom))
+
+
+class LayerCompositor:
+    """
+    Compose l'aperçu d'un ImageEditor en gardant en cache les calques
+    aplatis sous et au-dessus du calque actif.
+    """
+
+    def __init__(self, size):
+        """
+        Args:
+            size (tuple): dimensions de l'aperçu (largeur, hauteur).
+        """
+        self.size = size
+        self._below_key = None
+        self._below = None
+        self._above_key = None
+        self._above = None
+        # Nombre de recalculs des images en cache (suivi / tests)
+        self.below_renders = 0
+        self.above_renders = 0
+        # Aperçu courant (update) et état du calque actif qu'il affiche
+        self._frame = None
+        self._active_state = None
+        self._active_box = None
+        # Rectangles recomposés et pixels correspondants (suivi / benchmark)
+        self.full_updates = 0
+        self.region_updates = 0
+        self.pixels_composed = 0
+
+    @staticmethod
+    def _state(layers):
+        """
+        Clé de cache d'une suite de calques, ou None si l'un d'eux ne peut
+        pas être mis en cache.
+        """
+        state = []
+        for layer in layers:
+            if layer.visible and layer.display_raster() is None:
+                return None
+            state.append((id(layer), layer.version, layer.visible, layer.display_origin()))
+        return tuple(state)
+
+    @staticmethod
+    def _draw(layer, image):
+        """Dessine un calque (raster en cache si possible) sur l'image."""
+        if not layer.visible:
+            return
+        if layer.display_raster() is None:
+            layer.draw_on_image(image, export=False)
+        else:
+            layer.paste_display_raster(image)
+
+    def _below_image(self, layers, background):
+        """Fond + calques situés sous le calque actif, aplatis."""
+        key = self._state(layers)
+        if key is not None:
+            key = (background, key)
+        if key is None or key != self._below_key or self._below is None:
+            image = Image.new('RGBA', self.size, background)
+            for layer in reversed(layers):
+                self._draw(layer, image)
+            self._below = image
+            self._below_key = key
+            self.below_renders += 1
+        return self._below
+
+    def _above_image(self, layers):
+        """Calques situés au-dessus du calque actif, aplatis sur fond transparent (None si aucun)."""
+        if not any(layer.visible for layer in layers):
+            self._above, self._above_key = None, None
+            return None
+        key = self._state(layers)
+        if key is None or key != self._above_key or self._above is None:
+            image = Image.new('RGBA', self.size, (0, 0, 0, 0))
+            for layer in reversed(layers):
+                if not layer.visible:
+                    continue
+                pieces = layer.display_raster()
+                if pieces is None:
+                    layer.draw_on_image(image, export=False)
+                    continue
+                ox, oy = layer.display_origin()
+                for piece, (x, y), mask in pieces:
+                    if mask is not piece:
+                        piece = piece.copy()
+                        piece.putalpha(mask)
+                    _alpha_composite_clipped(image, piece, (ox + x, oy + y))
+            self._above = image
+            self._above_key = key
+            self.above_renders += 1
+        return self._above
+
+    def render(self, layers, active_idx, background):
+        """
+        Compose l'aperçu.
+
+        Args:
+            layers (list): pile de calques (index 0 = calque du dessus).
+            active_idx (int): index du calque actif (-1 = aucun).
+            background (str): couleur de fond.
+
+        Returns:
+            PIL.Image: nouvelle image RGBA de l'aperçu.
+        """
+        if 0 <= active_idx < len(layers):
+            above, active, below = layers[:active_idx], layers[active_idx], layers[active_idx + 1:]
+        else:
+            above, active, below = [], None, layers
+
+        frame = self._below_image(below, background).copy()
+        if active is not None:
+            self._draw(active, frame)
+        above_image = self._above_image(above)
+        if above_image is not None:
+            frame.alpha_composite(above_image)
+        return frame
+
+    def update(self, layers, active_idx, background):
+        """
+        Met à jour l'aperçu courant en ne recomposant que ce qui a changé.
+
+        Args:
+            layers (list): pile de calques (index 0 = calque du dessus).
+            active_idx (int): index du calque actif (-1 = aucun).
+            background (str): couleur de fond.
+
+        Returns:
+            tuple: (aperçu, rectangle modifié (x0, y0, x1, y1) ou None si
+            rien n'a changé). L'aperçu est modifié sur place d'un appel à
+            l'autre : le copier pour le conserver.
+        """
+        if 0 <= active_idx < len(layers):
+            above, active, below = layers[:active_idx], layers[active_idx], layers[active_idx + 1:]
+        else:
+            above, active, below = [], None, layers
+
+        previous_below, previous_above = self._below, self._above
+        below_image = self._below_image(below, background)
+        above_image = self._above_image(above)
+
+        if active is None:
+            active_state, active_box = None, (0, 0, 0, 0)
+        else:
+            active_state = (id(active), active.version, active.visible, active.display_origin())
+            active_box = active.display_bbox()
+
+        full = (self._frame is None
+                or below_image is not previous_below
+                or above_image is not previous_above
+                or active_box is None or self._active_box is None
+                or active_state is None or self._active_state is None
+                or active_state[0] != self._active_state[0])
+        if full:
+            self._frame = self.render(layers, active_idx, background)
+            box = (0, 0) + tuple(self.size)
+            self.full_updates += 1
+        elif active_state == self._active_state:
+            return self._frame, None
+        else:
+            box = clip_box(union_box(self._active_box, active_box), self.size)
+            if box is not None:
+                self._compose_region(box, below_image, active, above_image)
+                self.region_updates += 1
+
+        self._active_state = active_state
+        self._active_box = active_box
+        if box is not None:
+            self.pixels_composed += (box[2] - box[0]) * (box[3] - box[1])
+        return self._frame, box
+
+    def _compose_region(self, box, below_image, active, above_image):
+        """Recompose le rectangle `box` de l'aperçu courant."""
+        frame = self._frame
+        frame.paste(below_image.crop(box), box[:2])
+        # le calque actif est entièrement compris dans le rectangle sale
+        self._draw(active, frame)
+        if above_image is not None:
+            frame.alpha_composite(above_image, dest=box[:2], source=box)
+
+    def invalidate(self):
+        """Oublie les images en cache (recalculées à la prochaine composition)."""
+        self._below_key = self._below = None
+        self._above_key = self._above = None
+        self._frame = None
+
+
+__all__ = ['LayerCompositor', 'union_box', 'clip_box']
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ décodage des images importées dans un calque, à mémoire bornée
+
+Une photo de 6000x4000 ouverte puis convertie en RGBA coûtait ~96 Mo par
+calque, alors que l'image export ne fait que 1800x1200. load_import_image()
+produit directement l'image utile :
+- JPEG : `Image.draft` fait décoder l'image par libjpeg à 1/2, 1/4 ou 1/8
+  de sa taille (le plus petit facteur qui reste au-dessus de la limite) ;
+- l'orientation EXIF est appliquée (photos de téléphone) ;
+- l'image est limitée à la taille qui couvre tout l'export à raison d'un
+  pixel source par pixel export (cover_size) : au-delà, les pixels
+  supplémentaires ne seraient jamais visibles tant que le calque ne dépasse
+  pas l'image export ;
+- la conversion RGBA est faite sur l'image réduite.
+
+save_import_derivative() enregistre cette image réduite dans le répertoire
+du cadre à la place de l'original (option IMPORT_STORE_DERIVATIVE).
+"""
+
+import io
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Tuple, Union
+
+from PIL import Image
+
+from ..image_decode import reduce_factor
+
+logger = logging.getLogger(__name__)
+
+_EXIF_ORIENTATION = 0x0112
+# Transformation qui redresse l'image pour chaque orientation EXIF (cf. ImageOps.exif_transpose)
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+# Orientations qui échangent largeur et hauteur (rotation de 90° / 270°)
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+# Qualité JPEG des images réduites enregistrées sans transparence
+DERIVATIVE_JPEG_QUALITY = 92
+
+
+def cover_size(source: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Plus petite taille de `source` (proportions gardées) qui couvre entièrement
+    `box` ; jamais agrandie.
+
+    Args:
+        source: (largeur, hauteur) de l'image
+        box: (largeur, hauteur) à couvrir
+
+    Returns:
+        (largeur, hauteur) d'au moins 1 pixel
+    """
+    width, height = source
+    scale = min(max(box[0] / width, box[1] / height), 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def load_import_image(file_path: Union[str, Path], max_size: Tuple[int, int]) -> Image.Image:
+    """
+    Décode une image importée, orientée selon l'EXIF et limitée à cover_size(max_size).
+
+    Args:
+        file_path: chemin de l'image source
+        max_size: (largeur, hauteur) de l'image export
+
+    Returns:
+        Image PIL RGBA chargée, indépendante du fichier source
+
+    Raises:
+        FileNotFoundError, UnidentifiedImageError, OSError si la source est illisible
+    """
+    with Image.open(file_path) as img:
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        transposed = orientation in _TRANSPOSED_ORIENTATIONS
+        # limite calculée dans le sens d'affichage, appliquée dans le sens du fichier
+        oriented = img.size[::-1] if transposed else img.size
+        target = cover_size(oriented, max_size)
+        stored_target = target[::-1] if transposed else target
+        if img.format == 'JPEG' and stored_target != img.size:
+            # libjpeg décode directement à l'échelle 1/2, 1/4 ou 1/8 (sans descendre sous la cible)
+            img.draft(img.mode, stored_target)
+        img.load()
+
+        out = img
+        if out.mode in ('1', 'P', 'PA'):
+            # modes que resize() ne sait rééchantillonner qu'au plus proche voisin
+            out = out.convert('RGBA')
+        factor = reduce_factor(img.size, stored_target, 1.0)
+        if factor > 1:
+            out = out.reduce(factor)
+        if out.size != stored_target:
+            out = out.resize(stored_target, Image.Resampling.LANCZOS)
+        if orientation in _ORIENTATION_TRANSPOSE:
+            # redressée après réduction : la rotation porte sur moins de pixels
+            out = out.transpose(_ORIENTATION_TRANSPOSE[orientation])
+        if out.mode != 'RGBA':
+            out = out.convert('RGBA')
+    # Une image chargée reste utilisable après fermeture du fichier
+    return out
+
+
+def encode_import_derivative(image: Image.Image) -> Tuple[bytes, str]:
+    """
+    Encode l'image importée réduite : en JPEG si elle est opaque, en PNG sinon.
+
+    Args:
+        image: image RGBA produite par load_import_image()
+
+    Returns:
+        (contenu du fichier, extension '.jpg' ou '.png')
+    """
+    buffer = io.BytesIO()
+    if image.getchannel('A').getextrema()[0] == 255:
+        image.convert('RGB').save(buffer, format='JPEG', quality=DERIVATIVE_JPEG_QUALITY)
+        return buffer.getvalue(), '.jpg'
+    image.save(buffer, format='PNG')
+    return buffer.getvalue(), '.png'
+
+
+def save_import_derivative(image: Image.Image, source_path: Union[str, Path], frame_dir: Union[str, Path]) -> str:
+    """
+    Enregistre l'image importée réduite dans le répertoire du cadre.
+
+    Un fichier existant n'est jamais écrasé (y compris l'image d'origine si
+    elle est déjà dans ce répertoire) : le nom reçoit un suffixe
+    (logo.png -> logo_2.png). Le contenu est écrit dans un fichier temporaire
+    puis mis en place par `os.replace`.
+
+    Args:
+        image: image RGBA produite par load_import_image()
+        source_path: chemin de l'image d'origine (pour le nom du fichier)
+        frame_dir: répertoire du cadre
+
+    Returns:
+        Nom du fichier enregistré (relatif à frame_dir)
+    """
+    data, suffix = encode_import_derivative(image)
+    frame_dir = Path(frame_dir)
+    stem = Path(source_path).stem
+    fd, tmp = tempfile.mkstemp(prefix='.import-', suffix=suffix, dir=frame_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        filename, index = stem + suffix, 1
+        while (frame_dir / filename).exists():
+            index += 1
+            filename = f"{stem}_{index}{suffix}"
+        os.replace(tmp, frame_dir / filename)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(f"Image réduite {image.size} enregistrée dans {frame_dir / filename}")
+    return filename
+
+
+__all__ = ['load_import_image', 'encode_import_derivative', 'save_import_derivative', 'cover_size',
+           'DERIVATIVE_JPEG_QUALITY']
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ pyramide de réductions (mip-map) des images importées
+
+Un calque image redimensionné à la molette rééchantillonnait l'image
+d'origine complète à chaque cran : pour une photo de 24 Mpx, le coût ne
+dépendait que de la taille de la source. ImagePyramid garde l'image
+d'origine (niveau 0) et des réductions par puissances de deux (niveau n =
+source / 2**n, obtenu par Image.reduce()). Un redimensionnement part du plus
+petit niveau encore au moins aussi grand que la cible : son coût dépend de
+la taille affichée.
+
+Les niveaux sont calculés au premier besoin (à partir du plus proche niveau
+plus grand déjà disponible) et rangés dans un cache LRU partagé, borné en
+octets (PYRAMID_CACHE_MB) : sous la contrainte mémoire, les niveaux les
+moins récemment utilisés sont évincés puis recalculés si besoin. Le niveau
+0 n'est jamais évincé (il appartient au calque).
+"""
+
+import itertools
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from ..config_loader import PYRAMID_CACHE_MB
+from ..preview_cache import image_bytes
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class PyramidLevelCache:
+    """Cache LRU des niveaux réduits de toutes les pyramides, borné en octets."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: budget mémoire (octets)
+        """
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[Image.Image]:
+        """Retourne le niveau en cache (marqué comme utilisé), ou None."""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key: tuple, image: Image.Image) -> None:
+        """Range un niveau, en évinçant les moins récemment utilisés au-delà du budget."""
+        size = image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= image_bytes(previous)
+            self._entries[key] = image
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= image_bytes(evicted)
+                self.evictions += 1
+
+    def discard(self, token: int) -> None:
+        """Oublie tous les niveaux d'une pyramide."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == token]:
+                self._total_bytes -= image_bytes(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Octets actuellement occupés par les niveaux."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache partagé par les pyramides des calques de l'éditeur
+level_cache = PyramidLevelCache(PYRAMID_CACHE_MB * MB)
+
+_tokens = itertools.count(1)
+
+
+class ImagePyramid:
+    """Image d'origine et ses réductions par puissances de deux, calculées à la demande."""
+
+    def __init__(self, source: Image.Image, cache: PyramidLevelCache = None):
+        """
+        Args:
+            source: image d'origine (niveau 0)
+            cache: cache des niveaux réduits (défaut : cache partagé level_cache)
+        """
+        self.source = source
+        self.cache = cache if cache is not None else level_cache
+        self._token = next(_tokens)
+        # niveaux libérés avec la pyramide
+        weakref.finalize(self, self.cache.discard, self._token)
+        # Suivi : niveaux calculés (dont recalculs après éviction)
+        self.levels_built = 0
+
+    def level_size(self, level: int) -> Tuple[int, int]:
+        """Dimensions du niveau (celles produites par Image.reduce(2**level))."""
+        factor = 1 << level
+        return -(-self.source.width // factor), -(-self.source.height // factor)
+
+    def level_for(self, size: Tuple[int, int]) -> int:
+        """Plus petit niveau encore au moins aussi grand que size (0 pour un agrandissement)."""
+        level = 0
+        while True:
+            width, height = self.level_size(level + 1)
+            if width < size[0] or height < size[1] or (width, height) == self.level_size(level):
+                return level
+            level += 1
+
+    def level(self, level: int) -> Image.Image:
+        """Image du niveau demandé, réduite au besoin depuis le plus proche niveau disponible."""
+        if level <= 0:
+            return self.source
+        image = self.cache.get((self._token, level))
+        if image is not None:
+            return image
+        base = level - 1
+        base_image = None
+        while base > 0:
+            base_image = self.cache.get((self._token, base))
+            if base_image is not None:
+                break
+            base -= 1
+        if base_image is None:
+            base_image = self.source
+        image = base_image.reduce(1 << (level - base))
+        self.levels_built += 1
+        self.cache.put((self._token, level), image)
+        return image
+
+    def resize(self, size: Tuple[int, int], resample=Image.Resampling.LANCZOS) -> Image.Image:
+        """Redimensionne à size depuis le niveau le plus adapté (cf. level_for())."""
+        size = (int(size[0]), int(size[1]))
+        return self.level(self.level_for(size)).resize(size, resample)
+
+    def release(self) -> None:
+        """Libère les niveaux réduits de cette pyramide (l'image d'origine est gardée)."""
+        self.cache.discard(self._token)
+
+    def __repr__(self) -> str:
+        return f"ImagePyramid(source={self.source.size}, levels_built={self.levels_built})"
+
+
+__all__ = ['ImagePyramid', 'PyramidLevelCache', 'level_cache']
@@ -4,7 +4,7 @@
 
 import tkinter as tk
 from tkinter import colorchooser, messagebox
-from PIL import Image, ImageTk
+from PIL import Image
 from re import fullmatch
 from platform import system
 import logging
@@ -12,11 +12,20 @@ import logging
 from .layerimage import LayerImage
 from .layertext import LayerText
 from .layerexcluzone import LayerExcluZone
+from .compositor import LayerCompositor
+from .render_scheduler import RenderScheduler
+from .canvas_view import CanvasLayerView
+from .preview_surface import PreviewSurface
 # Import du traducteur
 from ..i18n import t
+from ..config_loader import EDITOR_MAX_FPS, EDITOR_RENDER_MODE
 
 logger = logging.getLogger(__name__)
 
+# Délai (ms) sans cran de molette après lequel le redimensionnement est
+# considéré terminé : l'affichage rapide est alors recalculé en qualité finale
+RESIZE_SETTLE_MS = 150
+
 
 class ImageEditor:
     """
@@ -60,7 +69,19 @@ class ImageEditor:
         # -- Canvas/IHM --
         self.canvas = tk.Canvas(self.root, width=self.CANVA_W, height=self.CANVA_H)
         self.canvas.pack()
-        self.tk_image = None
+        # un seul item image et une seule PhotoImage, mis à jour sur place
+        self.preview = PreviewSurface(self.canvas, (self.CANVA_W, self.CANVA_H))
+        # Aperçu : calques sous / au-dessus du calque actif aplatis en cache,
+        # ou (mode "items") un item du canvas par calque
+        self.compositor = LayerCompositor((self.CANVA_W, self.CANVA_H))
+        self.canvas_view = CanvasLayerView(self.canvas) if EDITOR_RENDER_MODE == 'items' else None
+        # update_canvas() ne fait que demander un rendu, regroupé au prochain repos de Tk
+        self.render_scheduler = RenderScheduler(self.root, self.render_canvas, max_fps=EDITOR_MAX_FPS)
+        # Couleur affichée dans le champ / l'aperçu de couleur de fond
+        self._shown_background = None
+        self._syncing_background = False
+        # fin de geste de redimensionnement planifiée (after)
+        self._refine_after_id = None
 
         self.layers_frame = tk.Frame(self.root)
         self.layers_frame.pack(side='left',
@@ -320,21 +341,34 @@ class ImageEditor:
             if system() == "Linux":
                 if event.num == 4:
                     if layer.layer_type == 'Image':
-                        layer.resize(10)
+                        layer.resize(10, draft=True)
                     elif layer.layer_type == 'Texte':
                         layer.resize_font(2)
                 elif event.num == 5:
                     if layer.layer_type == 'Image':
-                        layer.resize(-10)
+                        layer.resize(-10, draft=True)
                     elif layer.layer_type == 'Texte':
                         layer.resize_font(-2)
             else:  # Windows et autres
                 if layer.layer_type == 'Image':
                     delta = 10 if event.delta > 0 else -10
-                    layer.resize(delta)
+                    layer.resize(delta, draft=True)
                 elif layer.layer_type == 'Texte':
                     delta = 2 if event.delta > 0 else -2
                     layer.resize_font(delta)
+            self._schedule_refine()
+            self.update_canvas()
+
+    def _schedule_refine(self):
+        """(Re)planifie la fin du geste de redimensionnement, RESIZE_SETTLE_MS après le dernier cran."""
+        if self._refine_after_id is not None:
+            self.root.after_cancel(self._refine_after_id)
+        self._refine_after_id = self.root.after(RESIZE_SETTLE_MS, self._refine_layers)
+
+    def _refine_layers(self):
+        """Fin du geste : recalcule en qualité finale les calques affichés en qualité rapide."""
+        self._refine_after_id = None
+        if any([layer.refine() for layer in self.layers]):
             self.update_canvas()
 
     def select_background_color(self):
@@ -351,11 +385,14 @@ class ImageEditor:
         """
         une nouvelle valeur de couleur a été saisie, mettre à jour
         """
+        # écriture du champ par _sync_background_widgets() : pas de nouveau rendu
+        if self._syncing_background:
+            return
         try:
             if args:
                 color_code = self.texte_background_value.get()
                 match = fullmatch(r'^#[0-9A-Fa-f]{6}$', color_code)
-                if match:
+                if match and color_code != self.background_couleur:
                     self.background_couleur = color_code
                     self.update_canvas()
         except Exception as e:
@@ -390,33 +427,61 @@ class ImageEditor:
 
     def update_canvas(self):
         """
-        Redessine tous les calques empilés sur le canvas d’édition.
+        Demande le rafraîchissement du canvas d’édition : le rendu est fait
+        une seule fois au prochain repos de la boucle Tk, quel que soit le
+        nombre de demandes d'ici là (cf. render_scheduler).
         """
+        self.render_scheduler.request()
 
-        # couleur du fond
-        # met à jour le label (couleur et texte)
+    def _sync_background_widgets(self):
+        """Affiche la couleur de fond courante dans le champ et l'aperçu de couleur."""
+        if self._shown_background == self.background_couleur:
+            return
         self.label_couleur.config(bg=self.background_couleur)
-        self.texte_background.delete(0, tk.END)  # Efface le champ existant
-        self.texte_background.insert(0, self.background_couleur)
-        # génère une image avec la couleur sélectionnée
-        display_image = Image.new('RGBA',
-                                  (self.CANVA_W, self.CANVA_H),
-                                  self.background_couleur)
-
-        # évite l'effacement par le garbage collector
-        temp_image = display_image.copy()
+        if self.texte_background_value.get() != self.background_couleur:
+            # la trace du champ ne doit pas redemander un rendu
+            self._syncing_background = True
+            try:
+                self.texte_background_value.set(self.background_couleur)
+            finally:
+                self._syncing_background = False
+        self._shown_background = self.background_couleur
 
-        # superpose les calques dans l'image
+    def render_canvas(self):
+        """
+        Redessine tous les calques empilés sur le canvas d’édition (appelé
+        par le planificateur ; update_canvas() pour demander un rendu).
+        Seul le calque actif est recollé : les autres calques viennent des
+        images aplaties du compositeur (cf. compositor), et seul le rectangle
+        modifié est recopié dans l'image affichée.
+        """
         try:
-            for layer in reversed(self.layers):
-                layer.draw_on_image(temp_image, export=False)
+            # couleur du fond : met à jour le label (couleur et texte)
+            self._sync_background_widgets()
+        except tk.TclError as e:
+            # fenêtre fermée avant le rendu planifié
+            logger.debug(f"Editor render skipped: {e}")
+            return
+        if self.canvas_view is not None:
+            # mode "items" : Tk compose les items des calques sur le fond du canvas
+            try:
+                self.canvas_view.sync(self.layers, self.background_couleur)
+            except Exception as e:
+                messagebox.showerror(t('image.msg.error.render'),
+                                     f"Exception inattendue lors du rendu de l'image : {str(e)}")
+            return
+        # superpose les calques sur le fond de la couleur sélectionnée
+        try:
+            temp_image, box = self.compositor.update(self.layers,
+                                                     self.active_layer_idx,
+                                                     self.background_couleur)
         except Exception as e:
             messagebox.showerror(t('image.msg.error.render'),
                                  f"Exception inattendue lors du rendu de l'image : {str(e)}")
             return
-
-        self.tk_image = ImageTk.PhotoImage(temp_image)
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.tk_image)
+        if box is None:
+            return
+        self.preview.show(temp_image, box)
 
 
 # --- Pour tester/demo ---
@@ -22,6 +22,8 @@ from CadreSelecteur import __version__
 from CadreSelecteur.ttk_theme import apply_clam_theme
 from CadreSelecteur.exceptions import FileOperationError
 from CadreSelecteur.error_handler import handle_exception
+from CadreSelecteur.timing import now_ns, record, span
+from CadreSelecteur.asset_store import ProjectAssets
 # Import du traducteur
 from ..i18n import t
 
@@ -97,6 +99,9 @@ class ImageEditorApp:
                 self.prj_name = Path(project).stem
                 self.mode = self.Mode.EDIT
 
+            # Temps de construction mesuré après la saisie du nom (attente utilisateur exclue)
+            init_ns = now_ns()
+
             # Dimension de la fenêtre
             self.tk_root = root
             apply_clam_theme(self.tk_root)
@@ -141,16 +146,18 @@ class ImageEditorApp:
             # Ajouter un traceur pour appeler la fonction lors du changement d'état
             self.selected_template.trace_add("write", self.on_template_change)
 
-            self.exclusion_zones = self.load_template()
+            with span('load_template'):
+                self.exclusion_zones = self.load_template()
 
             # App1 frame
             self.app1_frame = tk.Frame(self.main_frame, borderwidth=2, relief='groove')
             self.app1_frame.grid(column=0, row=1, padx=5, pady=5)
-            self.app1 = ImageEditor(self.app1_frame,
-                                    self.exclusion_zones[0],
-                                    base_dir=self.base_dir,
-                                    frame_dir=self.frame_dir,
-                                    prj_name=self.prj_name)
+            with span('ImageEditor app1'):
+                self.app1 = ImageEditor(self.app1_frame,
+                                        self.exclusion_zones[0],
+                                        base_dir=self.base_dir,
+                                        frame_dir=self.frame_dir,
+                                        prj_name=self.prj_name)
 
             # bouton synchronisation droite gauche
             self.arrow_frame = tk.Frame(self.main_frame)
@@ -184,11 +191,12 @@ class ImageEditorApp:
             # App4 frame
             self.app4_frame = tk.Frame(self.main_frame, borderwidth=2, relief='groove')
             self.app4_frame.grid(column=2, row=1, padx=10, pady=10)
-            self.app4 = ImageEditor(self.app4_frame,
-                                    self.exclusion_zones[1],
-                                    base_dir=self.base_dir,
-                                    frame_dir=self.frame_dir,
-                                    prj_name=self.prj_name)
+            with span('ImageEditor app4'):
+                self.app4 = ImageEditor(self.app4_frame,
+                                        self.exclusion_zones[1],
+                                        base_dir=self.base_dir,
+                                        frame_dir=self.frame_dir,
+                                        prj_name=self.prj_name)
 
             # frame load save and export
             self.export_frame = tk.Frame(self.main_frame, borderwidth=2, relief='groove')
@@ -214,7 +222,10 @@ class ImageEditorApp:
             button_quit.grid(column=2, row=0, sticky=tk.EW, padx=5, pady=5)
 
             if self.mode == self.Mode.EDIT:
-                self.load_project()
+                with span('load_project'):
+                    self.load_project()
+
+            record('ImageEditorApp.__init__', init_ns, report=True)
 
         except Exception as e:
             handle_exception(e, operation="initialize_editor",
@@ -252,12 +263,15 @@ class ImageEditorApp:
                              context={'source': path_to_xml, 'dest': self.base_dir},
                              log_level='exception')
 
-        # Copier les images utilisées dans les calques
+        # Copier les images utilisées dans les calques (hors images du store partagé)
         try:
+            assets = ProjectAssets(self.frame_dir)
             for app in [self.app1, self.app4]:
                 for layer in app.layers:
                     if hasattr(layer, 'imported_image_path') and layer.imported_image_path:
                         image_path = layer.imported_image_path
+                        if image_path in assets:
+                            continue
                         if self.base_dir and not Path(image_path).is_absolute():
                             image_path = str(Path(self.base_dir) / image_path)
                         if Path(image_path).exists():
@@ -303,6 +317,11 @@ class ImageEditorApp:
                 dump(project_data, file, indent=2, ensure_ascii=False)  # pretty print
             logger.debug(f"Project saved to {file_path}")
 
+            # Manifeste des images : ne garder que les références des calques enregistrés
+            used_images = [layer.imported_image_path for layer in app1_layer_tmp + app4_layer_tmp
+                           if getattr(layer, 'imported_image_path', None)]
+            ProjectAssets(self.frame_dir).retain(used_images)
+
         except (OSError, IOError) as e:
             handle_exception(e, operation="save_project",
                              context={'file': file_path},
@@ -29,6 +29,77 @@ class Layer:
         self.locked = False
         self.layer_type = "generic"
         self.name = name
+        # Version du contenu (hors position) : incrémentée à chaque modification
+        # qui change le rendu, elle invalide le raster d'affichage en cache
+        self.version = 0
+        self._display_raster = None
+        # True si le raster d'affichage est une version rapide (geste en cours),
+        # à remplacer par refine() une fois le geste terminé
+        self.draft = False
+
+    def invalidate(self):
+        """Signale une modification du contenu du calque (texte, taille, image...)."""
+        self.version += 1
+
+    def refine(self):
+        """
+        Méthode à spécialiser. Recalcule en qualité finale un affichage
+        produit en qualité rapide pendant un geste (cf. draft).
+
+        Returns :
+            bool : True si le rendu du calque a changé.
+        """
+        return False
+
+    def display_origin(self):
+        """Position (pixels du canvas) à laquelle placer le raster d'affichage."""
+        return int(self.display_position[0]), int(self.display_position[1])
+
+    def display_raster(self):
+        """
+        Raster d'affichage du calque, recalculé seulement si `version` a changé.
+
+        Returns :
+            list : morceaux (image RGBA, (x, y), masque) relatifs à
+            display_origin(), collés comme image.paste(image, (x, y), masque) ;
+            None si le calque ne sait pas se mettre en cache (il est alors
+            redessiné par draw_on_image()).
+        """
+        if self._display_raster is None or self._display_raster[0] != self.version:
+            self._display_raster = (self.version, self.render_display_raster())
+        return self._display_raster[1]
+
+    def render_display_raster(self):
+        """
+        Méthode à spécialiser. Calcule le raster d'affichage (cf. display_raster()).
+
+        Returns :
+            list ou None
+        """
+        return None
+
+    def display_bbox(self):
+        """
+        Rectangle (x0, y0, x1, y1) couvert par le raster d'affichage, en
+        pixels du canvas (non rogné) ; None si le calque n'a pas de raster.
+        Un calque vide ou masqué a un rectangle vide (x1 <= x0).
+        """
+        pieces = self.display_raster()
+        if pieces is None:
+            return None
+        if not self.visible or not pieces:
+            return 0, 0, 0, 0
+        ox, oy = self.display_origin()
+        return (min(ox + x for _, (x, _y), _ in pieces),
+                min(oy + y for _, (_x, y), _ in pieces),
+                max(ox + x + piece.width for piece, (x, _y), _ in pieces),
+                max(oy + y + piece.height for piece, (_x, y), _ in pieces))
+
+    def paste_display_raster(self, image):
+        """Colle le raster d'affichage en cache sur l'image PIL (aperçu)."""
+        ox, oy = self.display_origin()
+        for piece, (x, y), mask in self.display_raster() or ():
+            image.paste(piece, (ox + x, oy + y), mask)
 
     def drag(self, event, start_pos):
         """
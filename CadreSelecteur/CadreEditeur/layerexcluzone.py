@@ -27,6 +27,44 @@ class LayerExcluZone(Layer):
 
     def set_exclusion_zone(self, value):
         self.exclusion_zone = value
+        self.invalidate()
+
+    def display_origin(self):
+        """Les zones sont en coordonnées absolues du canvas (le calque ne se déplace pas)."""
+        return 0, 0
+
+    def render_display_raster(self):
+        """Images de substitution mises à l'échelle et pivotées, une par zone."""
+        pieces = []
+        res_dir = resolve_resources_dir()
+        for i, zone_data in enumerate(self.exclusion_zone or ()):
+            # Rétrocompatibilité : vérifie si l'angle est présent dans les données
+            if len(zone_data) == 5:
+                d_x, d_y, d_w, d_h, angle = zone_data
+            else:
+                d_x, d_y, d_w, d_h = zone_data
+                angle = 0
+            img_path = res_dir / f"photo{i + 1}.png"
+            if not img_path.exists():
+                continue
+            try:
+                placeholder = Image.open(img_path).convert("RGBA")
+                # 1. Mise à l'échelle
+                placeholder = placeholder.resize((int(d_w), int(d_h)), Image.Resampling.LANCZOS)
+
+                # 2. Rotation si nécessaire
+                if angle != 0:
+                    # expand=True évite que les coins de l'image soient coupés lors de la rotation
+                    placeholder = placeholder.rotate(angle, expand=True, resample=Image.Resampling.BICUBIC)
+
+                # 3. Coordonnées de collage pour centrer l'image (pivotée) sur la zone
+                p_w, p_h = placeholder.size
+                pieces.append((placeholder,
+                               (int(d_x + d_w / 2 - p_w / 2), int(d_y + d_h / 2 - p_h / 2)),
+                               placeholder))
+            except Exception as e:
+                print(f"Erreur chargement image {img_path}: {e}")
+        return pieces
 
     def draw_on_image(self, image: Image.Image, export=False):
         """
@@ -35,13 +73,16 @@ class LayerExcluZone(Layer):
         """
         if not self.visible or not self.exclusion_zone:
             return
+        if not export:
+            # --- MODE ÉDITION : images de substitution (mises en cache) ---
+            self.paste_display_raster(image)
+            return
 
         draw_i = ImageDraw.Draw(image)
-        local_ratio = self.RATIO if export else 1
+        local_ratio = self.RATIO
 
-        res_dir = resolve_resources_dir()
-
-        for i, zone_data in enumerate(self.exclusion_zone):
+        # --- MODE EXPORT : Dessin des zones d'exclusion (trous) ---
+        for zone_data in self.exclusion_zone:
             # Rétrocompatibilité : vérifie si l'angle est présent dans les données
             if len(zone_data) == 5:
                 d_x, d_y, d_w, d_h, angle = zone_data
@@ -56,52 +97,28 @@ class LayerExcluZone(Layer):
             c_x = i_x + (i_w / 2)
             c_y = i_y + (i_h / 2)
 
-            if not export:
-                # --- MODE ÉDITION : Affichage de l'image de substitution ---
-                img_path = res_dir / f"photo{i + 1}.png"
-                if img_path.exists():
-                    try:
-                        placeholder = Image.open(img_path).convert("RGBA")
-                        # 1. Mise à l'échelle
-                        placeholder = placeholder.resize((int(i_w), int(i_h)), Image.Resampling.LANCZOS)
-
-                        # 2. Rotation si nécessaire
-                        if angle != 0:
-                            # expand=True évite que les coins de l'image soient coupés lors de la rotation
-                            placeholder = placeholder.rotate(angle, expand=True, resample=Image.Resampling.BICUBIC)
-
-                        # 3. Recalcul des coordonnées de collage pour centrer l'image pivotée
-                        p_w, p_h = placeholder.size
-                        paste_x = int(c_x - (p_w / 2))
-                        paste_y = int(c_y - (p_h / 2))
-
-                        image.paste(placeholder, (paste_x, paste_y), placeholder)
-                    except Exception as e:
-                        print(f"Erreur chargement image {img_path}: {e}")
+            if angle != 0:
+                # On utilise la trigonométrie pour calculer les 4 coins pivotés
+                # On inverse l'angle car l'axe Y est orienté vers le bas en traitement d'image
+                rad = radians(-angle)
+
+                def rotate_pt(px, py):
+                    dx, dy = px - c_x, py - c_y
+                    nx = dx * cos(rad) - dy * sin(rad)
+                    ny = dx * sin(rad) + dy * cos(rad)
+                    return (nx + c_x, ny + c_y)
+
+                # Calcul des sommets du polygone (Haut-Gauche, Haut-Droit, Bas-Droit, Bas-Gauche)
+                p1 = rotate_pt(i_x, i_y)
+                p2 = rotate_pt(i_x + i_w, i_y)
+                p3 = rotate_pt(i_x + i_w, i_y + i_h)
+                p4 = rotate_pt(i_x, i_y + i_h)
+
+                # On trace un polygone orienté à la place d'un rectangle standard
+                draw_i.polygon([p1, p2, p3, p4], fill=(255, 255, 255, 0))
             else:
-                # --- MODE EXPORT : Dessin de la zone d'exclusion (trou) ---
-                if angle != 0:
-                    # On utilise la trigonométrie pour calculer les 4 coins pivotés
-                    # On inverse l'angle car l'axe Y est orienté vers le bas en traitement d'image
-                    rad = radians(-angle)
-
-                    def rotate_pt(px, py):
-                        dx, dy = px - c_x, py - c_y
-                        nx = dx * cos(rad) - dy * sin(rad)
-                        ny = dx * sin(rad) + dy * cos(rad)
-                        return (nx + c_x, ny + c_y)
-
-                    # Calcul des sommets du polygone (Haut-Gauche, Haut-Droit, Bas-Droit, Bas-Gauche)
-                    p1 = rotate_pt(i_x, i_y)
-                    p2 = rotate_pt(i_x + i_w, i_y)
-                    p3 = rotate_pt(i_x + i_w, i_y + i_h)
-                    p4 = rotate_pt(i_x, i_y + i_h)
-
-                    # On trace un polygone orienté à la place d'un rectangle standard
-                    draw_i.polygon([p1, p2, p3, p4], fill=(255, 255, 255, 0))
-                else:
-                    # Traitement standard si pas de rotation (plus rapide)
-                    draw_i.rectangle((i_x, i_y, i_x + i_w, i_y + i_h), fill=(255, 255, 255, 0))
+                # Traitement standard si pas de rotation (plus rapide)
+                draw_i.rectangle((i_x, i_y, i_x + i_w, i_y + i_h), fill=(255, 255, 255, 0))
 
     def update_param_zone(self, frame):
         for widget in frame.winfo_children():
@@ -12,9 +12,18 @@ import logging
 
 from ..i18n import t
 from .layer import Layer
+from .raster_store import raster_store
+from .image_import import load_import_image, encode_import_derivative, save_import_derivative
+from ..asset_store import ProjectAssets
+from ..config_loader import IMPORT_STORE_DERIVATIVE, ASSET_STORE
 
 logger = logging.getLogger(__name__)
 
+# Filtre de rééchantillonnage pendant un geste (molette) : rapide
+DRAFT_RESAMPLE = Image.Resampling.NEAREST
+# Filtre de l'affichage une fois le geste terminé et de l'image export
+FINAL_RESAMPLE = Image.Resampling.LANCZOS
+
 
 class LayerImage(Layer):
     """
@@ -38,6 +47,8 @@ class LayerImage(Layer):
         self.layer_type = 'Image'
         self.imported_image_path = None
         self.original_image = None
+        # réductions de original_image : les redimensionnements partent du niveau adapté
+        self.pyramid = None
         self.display_imported_image = None
         self.display_imported_image_size = (0, 0)
         self.image_imported_image = None
@@ -47,7 +58,10 @@ class LayerImage(Layer):
     def import_image(self):
         """
         Ouvre un dialogue pour importer une image locale.
-        Copie l'image dans {frame_dir}
+        L'image est décodée réduite à la taille utile à l'export (cf. image_import).
+        Range l'image (ou, avec IMPORT_STORE_DERIVATIVE, l'image réduite) dans le
+        store d'images partagé des projets et la référence dans le manifeste de
+        {frame_dir} (cf. asset_store) ; sans ASSET_STORE, la copie dans {frame_dir}.
         Stocke le chemin relatif.
 
         Returns :
@@ -60,7 +74,7 @@ class LayerImage(Layer):
 
         try:
             # Valider l'image avant de la copier
-            self.original_image = Image.open(imported_path).convert('RGBA')
+            self.set_original_image(load_import_image(imported_path, (self.IMAGE_W, self.IMAGE_H)))
         except UnidentifiedImageError:
             messagebox.showerror("Erreur d'image", "Image corrompue ou illisible.", parent=self.tk_parent)
             return False
@@ -74,12 +88,26 @@ class LayerImage(Layer):
                 frame_dir_path = Path(self.frame_dir)
                 frame_dir_path.mkdir(parents=True, exist_ok=True)
 
-                # Obtenir le nom du fichier
-                filename = Path(imported_path).name
-                destination_path = frame_dir_path / filename
+                if ASSET_STORE:
+                    # Ranger le contenu une seule fois pour tous les projets
+                    assets = ProjectAssets(frame_dir_path)
+                    if IMPORT_STORE_DERIVATIVE:
+                        data, suffix = encode_import_derivative(self.original_image)
+                        filename = assets.add_bytes(data, Path(imported_path).stem + suffix)
+                    else:
+                        filename = assets.add_file(imported_path)
+                    destination_path = assets.resolve(filename)
+                elif IMPORT_STORE_DERIVATIVE:
+                    # Enregistrer l'image réduite au lieu de l'original
+                    filename = save_import_derivative(self.original_image, imported_path, frame_dir_path)
+                    destination_path = frame_dir_path / filename
+                else:
+                    # Obtenir le nom du fichier
+                    filename = Path(imported_path).name
+                    destination_path = frame_dir_path / filename
 
-                # Copier le fichier
-                shutil.copy2(imported_path, destination_path)
+                    # Copier le fichier
+                    shutil.copy2(imported_path, destination_path)
 
                 # Stocker le chemin relatif (juste le nom du fichier)
                 self.imported_image_path = filename
@@ -98,16 +126,21 @@ class LayerImage(Layer):
         desired_h = int(desired_w / aspect)
         self.display_imported_image_size = (desired_w, desired_h)
         self.image_imported_image_size = (desired_w * self.RATIO, desired_h * self.RATIO)
-        self.display_imported_image = self.original_image.resize(self.display_imported_image_size)
-        self.image_imported_image = self.original_image.resize(self.image_imported_image_size)
+        self._resample_display()
+        self.invalidate()
         return True
 
-    def resize(self, delta):
+    def resize(self, delta, draft=False):
         """
         Redimensionne l'image importée en conservant le ratio.
 
+        Seul l'affichage est rééchantillonné : l'image export est recalculée
+        à la demande (cf. export_image()).
+
         Args :
             delta (int) : Variation de la largeur du calque (en px).
+            draft (bool) : True pendant un geste (molette) : filtre rapide,
+                l'affichage final est recalculé par refine().
         """
         if not self.original_image:
             return
@@ -119,8 +152,51 @@ class LayerImage(Layer):
         new_h = max(10, new_h)
         self.display_imported_image_size = (new_w, new_h)
         self.image_imported_image_size = (new_w * self.RATIO, new_h * self.RATIO)
-        self.display_imported_image = self.original_image.resize(self.display_imported_image_size)
-        self.image_imported_image = self.original_image.resize(self.image_imported_image_size)
+        self._resample_display(draft)
+        self.invalidate()
+
+    def set_original_image(self, image):
+        """
+        Remplace l'image d'origine et sa pyramide de réductions, partagée
+        avec les calques clonés qui utilisent la même image (cf. raster_store).
+        """
+        self.original_image = image
+        self.pyramid = raster_store.acquire(image) if image is not None else None
+
+    def _resample(self, size, resample):
+        """Redimensionne l'image d'origine, depuis le niveau de pyramide adapté."""
+        if self.pyramid is not None and self.pyramid.source is self.original_image:
+            return self.pyramid.resize(size, resample)
+        return self.original_image.resize(size, resample)
+
+    def _resample_display(self, draft=False):
+        """Recalcule l'image d'affichage (et oublie l'image export, devenue fausse)."""
+        resample = DRAFT_RESAMPLE if draft else FINAL_RESAMPLE
+        self.display_imported_image = self._resample(self.display_imported_image_size, resample)
+        self.image_imported_image = None
+        self.draft = draft
+
+    def refine(self):
+        """Remplace l'affichage rapide produit pendant un geste par l'affichage final."""
+        if not self.draft or not self.original_image:
+            return False
+        self._resample_display()
+        self.invalidate()
+        return True
+
+    def export_image(self):
+        """
+        Image redimensionnée à la taille export, calculée au premier besoin
+        (enregistrement) puis gardée jusqu'au prochain redimensionnement.
+
+        Returns :
+            PIL.Image ou None
+        """
+        if not self.original_image:
+            return self.image_imported_image
+        if self.image_imported_image is None or self.image_imported_image.size != self.image_imported_image_size:
+            self.image_imported_image = self._resample(self.image_imported_image_size, FINAL_RESAMPLE)
+        return self.image_imported_image
 
     def draw_on_image(self, image: Image.Image, export=False):
         """
@@ -132,10 +208,24 @@ class LayerImage(Layer):
         """
         if not self.visible or not self.display_imported_image:
             return
-        to_paste = self.image_imported_image if export else self.display_imported_image
-        pos = self.image_position if export else self.display_position
+        if not export:
+            self.paste_display_raster(image)
+            return
+        to_paste = self.export_image()
+        if to_paste is None:
+            return
+        pos = self.image_position
         image.paste(to_paste, (int(pos[0]), int(pos[1])), to_paste)
 
+    def render_display_raster(self):
+        """L'image redimensionnée pour l'affichage, collée à la position du calque."""
+        if not self.display_imported_image:
+            return []
+        image = self.display_imported_image
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        return [(image, (0, 0), image)]
+
     def update_param_zone(self, frame):
         for widget in frame.winfo_children():
             widget.destroy()
@@ -150,6 +240,10 @@ class LayerImage(Layer):
     def clone(self, tk_parent, parent):
         """
         Crée une copie indépendante de ce LayerImage (mêmes réglages, nouvelle instance)
+
+        Les images ne sont pas copiées : les calques ne les modifient jamais sur
+        place, un redimensionnement du clone lui alloue ses propres images
+        (copie à l'écriture, cf. raster_store).
         """
         new_layer = LayerImage(
             tk_parent,
@@ -165,15 +259,14 @@ class LayerImage(Layer):
         new_layer.locked = self.locked
 
         new_layer.imported_image_path = self.imported_image_path
-        # Pour les images PIL il faut vraiment cloner la donnée! (sans 'link')
+        # pixels partagés (original, pyramide, affichage, export) jusqu'au redimensionnement
         if self.original_image is not None:
-            new_layer.original_image = self.original_image.copy()
-        if self.display_imported_image is not None:
-            new_layer.display_imported_image = self.display_imported_image.copy()
+            new_layer.set_original_image(self.original_image)
+        new_layer.display_imported_image = self.display_imported_image
         new_layer.display_imported_image_size = tuple(self.display_imported_image_size)
-        if self.image_imported_image is not None:
-            new_layer.image_imported_image = self.image_imported_image.copy()
+        new_layer.image_imported_image = self.image_imported_image
         new_layer.image_imported_image_size = tuple(self.image_imported_image_size)
+        new_layer.draft = self.draft
 
         return new_layer
 
@@ -227,11 +320,11 @@ class LayerImage(Layer):
         if obj.imported_image_path:
             try:
                 image_name = obj.imported_image_path
-                image_path = str(parent.frame_dir / image_name)
+                # blob du store si l'image est au manifeste du projet, sinon fichier du projet
+                image_path = str(ProjectAssets(parent.frame_dir).resolve(image_name))
 
-                obj.original_image = Image.open(image_path).convert('RGBA')
-                obj.display_imported_image = obj.original_image.resize(obj.display_imported_image_size)
-                obj.image_imported_image = obj.original_image.resize(obj.image_imported_image_size)
+                obj.set_original_image(load_import_image(image_path, image_size))
+                obj._resample_display()
             except FileNotFoundError:
                 logger.warning(f"Fichier non trouvé: {obj.imported_image_path}")
                 obj.original_image = None
@@ -10,7 +10,6 @@ import logging
 from pathlib import Path
 
 from .layer import Layer
-from .text import ask_font
 from ..path_resolver import resolve_file_in_package
 # Import du traducteur
 from ..i18n import t
@@ -72,17 +71,39 @@ class LayerText(Layer):
         new_size = max(4, self.sel_font['size'] + delta)
         self.sel_font['size'] = new_size
         self.pil_font = ImageFont.truetype(str(self.font_name), self.sel_font['size'])
+        self.invalidate()
 
     def draw_on_image(self, image: Image.Image, export=False):
         """Dessine le texte sur l’image PIL, à la position courante."""
         if not self.visible or not self.text:
             return
-        pos = self.image_position if export else self.display_position
-        size = self.sel_font['size'] * self.RATIO if export else self.sel_font['size']
+        if not export:
+            self.paste_display_raster(image)
+            return
+        pos = self.image_position
+        size = self.sel_font['size'] * self.RATIO
         font = ImageFont.truetype(str(self.font_name), size)
         draw = ImageDraw.Draw(image)
         draw.text(pos, self.text.get(), fill=self.font_color, font=font)
 
+    def render_display_raster(self):
+        """
+        Texte rendu une fois : un aplat de la couleur du texte et le masque
+        des glyphes (même résultat que draw.text() sur le fond, sans
+        recharger la police à chaque image).
+        """
+        text = self.text.get()
+        if not text:
+            return []
+        font = ImageFont.truetype(str(self.font_name), self.sel_font['size'])
+        left, top, right, bottom = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text, font=font)
+        if right <= left or bottom <= top:
+            return []
+        mask = Image.new('L', (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+        sprite = Image.new('RGBA', mask.size, self.font_color)
+        return [(sprite, (left, top), mask)]
+
     def update_param_zone(self, frame):
         """Met à jour la zone de paramètres du panneau latéral."""
         for widget in frame.winfo_children():
@@ -104,6 +125,8 @@ class LayerText(Layer):
         ouvre la fenêtre ask_font() et charge la police sélectionnée
         depuis le répertoire Fonts/.
         """
+        # Import différé : le sélecteur de police (tkfontchooser) n'est chargé qu'à l'ouverture
+        from .text import ask_font
         try:
             font_selected = ask_font(self.tk_parent,
                                      text=self.text.get(),
@@ -124,6 +147,7 @@ class LayerText(Layer):
                     messagebox.showwarning(t('layertext.msg.warn.font_not_found_title'),
                                            t('layertext.msg.warn.font_not_found_message', family=family))
                     self.font_name = str(resolve_file_in_package('Fonts') / "Anton-Regular.ttf")
+                self.invalidate()
 
             self.parent.update_canvas()
 
@@ -161,12 +185,14 @@ class LayerText(Layer):
             # couleur peut être (None, None) si annulation => vérifier
             if couleur and couleur[1]:
                 self.font_color = couleur[1]
+                self.invalidate()
                 self.parent.update_canvas()
         except Exception as e:
             messagebox.showerror(t('image.msg.error.color'), f"Exception inattendue : {str(e)}")
 
     def on_text_change(self, *args):
         """Met à jour le texte sur le canvas quand il change."""
+        self.invalidate()
         try:
             if args:
                 self.parent.update_canvas()
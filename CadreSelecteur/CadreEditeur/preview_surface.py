@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ surface d'affichage de l'aperçu composé (mode « composite »)
+
+L'aperçu est affiché par un seul item image du canvas, créé au premier
+rendu, et une seule PhotoImage de la taille du canvas dont les pixels sont
+mis à jour sur place :
+- mise à jour complète : PhotoImage.paste() de l'image entière ;
+- rectangle modifié : paste() dans une PhotoImage tampon (elle aussi de la
+  taille du canvas, allouée une fois), puis recopie Tk
+  (`image copy ... -from ... -to x y`) du rectangle à sa place.
+
+Aucun item ni aucune PhotoImage n'est créé après le premier rendu : les
+compteurs photo_allocations / items_created permettent de le vérifier.
+"""
+
+import logging
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewSurface:
+    """Item image unique du canvas affichant l'aperçu, mis à jour sur place."""
+
+    def __init__(self, canvas, size, photo_factory=None):
+        """
+        Args:
+            canvas (tk.Canvas): canvas d'édition.
+            size (tuple): taille (largeur, hauteur) de l'aperçu.
+            photo_factory (callable): crée la PhotoImage d'une image PIL
+                (défaut : ImageTk.PhotoImage, importé à la demande).
+        """
+        self.canvas = canvas
+        self.size = tuple(size)
+        self.photo_factory = photo_factory
+        self.photo = None
+        self.item = None
+        self._staging = None
+        # Suivi : PhotoImage allouées et items créés sur le canvas
+        self.photo_allocations = 0
+        self.items_created = 0
+
+    def _create_photo(self, image):
+        self.photo_allocations += 1
+        if self.photo_factory is not None:
+            return self.photo_factory(image)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(image)
+
+    def show(self, image, box=None):
+        """
+        Affiche l'aperçu, en entier ou seulement le rectangle modifié.
+
+        Args:
+            image (PIL.Image): aperçu complet (taille self.size).
+            box (tuple): rectangle (x0, y0, x1, y1) à recopier (None = tout).
+        """
+        if self.photo is None:
+            self.photo = self._create_photo(image)
+            self.item = self.canvas.create_image(0, 0, anchor='nw', image=self.photo)
+            self.items_created += 1
+            return
+        if box is None or box == (0, 0) + self.size:
+            self.photo.paste(image)
+            return
+        self._push_region(image, box)
+
+    def _push_region(self, image, box):
+        """
+        Recopie un rectangle de l'aperçu dans la PhotoImage affichée.
+
+        ImageTk.PhotoImage.paste() ne sait écrire qu'à partir du coin (0, 0) :
+        le rectangle est écrit en haut à gauche du tampon, puis recopié par
+        Tk à sa place. Le coût est proportionnel à la surface du rectangle.
+        """
+        if self._staging is None:
+            self._staging = self._create_photo(Image.new(image.mode, self.size))
+        region = image.crop(box)
+        self._staging.paste(region)
+        width, height = region.size
+        self.canvas.tk.call(str(self.photo), 'copy', str(self._staging),
+                            '-from', 0, 0, width, height,
+                            '-to', box[0], box[1], '-compositingrule', 'set')
+
+    def item_count(self):
+        """Nombre d'items présents sur le canvas (détection des fuites d'items)."""
+        return len(self.canvas.find_all())
+
+
+__all__ = ['PreviewSurface']
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ partage des images d'origine entre calques clonés
+
+La synchronisation 1→4 / 4→1 (ImageEditorApp.copy_conf) clone les calques ;
+LayerImage.clone() copiait alors l'image d'origine, l'image d'affichage et
+l'image export : trois copies des pixels par calque synchronisé.
+
+Les images d'un calque ne sont jamais modifiées sur place : un
+redimensionnement produit une nouvelle image qui remplace l'ancienne dans
+le seul calque concerné. Un clone peut donc reprendre les mêmes objets
+image (copie à l'écriture) : seuls les calques dont la taille diverge
+allouent de nouveaux pixels.
+
+RasterStore associe à chaque image d'origine partagée une seule pyramide
+de réductions (cf. image_pyramid), reprise par tous les calques qui la
+partagent. Le store ne garde que des références faibles : une image et ses
+réductions sont libérées dès que plus aucun calque ne les utilise (le
+compteur de références est celui de Python).
+"""
+
+import logging
+import weakref
+
+from .image_pyramid import ImagePyramid
+from ..preview_cache import image_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class RasterStore:
+    """Pyramides des images d'origine partagées entre calques, en références faibles."""
+
+    def __init__(self):
+        # id(image d'origine) -> pyramide (qui garde l'image), tant qu'un calque l'utilise
+        self._pyramids = weakref.WeakValueDictionary()
+        # Suivi : pyramides créées et reprises par un autre calque
+        self.created = 0
+        self.shared = 0
+
+    def acquire(self, image):
+        """
+        Pyramide de l'image d'origine, partagée avec les autres calques qui l'utilisent.
+
+        Args:
+            image (PIL.Image): image d'origine d'un calque.
+
+        Returns:
+            ImagePyramid
+        """
+        pyramid = self._pyramids.get(id(image))
+        if pyramid is not None and pyramid.source is image:
+            self.shared += 1
+            return pyramid
+        pyramid = ImagePyramid(image)
+        self._pyramids[id(image)] = pyramid
+        self.created += 1
+        return pyramid
+
+    @property
+    def total_bytes(self):
+        """Octets des images d'origine distinctes encore utilisées."""
+        return sum(image_bytes(pyramid.source) for pyramid in list(self._pyramids.values()))
+
+    def __len__(self):
+        return len(self._pyramids)
+
+
+# Store partagé par les calques des deux éditeurs (1 et 4 photos)
+raster_store = RasterStore()
+
+__all__ = ['RasterStore', 'raster_store']
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+""" Module d'édition de cadre pour PiBooth
+    |→ regroupement des demandes de rendu de l'aperçu
+
+Les sources de rafraîchissement de l'éditeur (déplacement, molette, frappe
+dans un texte, couleur de fond, chargement d'un projet...) ne dessinent plus
+directement : elles appellent request(), qui marque l'aperçu « à refaire »
+et planifie un seul rendu au prochain passage de la boucle Tk au repos
+(after_idle). Toutes les demandes reçues d'ici là sont servies par ce même
+rendu : deux rendus pour un même état sont impossibles.
+
+Avec une cadence maximale (max_fps), un rendu demandé trop tôt après le
+précédent est reporté (after) à l'image suivante au lieu d'être fait au
+prochain repos.
+"""
+
+import logging
+import time
+import tkinter as tk
+
+logger = logging.getLogger(__name__)
+
+# Cadence maximale par défaut (images par seconde, 0 = pas de limite)
+DEFAULT_MAX_FPS = 60
+
+
+class RenderScheduler:
+    """Planifie au plus un rendu par passage au repos de la boucle Tk."""
+
+    def __init__(self, widget, render, max_fps=DEFAULT_MAX_FPS, clock=time.monotonic):
+        """
+        Args:
+            widget (tk.Misc): widget fournissant after() / after_idle() / after_cancel().
+            render (callable): fonction de rendu, appelée sans argument.
+            max_fps (int): cadence maximale (0 = pas de limite).
+            clock (callable): horloge en secondes (injectable pour les tests).
+        """
+        self.widget = widget
+        self.render = render
+        self.min_interval = 1.0 / max_fps if max_fps and max_fps > 0 else 0.0
+        self.clock = clock
+        self.dirty = False
+        self._after_id = None
+        self._last_render = None
+        # Suivi : demandes reçues et rendus effectués
+        self.requests = 0
+        self.renders = 0
+
+    @property
+    def pending(self):
+        """True si un rendu est planifié."""
+        return self._after_id is not None
+
+    def request(self):
+        """Demande un rendu (regroupé avec les autres demandes en attente)."""
+        self.requests += 1
+        self.dirty = True
+        if self._after_id is None:
+            self._schedule()
+
+    def _schedule(self):
+        delay = 0.0
+        if self.min_interval and self._last_render is not None:
+            delay = self._last_render + self.min_interval - self.clock()
+        if delay > 0:
+            self._after_id = self.widget.after(max(1, int(delay * 1000 + 0.5)), self._run)
+        else:
+            self._after_id = self.widget.after_idle(self._run)
+
+    def _run(self):
+        self._after_id = None
+        if not self.dirty:
+            return
+        self.dirty = False
+        self._last_render = self.clock()
+        self.renders += 1
+        self.render()
+
+    def flush(self):
+        """Effectue tout de suite le rendu en attente (ex : avant un export)."""
+        self.cancel()
+        self._run()
+
+    def cancel(self):
+        """Annule le rendu planifié (l'aperçu reste marqué « à refaire »)."""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError as e:
+                logger.debug(f"after_cancel failed: {e}")
+            self._after_id = None
+
+
+__all__ = ['RenderScheduler', 'DEFAULT_MAX_FPS']
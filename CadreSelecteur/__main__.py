@@ -1,51 +1,97 @@
 # -*- coding: utf-8 -*-
 """ Module de selection de cadre pour PiBooth
-    |→ point d'entrée de l'appli autonome """
+    |→ point d'entrée de l'appli autonome
+
+    Sans argument : interface graphique.
+    Avec arguments : ligne de commande sans Tk (cf. cli.py), ex.
+        python -m CadreSelecteur install <projet>
+
+    Les modules graphiques (tkinter, PIL.ImageTk, éditeur) ne sont importés
+    que pour l'interface graphique, afin que la ligne de commande démarre vite.
+
+    L'interface graphique démarre dans un seul processus : l'écran de
+    démarrage est une fenêtre Toplevel qui affiche les étapes réelles
+    (répertoires vérifiés, modèles analysés, vignettes décodées) et se
+    ferme dès que le sélecteur est prêt.
+
+    Les temps des phases de démarrage sont écrits dans le log (cf. timing.py).
+"""
 
 import logging
 import sys
-from multiprocessing import Process, freeze_support
-
-from CadreSelecteur.cadreselecteur import CadreSelecteur, check_mandatory_path
-from CadreSelecteur.splash import splash
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def run_splash() -> None:
+def run_gui(on_ready: Optional[Callable] = None, started_ns: Optional[int] = None) -> None:
     """
-    Lance l'écran de splash.
+    Construit le sélecteur sous l'écran de démarrage, puis lance la boucle Tk
+    (bloquant jusqu'à la fermeture de la fenêtre).
+
+    La fenêtre principale reste masquée pendant sa construction ; elle est
+    affichée dès que les vignettes des premières lignes sont décodées (ou au
+    plus tard après splash.MAX_WAIT_MS).
 
-    La fonction splash() gère elle-même le timeout et se ferme proprement.
+    Args:
+        on_ready: appelé (thread Tk) avec l'instance CadreSelecteur dès
+                  que la fenêtre principale est affichée
+        started_ns: début du démarrage (timing.now_ns()) ; défaut : appel de run_gui
     """
-    try:
-        logger.debug("Splash: démarrage")
-        splash()
-        logger.debug("Splash: processus terminé")
+    from CadreSelecteur.timing import now_ns, record, span
 
-    except Exception as e:
-        logger.error(f"Splash: erreur - {e}", exc_info=True)
+    if started_ns is None:
+        started_ns = now_ns()
 
+    with span('import i18n'):
+        from CadreSelecteur.i18n import t
+    with span('splash'):
+        import tkinter as tk
+        from CadreSelecteur.splash import SplashScreen, MAX_WAIT_MS
 
-def run_app() -> None:
-    """
-    Lance l'application principale.
-    """
-    try:
-        logger.debug("App: démarrage CadreSelecteur")
-        app = CadreSelecteur()
-        logger.debug("App: CadreSelecteur créé")
+        root = tk.Tk()
+        root.withdraw()
+        splash = SplashScreen(root)
 
-        # Forcer la mise à jour de la fenêtre pour la rendre visible
-        app.root.update_idletasks()
-        logger.debug("App: fenêtre mise à jour, lancement mainloop")
+    splash.set_phase(t('splash.phase.interface'))
+    with span('import cadreselecteur'):
+        from CadreSelecteur.cadreselecteur import CadreSelecteur, check_mandatory_path
 
-        # Lancer l'app - BLOQUANT
-        app.root.mainloop()
-        logger.debug("App: fermeture propre")
+    splash.set_phase(t('splash.phase.paths'))
+    with span('check_mandatory_path'):
+        check_mandatory_path()
 
-    except Exception as e:
-        logger.error(f"App: erreur - {e}", exc_info=True)
+    app = CadreSelecteur(start_mainloop=False, master=root, progress=splash.set_phase)
+    preload_ns = now_ns()
+
+    shown = []
+
+    def show():
+        if shown:
+            return
+        shown.append(True)
+        record('preload_thumbnails', preload_ns)
+        splash.close()
+        root.deiconify()
+        logger.debug("App: sélecteur prêt")
+        # Rapport des phases (et trace Chrome si configurée)
+        record('startup', started_ns, report=True)
+        if on_ready:
+            on_ready(app)
+
+    def on_progress(done, total):
+        splash.set_phase(t('splash.phase.thumbnails', done=done, total=total))
+        if done >= total:
+            show()
+
+    if app.preload_thumbnails(app.initial_row_count(), on_progress=on_progress) == 0:
+        show()
+    else:
+        # Ne pas retenir la fenêtre si le décodage est lent (carte SD, gros PNG)
+        root.after(MAX_WAIT_MS, show)
+
+    root.mainloop()
+    logger.debug("App: fermeture propre")
 
 
 def main() -> int:
@@ -55,9 +101,17 @@ def main() -> int:
     Returns:
         Code de sortie (0 = succès, 1 = erreur)
     """
-    # Nécessaire pour Windows + PyInstaller
-    freeze_support()
+    if len(sys.argv) > 1:
+        # Ligne de commande : aucun module graphique n'est importé
+        from CadreSelecteur.cli import main as cli_main
+        return cli_main(sys.argv[1:])
+
+    from CadreSelecteur.timing import now_ns, set_trace_file, span
 
+    started_ns = now_ns()
+    with span('setup_logging'):
+        from CadreSelecteur.logging_config import setup_logging
+        setup_logging()
     # Setup logging basique si pas encore configuré
     if not logging.getLogger().hasHandlers():
         logging.basicConfig(
@@ -69,28 +123,14 @@ def main() -> int:
     logger.info("CadreSelecteur: démarrage")
     logger.info("=" * 60)
 
-    # Créer les processes
-    splash_process = Process(target=run_splash, name="splash")
-    app_process = Process(target=run_app, name="app")
+    with span('config'):
+        from CadreSelecteur.config_loader import load_config
+        load_config()
+        from CadreSelecteur.config_loader import TIMING_TRACE_FILE
+    set_trace_file(TIMING_TRACE_FILE)
 
     try:
-        # Démarrer le splash AVANT de vérifier les paths
-        # (pour que l'utilisateur voie quelque chose pendant la vérification)
-        logger.debug("Démarrage splash...")
-        splash_process.start()
-
-        # Vérifier les chemins obligatoires
-        logger.debug("Vérification des chemins...")
-        check_mandatory_path()
-
-        # Démarrer l'app
-        logger.debug("Démarrage app...")
-        app_process.start()
-
-        # Attendre que l'app se termine
-        # (le splash se ferme automatiquement après timeout)
-        app_process.join()
-        logger.info("App terminée proprement")
+        run_gui(started_ns=started_ns)
 
     except KeyboardInterrupt:
         logger.info("Interruption utilisateur (Ctrl+C)")
@@ -100,37 +140,6 @@ def main() -> int:
         return 1
 
     finally:
-        # Cleanup: s'assurer que tous les processes sont fermés
-        logger.debug("Cleanup: fermeture des processes...")
-
-        # Fermer le splash gracieusement
-        if splash_process.is_alive():
-            logger.debug("Fermeture splash (graceful)...")
-            splash_process.terminate()
-
-            # Attendre la fermeture (avec timeout)
-            splash_process.join(timeout=2)
-
-            # Force kill si toujours actif
-            if splash_process.is_alive():
-                logger.warning("Splash n'a pas répondu, force kill...")
-                splash_process.kill()
-                splash_process.join()
-
-        # Fermer l'app gracieusement
-        if app_process.is_alive():
-            logger.debug("Fermeture app (graceful)...")
-            app_process.terminate()
-
-            # Attendre la fermeture (avec timeout)
-            app_process.join(timeout=2)
-
-            # Force kill si toujours actif
-            if app_process.is_alive():
-                logger.warning("App n'a pas répondu, force kill...")
-                app_process.kill()
-                app_process.join()
-
         logger.info("=" * 60)
         logger.info("CadreSelecteur: fermé")
         logger.info("=" * 60)
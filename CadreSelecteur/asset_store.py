@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+Stockage par contenu des images importées dans les projets.
+
+Chaque import copiait le fichier choisi dans Templates/<projet>/ sous son
+nom d'origine : un même logo utilisé par 30 cadres était stocké 30 fois,
+et deux fichiers de même nom s'écrasaient sans prévenir.
+
+Avec l'option ASSET_STORE (désactivée par défaut : elle change
+l'organisation des fichiers sur disque), les images importées sont rangées
+une seule fois, tous projets confondus, sous leur empreinte SHA-256 :
+    Templates/.assets/<2 premiers caractères>/<empreinte>
+Chaque projet garde un manifeste (Templates/<projet>/.assets.json) qui
+associe les noms référencés par ses calques (imported_image_path) aux
+empreintes. Importer un fichier déjà connu ou enregistrer un projet ne
+copie plus de pixels : seul le manifeste change. ProjectAssets.copy_to()
+duplique un projet de la même façon (aucune action du sélecteur ne
+duplique encore de projet).
+
+Les noms commençant par un point sont ignorés par l'inventaire des projets
+et la surveillance des répertoires. Les projets sans manifeste (ou les
+noms absents du manifeste) sont résolus comme avant dans le répertoire du
+projet.
+
+Un blob n'appartient à aucun projet : `collect()` (marquage puis balayage)
+efface ceux qu'aucun manifeste ne référence plus, ni dans Templates ni
+dans la corbeille (projets encore restaurables). Le sélecteur l'exécute
+dans le thread de la corbeille au démarrage, à la fermeture de l'éditeur
+(les enregistrements retirent des images des manifestes) et après chaque
+effacement définitif.
+
+Le module ne dépend pas de Tkinter.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+from .trash import TRASH_DIR_NAME
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR_NAME = '.assets'
+MANIFEST_NAME = '.assets.json'
+MANIFEST_VERSION = 1
+
+# Taille des blocs lus pour calculer l'empreinte d'un fichier
+_HASH_CHUNK = 1024 * 1024
+
+# Âge minimal (s) d'un blob non référencé avant effacement par collect() : un
+# import écrit le blob avant d'enregistrer le manifeste qui le référence
+COLLECT_MIN_AGE = 60
+
+
+def file_digest(file_path: Union[str, Path]) -> str:
+    """Empreinte SHA-256 (hexadécimale) du contenu d'un fichier."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetStore:
+    """Blobs des images importées, partagés par tous les projets d'un répertoire Templates."""
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Args:
+            root: répertoire Templates (les blobs sont dans root/.assets)
+        """
+        self.root = Path(root)
+        self.assets_dir = self.root / ASSETS_DIR_NAME
+        # Suivi : blobs écrits et imports servis par un blob existant
+        self.writes = 0
+        self.dedup_hits = 0
+
+    def blob_path(self, digest: str) -> Path:
+        """Chemin du blob d'une empreinte."""
+        return self.assets_dir / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        """True si le blob est présent."""
+        return self.blob_path(digest).is_file()
+
+    def _write(self, digest: str, writer) -> None:
+        blob = self.blob_path(digest)
+        if blob.is_file():
+            self.dedup_hits += 1
+            try:
+                # blob de nouveau référencé : épargné par un collect() en cours
+                os.utime(blob)
+            except OSError as e:
+                logger.debug(f"AssetStore: utime failed for {blob}: {e}")
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # Écriture dans un fichier temporaire puis renommage atomique
+        tmp = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            writer(tmp)
+            os.replace(tmp, blob)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.writes += 1
+
+    def put_file(self, file_path: Union[str, Path]) -> str:
+        """
+        Range le contenu d'un fichier (sans copie s'il est déjà connu).
+
+        Returns:
+            Empreinte du contenu
+
+        Raises:
+            OSError si le fichier est illisible ou le blob impossible à écrire
+        """
+        digest = file_digest(file_path)
+        self._write(digest, lambda tmp: shutil.copyfile(file_path, tmp))
+        return digest
+
+    def put_bytes(self, data: bytes) -> str:
+        """Range un contenu en mémoire (ex : image réduite encodée) ; retourne son empreinte."""
+        digest = hashlib.sha256(data).hexdigest()
+        self._write(digest, lambda tmp: Path(tmp).write_bytes(data))
+        return digest
+
+    def manifest(self, project_dir: Union[str, Path]) -> 'ProjectAssets':
+        """Manifeste des images d'un projet de ce répertoire Templates."""
+        return ProjectAssets(project_dir, self)
+
+    def manifest_paths(self) -> Iterable[Path]:
+        """Manifestes des projets de Templates et des projets encore dans la corbeille."""
+        yield from self.root.glob(f'*/{MANIFEST_NAME}')
+        yield from (self.root / TRASH_DIR_NAME).glob(f'*/*/{MANIFEST_NAME}')
+
+    def referenced(self) -> Set[str]:
+        """
+        Empreintes référencées par au moins un manifeste (cf. manifest_paths()).
+
+        Raises:
+            OSError, ValueError si un manifeste est illisible
+        """
+        digests = set()
+        for path in self.manifest_paths():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                continue  # projet effacé ou restauré pendant le parcours
+            digests.update(str(digest) for digest in data.get('assets', {}).values())
+        return digests
+
+    def collect(self, min_age: float = COLLECT_MIN_AGE) -> int:
+        """
+        Efface les blobs qu'aucun manifeste ne référence (marquage puis balayage).
+
+        Un manifeste illisible interrompt la collecte : ses blobs ne sont pas
+        perdus. Les blobs modifiés depuis moins de `min_age` secondes sont
+        gardés (import en cours).
+
+        Args:
+            min_age: âge minimal (s) d'un blob pour être effacé
+
+        Returns:
+            Nombre de blobs effacés
+        """
+        if not self.assets_dir.is_dir():
+            return 0
+        try:
+            referenced = self.referenced()
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"AssetStore: collection skipped, unreadable manifest: {e}")
+            return 0
+
+        removed = 0
+        deadline = time.time() - min_age
+        for bucket in self.assets_dir.iterdir():
+            if not bucket.is_dir():
+                continue
+            for blob in bucket.iterdir():
+                # les fichiers temporaires d'une écriture interrompue suivent la même règle d'âge
+                if blob.name in referenced:
+                    continue
+                try:
+                    if blob.stat().st_mtime > deadline:
+                        continue
+                    blob.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"AssetStore: could not remove {blob}: {e}")
+            try:
+                bucket.rmdir()  # seulement s'il est vide
+            except OSError:
+                pass
+        if removed:
+            logger.info(f"AssetStore: {removed} unreferenced blob(s) removed from {self.assets_dir}")
+        return removed
+
+    def __repr__(self) -> str:
+        return f"AssetStore({str(self.assets_dir)!r}, writes={self.writes}, dedup_hits={self.dedup_hits})"
+
+
+class ProjectAssets:
+    """Manifeste d'un projet : nom référencé par un calque -> empreinte du blob."""
+
+    def __init__(self, project_dir: Union[str, Path], store: Optional[AssetStore] = None):
+        """
+        Args:
+            project_dir: répertoire du projet (Templates/<projet>)
+            store: store des blobs (défaut : celui du répertoire parent)
+        """
+        self.project_dir = Path(project_dir)
+        self.store = store if store is not None else AssetStore(self.project_dir.parent)
+        self.path = self.project_dir / MANIFEST_NAME
+        self.assets: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {str(name): str(digest) for name, digest in data.get('assets', {}).items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Manifeste d'images illisible {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Enregistre le manifeste (écriture atomique)."""
+        self.project_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'assets': self.assets}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def add(self, name: str, digest: str) -> str:
+        """
+        Référence un blob sous un nom du projet et enregistre le manifeste.
+
+        Un nom déjà utilisé par un autre contenu n'est pas écrasé : le nom
+        reçoit un suffixe (logo.png -> logo_2.png). Un contenu déjà référencé
+        garde son nom.
+
+        Returns:
+            Nom à stocker dans le calque (imported_image_path)
+        """
+        for existing, existing_digest in self.assets.items():
+            if existing_digest == digest:
+                return existing
+        path = Path(name)
+        candidate, index = path.name, 1
+        while candidate in self.assets or (self.project_dir / candidate).exists():
+            index += 1
+            candidate = f"{path.stem}_{index}{path.suffix}"
+        self.assets[candidate] = digest
+        self.save()
+        return candidate
+
+    def add_file(self, file_path: Union[str, Path], name: Optional[str] = None) -> str:
+        """Range un fichier dans le store et le référence dans le projet ; retourne le nom référencé."""
+        return self.add(name or Path(file_path).name, self.store.put_file(file_path))
+
+    def add_bytes(self, data: bytes, name: str) -> str:
+        """Range un contenu en mémoire et le référence dans le projet ; retourne le nom référencé."""
+        return self.add(name, self.store.put_bytes(data))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.assets
+
+    def resolve(self, name: Union[str, Path]) -> Path:
+        """
+        Chemin du fichier référencé par un calque : blob du store si le nom est
+        au manifeste, sinon fichier du répertoire du projet (anciens projets).
+        """
+        digest = self.assets.get(str(name))
+        if digest is not None:
+            return self.store.blob_path(digest)
+        return self.project_dir / name
+
+    def retain(self, names: Iterable[str]) -> None:
+        """
+        Ne garde au manifeste que les noms encore utilisés. Les blobs restent
+        partagés : ceux qui ne sont plus référencés sont effacés par AssetStore.collect().
+        """
+        names = set(names)
+        kept = {name: digest for name, digest in self.assets.items() if name in names}
+        if kept != self.assets:
+            self.assets = kept
+            self.save()
+
+    def copy_to(self, project_dir: Union[str, Path]) -> 'ProjectAssets':
+        """Duplique les références d'images vers un autre projet (aucune copie de fichier)."""
+        other = ProjectAssets(project_dir, self.store)
+        other.assets.update(self.assets)
+        other.save()
+        return other
+
+
+__all__ = ['AssetStore', 'ProjectAssets', 'file_digest', 'ASSETS_DIR_NAME', 'MANIFEST_NAME', 'COLLECT_MIN_AGE']
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Exécution de tâches en arrière-plan, par ordre de priorité.
+
+Les travaux lents (décodage des vignettes et des aperçus : Pillow libère le
+GIL pendant le décodage et le redimensionnement ; effacement de la
+corbeille) sont confiés à un pool de threads. Les résultats sont ramenés
+dans le thread Tk par scrutation via `after()` : aucun widget ni PhotoImage
+n'est jamais manipulé depuis un thread de travail.
+
+Les tâches sont ordonnées par priorité (0 = la plus urgente) : le sélecteur
+donne la priorité aux vignettes des lignes visibles dans le canvas.
+Soumettre à nouveau une clé remplace la tâche en attente (et sa priorité).
+"""
+
+import heapq
+import logging
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Intervalle de scrutation des résultats (ms)
+DEFAULT_POLL_MS = 25
+
+
+def default_worker_count() -> int:
+    """Nombre de threads de travail par défaut (borné pour rester sobre sur un Pi)."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class _Job:
+    """Tâche en attente."""
+
+    __slots__ = ('key', 'args', 'callback', 'seq', 'generation')
+
+    def __init__(self, key, args, callback, seq, generation):
+        self.key = key
+        self.args = args
+        self.callback = callback
+        self.seq = seq
+        self.generation = generation
+
+
+class BackgroundWorker:
+    """Pool de threads avec file de priorité et retour vers Tk via after()."""
+
+    def __init__(self,
+                 widget,
+                 load_func: Callable[..., Any],
+                 max_workers: Optional[int] = None,
+                 poll_ms: int = DEFAULT_POLL_MS):
+        """
+        Args:
+            widget: widget Tk utilisé pour planifier la scrutation (after)
+            load_func: fonction exécutée dans les threads de travail (sans Tk !)
+            max_workers: nombre de threads (défaut : default_worker_count())
+            poll_ms: intervalle de scrutation des résultats (ms)
+        """
+        self.widget = widget
+        self.load_func = load_func
+        self.poll_ms = poll_ms
+        self.max_workers = max_workers or default_worker_count()
+
+        self._cond = threading.Condition()
+        self._heap = []
+        self._jobs: Dict[Hashable, _Job] = {}
+        self._seq = 0
+        self._generation = 0
+        self._inflight = 0
+        self._stopped = False
+        self._results: "queue.SimpleQueue[Tuple[_Job, Any, Optional[BaseException]]]" = queue.SimpleQueue()
+        self._poll_id = None
+        self._workers = []
+
+    def _start_workers(self) -> None:
+        # Démarrage paresseux : aucun thread tant qu'aucune tâche n'est soumise
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._worker_loop,
+                                      name=f"background-worker-{len(self._workers)}",
+                                      daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self,
+               key: Hashable,
+               args: tuple,
+               callback: Callable[[Any, Optional[BaseException]], None],
+               priority: int = 0) -> None:
+        """
+        Ajoute (ou remplace) une tâche.
+
+        Args:
+            key: identifiant de la tâche (ex : nom du projet)
+            args: arguments passés à load_func dans le thread de travail
+            callback: appelé dans le thread Tk avec (résultat, exception ou None)
+            priority: priorité (plus petit = plus urgent)
+        """
+        with self._cond:
+            if self._stopped:
+                return
+            self._seq += 1
+            job = _Job(key, args, callback, self._seq, self._generation)
+            self._jobs[key] = job
+            heapq.heappush(self._heap, (priority, job.seq, key))
+            self._start_workers()
+            self._cond.notify()
+        self._ensure_polling()
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Annule une tâche encore en attente (sans effet si elle est déjà en cours).
+
+        Returns:
+            True si la tâche était en attente, False sinon
+        """
+        with self._cond:
+            # l'entrée du tas devient obsolète et sera ignorée par _next_job
+            return self._jobs.pop(key, None) is not None
+
+    def cancel_all(self) -> int:
+        """
+        Annule les tâches en attente et ignore les résultats des tâches en cours.
+
+        Returns:
+            Nombre de tâches en attente annulées
+        """
+        with self._cond:
+            count = len(self._jobs)
+            self._jobs.clear()
+            self._heap.clear()
+            self._generation += 1
+        return count
+
+    def pending_count(self) -> int:
+        """Nombre de tâches en attente ou en cours."""
+        with self._cond:
+            return len(self._jobs) + self._inflight
+
+    def shutdown(self) -> None:
+        """Arrête les threads de travail (les tâches en attente sont abandonnées)."""
+        with self._cond:
+            self._stopped = True
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+        if self._poll_id is not None:
+            try:
+                self.widget.after_cancel(self._poll_id)
+            except Exception as e:
+                logger.debug(f"BackgroundWorker: after_cancel failed: {e}")
+            self._poll_id = None
+
+    def _next_job(self) -> Optional[_Job]:
+        # Appelé avec self._cond verrouillé
+        while self._heap:
+            _, seq, key = heapq.heappop(self._heap)
+            job = self._jobs.get(key)
+            if job is None or job.seq != seq:
+                continue  # entrée obsolète (annulée ou remplacée)
+            del self._jobs[key]
+            self._inflight += 1
+            return job
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._stopped:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+            result, error = None, None
+            try:
+                result = self.load_func(*job.args)
+            except Exception as e:  # transmis au callback dans le thread Tk
+                error = e
+            self._results.put((job, result, error))
+            with self._cond:
+                self._inflight -= 1
+
+    def _ensure_polling(self) -> None:
+        if self._poll_id is None and not self._stopped:
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        """Dépile les résultats disponibles et appelle les callbacks (thread Tk)."""
+        self._poll_id = None
+        while True:
+            try:
+                job, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if job.generation != self._generation:
+                continue  # résultat d'un rafraîchissement précédent
+            try:
+                job.callback(result, error)
+            except Exception as e:
+                logger.exception(f"BackgroundWorker: callback failed for {job.key}", exc_info=e)
+        if self.pending_count() or not self._results.empty():
+            self._ensure_polling()
+
+
+__all__ = ['BackgroundWorker', 'default_worker_count']
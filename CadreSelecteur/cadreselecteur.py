@@ -1,37 +1,56 @@
 # -*- coding: utf-8 -*-
-""" sélecteur de cadre pour pibooth """
+""" sélecteur de cadre pour pibooth
 
-from os import path, listdir
+    L'éditeur (ImageEditorApp, calques, sélecteur de police), PIL.ImageTk et
+    l'installation des cadres ne sont importés qu'à leur première utilisation ;
+    la configuration du logging (dossier, fichier) est faite à la création de
+    la fenêtre et non à l'import du module.
+"""
+
+from os import path, stat
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import Tk, Scrollbar, Canvas, Frame, Toplevel
 from tkinter import messagebox, Label, Button, Radiobutton, StringVar
-from PIL import Image, ImageTk
+from PIL import Image
 from PIL import UnidentifiedImageError
-from PIL.ImageTk import PhotoImage
-from shutil import copy, rmtree
 from platform import system
 from pathlib import Path
 import sys
 import logging
 
 from . import __version__
-# Assurer la configuration centrale du logging (ajoute un FileHandler vers resources/image_editor.log)
-from .logging_config import LOG_PATH  # noqa: F401
+from .logging_config import setup_logging
 from .ttk_theme import apply_clam_theme
-from .CadreEditeur.imageeditorapp import ImageEditorApp
 from .config_loader import (
     WINDOWS_SIZE,
     THUMBNAIL_H,
     THUMBNAIL_L,
-    TEMPLATE_NAME,
     TEMPLATE_NAME_STD,
     CADRE_NAME_1,
     CADRE_NAME_4,
     RESOURCES_DIR,
+    THUMBNAIL_CACHE_MAX_MB,
+    PREVIEW_CACHE_MAX_MB,
+    TRASH_UNDO_SECONDS,
+    THUMBNAIL_ATLAS,
+    IMAGE_MEMORY_BUDGET_MB,
+    load_config,
 )
+from .asset_store import AssetStore
+from .background_worker import BackgroundWorker
+from .change_watcher import ChangeWatcher, diff_snapshots
 from .exceptions import FileOperationError
 from .error_handler import handle_exception
 from .image_ref_manager import ImageRefManager
+from .path_resolver import resolve_cache_dir, resolve_templates_dir, resolve_frames_dir
+from .preview_cache import PreviewCache, load_preview, PREVIEW_SIZE
+from .project_repository import ProjectRepository
+from .thumbnail_atlas import ThumbnailAtlas
+from .thumbnail_cache import ThumbnailCache
+from .timing import now_ns, record, span, timed
+from .trash import Trash
+from .virtual_list import VirtualList
 
 # Import du traducteur (API publique du package i18n)
 from .i18n import t, set_language, get_language
@@ -63,9 +82,9 @@ def resource_path(relative_path: str) -> str:
 
 BASE_PATH = get_base_path()
 # repertoire avec tous les cadres / templates disponibles
-template_path = Path(BASE_PATH) / "Templates"
+template_path = resolve_templates_dir()
 # repertoire avec le cadre / template sélectionné
-destination_path = Path(BASE_PATH) / "Cadres"
+destination_path = resolve_frames_dir()
 # repertoire avec les resources scripts
 resources_path = Path(resource_path("resources"))
 
@@ -99,34 +118,203 @@ def check_mandatory_path():
         quit()
 
 
+# Nombre de projets dont les vignettes décodées restent en mémoire
+THUMBNAIL_MEMORY_ITEMS = 64
+
+# Espacement vertical entre les lignes de la liste des cadres (pixels)
+ROW_SPACING = 10
+
+# Couleur de la vignette d'attente
+PLACEHOLDER_COLOR = '#e1e1e1'
+
+
 # configure un logger par défaut si aucune configuration n'est présente
 if not logging.getLogger().hasHandlers():
     logging.basicConfig(level=logging.INFO)
 
 
+class ProjectRow:
+    """
+    Ligne recyclable de la liste des cadres : bouton radio, vignettes _1 et _4,
+    nom du projet et boutons éditer / supprimer. Une même ligne affiche
+    successivement plusieurs projets au gré du défilement.
+
+    Avec l'atlas de vignettes, chaque vignette est un petit canvas qui montre
+    une case d'une page de l'atlas (item image décalé) ; sinon un Label
+    affiche une PhotoImage propre à la ligne.
+    """
+
+    def __init__(self, selector, parent):
+        """
+        :param selector: instance de CadreSelecteur (variable radio, icônes, actions)
+        :param parent: widget parent (canvasSrc)
+        """
+        self.selector = selector
+        self.project = None
+
+        self.frame = Frame(parent)
+
+        self.radio_button = Radiobutton(self.frame, variable=selector.selected_image)
+        self.radio_button.pack(side="left", padx=5)
+
+        # Créer les labels avec les thumbnails (Tkinter gère le type automatiquement)
+        self.thumbnail_labels = []
+        # Atlas : item image de chaque canvas de vignette, et taille affichée
+        self.atlas_items = [None, None]
+        self.atlas_sizes = [None, None]
+        for slot in range(2):
+            if selector.thumbnail_atlas is not None:
+                label = Canvas(self.frame,
+                               width=THUMBNAIL_H,
+                               height=THUMBNAIL_L,
+                               background=PLACEHOLDER_COLOR,
+                               highlightthickness=0,
+                               borderwidth=1,
+                               relief="solid")
+                self.atlas_items[slot] = label.create_image(0, 0, anchor='nw', state='hidden')
+            else:
+                label = Label(self.frame,
+                              image=selector.placeholder_thumbnail,
+                              borderwidth=1,
+                              relief="solid")
+                # IMPORTANT: Garder les références DANS les labels (pattern Tkinter)
+                label.image = selector.placeholder_thumbnail
+            label.pack(side='left', padx=5)
+            self.thumbnail_labels.append(label)
+
+        # Bouton éditer (affiché uniquement pour les projets avec fichier JSON)
+        if selector.edit_icon:
+            self.button_edit = Button(self.frame, image=selector.edit_icon)
+        else:
+            self.button_edit = Button(self.frame, text=t('image.button.edit'))
+        self.button_edit.pack(side='right')
+
+        # Créer le bouton avec l'image poubelle
+        if selector.trash_icon:
+            self.button_delete = Button(self.frame, image=selector.trash_icon)
+        else:
+            self.button_delete = Button(self.frame, text=t('image.button.delete'))
+        self.button_delete.pack(side='right', padx=20, pady=20)
+
+        self.text_label = Label(self.frame)
+        self.text_label.pack(side='left', padx=5)
+
+    def bind_project(self, project):
+        """
+        Affiche un projet dans la ligne (textes, actions et clics).
+
+        :param project: Project de l'inventaire (cf. project_repository)
+        """
+        name = project.name
+        selector = self.selector
+        self.project = name
+        self.radio_button.config(value=name)
+        self.text_label.config(text=name)
+
+        # Bind click event to show full size image
+        self.thumbnail_labels[0].bind("<Button-1>", lambda e1, f=project.frame_1: selector.show_full_image(f))
+        self.thumbnail_labels[1].bind("<Button-1>", lambda e4, f=project.frame_4: selector.show_full_image(f))
+
+        self.button_delete.config(command=lambda d=name: selector.del_border(d))
+        if project.json:
+            self.button_edit.config(command=lambda d=name: selector.edit_border(d))
+            self.button_edit.pack(side='right', before=self.button_delete)
+        else:
+            self.button_edit.pack_forget()
+
+    def show_placeholders(self, placeholder):
+        """Affiche la vignette d'attente dans les deux emplacements."""
+        for slot in range(len(self.thumbnail_labels)):
+            self.show_placeholder(slot, placeholder)
+
+    def show_placeholder(self, slot, placeholder):
+        """Affiche la vignette d'attente dans l'emplacement 0 (_1) ou 1 (_4)."""
+        label = self.thumbnail_labels[slot]
+        if self.atlas_items[slot] is not None:
+            # fond gris du canvas
+            label.itemconfigure(self.atlas_items[slot], state='hidden')
+            return
+        label.config(image=placeholder)
+        label.image = placeholder
+
+    def show_thumbnail(self, slot, photo):
+        """
+        Affiche une PhotoImage dans l'emplacement 0 (_1) ou 1 (_4).
+        Le label garde sa référence ; quand image_ref_manager l'évince (ligne
+        hors de la zone visible), la ligne repasse à la vignette d'attente et la
+        PhotoImage est libérée, puis recréée quand la ligne redevient visible.
+        """
+        label = self.thumbnail_labels[slot]
+        label.config(image=photo)
+        label.image = photo
+
+    def show_region(self, slot, page_photo, region):
+        """
+        Affiche une case de l'atlas dans l'emplacement 0 (_1) ou 1 (_4) :
+        deux appels Tk, trois si la taille de la vignette change.
+        """
+        canvas = self.thumbnail_labels[slot]
+        if self.atlas_sizes[slot] != (region.width, region.height):
+            canvas.config(width=region.width, height=region.height)
+            self.atlas_sizes[slot] = (region.width, region.height)
+        canvas.itemconfigure(self.atlas_items[slot], image=page_photo, state='normal')
+        canvas.coords(self.atlas_items[slot], -region.x, -region.y)
+
+
 class CadreSelecteur:
     """
     Sélecteur de cadres : affiche des vignettes d'images et permet
     de sélectionner un template via des boutons radio dans l'interface.
     """
 
-    def __init__(self, start_mainloop: bool = True):
+    # Sans pool de décodage (instance partielle, tests), les vignettes sont décodées en synchrone
+    thumbnail_loader = None
+    placeholder_thumbnail = None
+    virtual_list = None
+    repository = None
+    change_watcher = None
+    _dest_signature = None
+    preview_cache = None
+    preview_loader = None
+    thumbnail_atlas = None
+    trash = None
+    asset_store = None
+    trash_worker = None
+    undo_button = None
+    _pending_trash = None
+    # Préchargement en cours : (projets attendus, total, on_progress)
+    _preload = None
+
+    def __init__(self, start_mainloop: bool = True, master=None, progress=None):
         """
         Initializes the TemplateSelector with a window
         and directory to display images.
+
+        :param start_mainloop: lance la boucle Tk à la fin de la construction
+        :param master: fenêtre Tk à utiliser (par défaut une nouvelle fenêtre Tk)
+        :param progress: appelé avec le texte (traduit) de chaque étape du démarrage
         """
 
+        init_ns = now_ns()
+        # Configuration centrale du logging (ajoute un FileHandler vers resources/image_editor.log)
+        setup_logging()
+        # Lecture de config.json (déjà faite si une constante a été importée)
+        load_config()
+
         self.apply_button = None
         self.quit_button = None
         self.add_new_border = None
-        self.master = Tk()
+        with span('tk_window'):
+            self.master = master if master is not None else Tk()
 
-        # Apply ttk clam theme
-        apply_clam_theme(self.master)
+            # Apply ttk clam theme
+            apply_clam_theme(self.master)
 
         self.master.title(t('selector.title', version=__version__))
         self.source_directory = template_path
         self.destination_directory = destination_path
+        # Inventaire des projets : un seul parcours du répertoire par rafraîchissement
+        self.repository = ProjectRepository(self.source_directory)
         # Set the window size
         self.master.geometry(WINDOWS_SIZE)
 
@@ -161,12 +349,15 @@ class CadreSelecteur:
         self.master.resizable(False, False)  # Prevent window resizing
 
         # mise a jour de l'icône de fenêtre
+        icons_ns = now_ns()
         icon_path = path.join(RESOURCES_DIR, "cadreSelecteur.png")
         icon_image = Image.open(icon_path)
+        from PIL import ImageTk
         icon_photo = ImageTk.PhotoImage(icon_image)
         self.master.iconphoto(True, icon_photo)
         # garder une référence !
         self.master._icon_ref = icon_photo
+        record('window_icon', icons_ns)
 
         # Initialize scrollbar for canvasSrc
         self.scrollbarSrc = Scrollbar(self.frame_main, orient="vertical")
@@ -174,18 +365,12 @@ class CadreSelecteur:
         # Initialize canvas for drawing source
         self.canvasSrc = Canvas(self.frame_main,
                                 width=450,  # Specify width for source canvas
-                                yscrollcommand=self.scrollbarSrc.set)
+                                yscrollcommand=self._on_src_yscroll)
         self.canvasSrc.pack(side='left', fill='both', expand=True)
         self.scrollbarSrc.pack(side='left', fill='y')
 
         self.scrollbarSrc.config(command=self.canvasSrc.yview)
 
-        # Create a frame to contain list of thumbnails
-        self.list_frameSrc = Frame(self.canvasSrc)
-        self.canvasSrc.create_window((0, 0),
-                                     window=self.list_frameSrc,
-                                     anchor="nw")
-
         # Initialize canvas for drawing dest
         self.canvasDest = Canvas(self.frame_main)
         self.canvasDest.pack(side='right', fill='both', expand=True)
@@ -195,9 +380,42 @@ class CadreSelecteur:
         self.selected_image.set('')
 
         # Gestionnaire centralisé de références PhotoImage
-        self.image_ref_manager = ImageRefManager()
+        # Budget mémoire : les vignettes ('thumbnails') les moins récemment affichées
+        # sont libérées au-delà, puis recréées au défilement ; celles des lignes
+        # visibles ne sont jamais évincées
+        self.image_ref_manager = ImageRefManager(budget_bytes=IMAGE_MEMORY_BUDGET_MB * 1024 * 1024,
+                                                 evictable=('thumbnails',),
+                                                 pinned=self._visible_thumbnail_keys)
+
+        # Cache disque des vignettes (évite de redécoder les PNG à chaque rafraîchissement)
+        self.thumbnail_cache = ThumbnailCache(resolve_cache_dir() / 'thumbnails',
+                                              (THUMBNAIL_H, THUMBNAIL_L),
+                                              max_bytes=THUMBNAIL_CACHE_MAX_MB * 1024 * 1024)
+
+        # Décodage des vignettes en arrière-plan : les lignes s'affichent tout de suite
+        # avec une vignette d'attente, puis les images arrivent via after()
+        self.thumbnail_loader = BackgroundWorker(self.master, self._load_project_thumbnails)
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
+        # Vignettes PIL déjà décodées (LRU borné, indexé par nom de projet)
+        self._thumbnail_images = OrderedDict()
+        # Atlas : les vignettes en mémoire sont rangées dans quelques grandes PhotoImage
+        # (une case par vignette _1 / _4 de chaque projet gardé en mémoire)
+        if THUMBNAIL_ATLAS:
+            self.thumbnail_atlas = ThumbnailAtlas((THUMBNAIL_H, THUMBNAIL_L),
+                                                  capacity=2 * THUMBNAIL_MEMORY_ITEMS,
+                                                  photo_factory=self._create_atlas_page,
+                                                  scheduler=self.master.after_idle)
+        # Projet -> ligne qui l'affiche actuellement
+        self._rows_by_project = {}
+
+        # Prévisualisations 720x480 gardées en mémoire (LRU borné en octets), préchargées
+        # pour le cadre sélectionné et ses voisins par un thread dédié
+        self.preview_cache = PreviewCache(PREVIEW_CACHE_MAX_MB * 1024 * 1024)
+        self.preview_loader = BackgroundWorker(self.master, self.preview_cache.get_or_create, max_workers=1)
+        self.selected_image.trace_add('write', self._on_selection_changed)
 
         # Pré-charger les icônes trash et edit pour réutilisation (évite d'ouvrir le fichier à chaque vignette)
+        icons_ns = now_ns()
         try:
             icon_path_trash = resources_path / "trash.png"
             with Image.open(icon_path_trash) as _img:
@@ -214,14 +432,50 @@ class CadreSelecteur:
             logger.debug(f"Icons not available: {e}")
             self.trash_icon = None
             self.edit_icon = None
+        record('row_icons', icons_ns)
+
+        # Vignette d'attente affichée pendant le décodage en arrière-plan
+        self.placeholder_thumbnail = self._photoimage_from_pil(
+            Image.new('RGBA', (THUMBNAIL_H, THUMBNAIL_L), PLACEHOLDER_COLOR))
+        if self.placeholder_thumbnail:
+            self.image_ref_manager.add_ref(self.placeholder_thumbnail, 'icons')
+
+        # Liste virtualisée : seules les lignes visibles (+ overscan) existent en widgets Tk
+        self.projects = []
+        self.virtual_list = VirtualList(self.canvasSrc,
+                                        row_factory=self._create_project_row,
+                                        row_binder=self._bind_project_row,
+                                        row_spacing=ROW_SPACING)
 
         # List and generate image thumbnails
+        if progress:
+            progress(t('splash.phase.templates'))
         self.list_files_and_generate_thumbnails()
 
+        # Corbeille : suppression instantanée (renommage), effacement réel par un thread dédié ;
+        # les suppressions non effacées lors de la session précédente sont reprises
+        self.trash = Trash(self.source_directory)
+        self.asset_store = AssetStore(self.source_directory)
+        self.trash_worker = BackgroundWorker(self.master, self._purge_trash_and_assets, max_workers=1)
+        self._pending_trash = OrderedDict()
+        for entry in self.trash.entries():
+            self._submit_trash_purge(entry)
+        # images importées abandonnées lors d'enregistrements précédents (cf. ProjectAssets.retain)
+        self._submit_asset_collect()
+
+        # Surveillance des répertoires : seules les lignes des projets modifiés sont mises à jour
+        with span('change_watcher'):
+            self.change_watcher = ChangeWatcher(self.master, self._on_filesystem_changes)
+            self.change_watcher.watch(self.source_directory)
+            self.change_watcher.watch(self.destination_directory)
+            self.change_watcher.start()
+        logger.debug(f"Change detection backend: {self.change_watcher.backend}")
+
         # Create action buttons
         self.create_action_buttons()
 
         # Sélecteur de langue déroulant (dans une barre tout en haut, aligné à droite)
+        lang_ns = now_ns()
         try:
             self.lang_btn = tk.Menubutton(self.top_bar, text=get_language(), relief='raised')
             self.lang_menu = tk.Menu(self.lang_btn, tearoff=0)
@@ -241,6 +495,7 @@ class CadreSelecteur:
             logger.exception("Unexpected error while creating language selector", exc_info=e)
             self.lang_btn = None
             self.lang_menu = None
+        record('language_menu', lang_ns)
 
         self.system = system()
         if self.system == 'Windows' or self.system == 'Darwin':
@@ -250,9 +505,25 @@ class CadreSelecteur:
             self.canvasSrc.bind("<Button-4>", self._on_mousewheel)
             self.canvasSrc.bind("<Button-5>", self._on_mousewheel)
 
+        # Lancé seul (sans run_gui), le sélecteur écrit lui-même son rapport de temps
+        record('CadreSelecteur.__init__', init_ns, report=start_mainloop)
+
         if start_mainloop:
             self.master.mainloop()
 
+    def close(self):
+        """
+        Ferme le sélecteur : arrête la surveillance des répertoires et les threads
+        de travail (vignettes, aperçus, corbeille), puis détruit la fenêtre.
+        Les entrées de la corbeille non effacées le seront au prochain lancement.
+        """
+        if self.change_watcher is not None:
+            self.change_watcher.stop()
+        for worker in (self.thumbnail_loader, self.preview_loader, self.trash_worker):
+            if worker is not None:
+                worker.shutdown()
+        self.master.destroy()
+
     def _on_mousewheel(self, event):
         if self.system == 'Windows':
             self.canvasSrc.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -264,38 +535,132 @@ class CadreSelecteur:
             elif event.num == 5:
                 self.canvasSrc.yview_scroll(1, "units")
 
+    def _on_src_yscroll(self, first, last):
+        """
+        Suit le défilement du canvas source : met à jour la barre de défilement
+        et matérialise / recycle les lignes de la liste virtualisée.
+        """
+        self.scrollbarSrc.set(first, last)
+        if self.virtual_list is not None:
+            self.virtual_list.refresh()
+            self._restore_visible_thumbnails()
+
+    @timed('list_files_and_generate_thumbnails')
     def list_files_and_generate_thumbnails(self):
         """
         Parcourt le répertoire source et génère les vignettes pour les répertoires de projets.
         Met à jour la zone de défilement une fois les éléments ajoutés.
         """
 
-        # Efface tous les widgets existants dans la frame
-        for child in self.list_frameSrc.winfo_children():
-            child.destroy()
+        # Abandonne les décodages du rafraîchissement précédent
+        if self.thumbnail_loader:
+            self.thumbnail_loader.cancel_all()
+        self._thumbnail_images.clear()
+        if self.thumbnail_atlas is not None:
+            self.thumbnail_atlas.clear()
 
-        # Effacer les referencias d'images obsolètes
-        self.image_ref_manager.clear_category('thumbnails')
-        self.image_ref_manager.clear_category('dest_canvas')
-
-        self.create_dest_thumbnail()
-        # protéger si le repertoire source est manquant
-        if not path.exists(self.source_directory):
+        self._dest_signature = None
+        self.refresh_destination()
+        # Inventaire des projets en un seul parcours (protégé si le repertoire source est manquant)
+        try:
+            with span('scan_templates'):
+                self.repository.scan()
+        except FileNotFoundError:
             messagebox.showerror(t('selector.msg.error.dir_missing_title'),
                                  t('selector.msg.error.dir_missing_message',
                                    path=self.source_directory))
             logger.error(f"Source directory not found: {self.source_directory}")
             return
 
-        # Parcourir les répertoires
-        for project_dir in sorted(listdir(self.source_directory)):
-            project_path = path.join(self.source_directory, project_dir)
-            if path.isdir(project_path):
-                self.create_src_thumbnail(project_dir)
+        projects = []
+        for project_dir in self.repository.names():
+            project = self.create_src_thumbnail(project_dir)
+            if project:
+                projects.append(project)
+
+        self.projects = projects
+        # Seules les lignes visibles sont créées / réaffichées
+        self.virtual_list.set_items(projects)
+
+    def refresh_projects(self, names=None):
+        """
+        Met à jour l'inventaire puis uniquement les lignes des projets ajoutés,
+        supprimés ou modifiés : les autres lignes gardent leurs vignettes.
+
+        :param names: noms des projets à réexaminer (None = tout le répertoire)
+        :return: ProjectDiff des changements appliqués
+        """
+        before = {p.name: p.signature for p in self.repository.projects()}
+        if names is None:
+            try:
+                self.repository.scan()
+            except FileNotFoundError:
+                logger.error(f"Source directory not found: {self.source_directory}")
+        else:
+            for name in names:
+                self.repository.scan_project(name)
+        diff = diff_snapshots(before, {p.name: p.signature for p in self.repository.projects()})
+        if not diff:
+            return diff
+        logger.debug(f"Projects changed: {diff}")
+
+        # Les vignettes des projets modifiés ou supprimés sont à redécoder
+        for name in diff.modified | diff.removed:
+            self._forget_thumbnails(name)
+            self._cancel_thumbnails(name)
+
+        projects = []
+        for project_dir in self.repository.names():
+            project = self.create_src_thumbnail(project_dir)
+            if project:
+                projects.append(project)
+
+        same_order = [p.name for p in projects] == [p.name for p in self.projects]
+        self.projects = projects
+        if same_order:
+            for index, project in enumerate(projects):
+                if project.name in diff.modified:
+                    self.virtual_list.update_item(index, project)
+        else:
+            # Projets ajoutés / supprimés : les lignes visibles sont re-liées,
+            # les projets inchangés retrouvent leurs vignettes en mémoire
+            self.virtual_list.set_items(projects)
+        return diff
+
+    def refresh_destination(self):
+        """
+        Réaffiche le cadre installé s'il a changé depuis le dernier affichage.
+
+        :return: True si la vignette de destination a été régénérée
+        """
+        signature = []
+        for name in (CADRE_NAME_1, CADRE_NAME_4):
+            try:
+                st = stat(path.join(self.destination_directory, name))
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        signature = tuple(signature)
+        if signature == self._dest_signature:
+            return False
+        self._dest_signature = signature
+
+        # Effacer les références d'images obsolètes
+        self.image_ref_manager.clear_category('dest_canvas')
+        self.create_dest_thumbnail()
+        return True
+
+    def _on_filesystem_changes(self, changes):
+        """
+        Reçoit les changements détectés par ChangeWatcher (thread Tk).
 
-        # Update the scroll region to encompass all content
-        self.list_frameSrc.update_idletasks()
-        self.canvasSrc.config(scrollregion=self.canvasSrc.bbox("all"))
+        :param changes: {répertoire: noms des entrées modifiées, ou None}
+        """
+        for root, names in changes.items():
+            if Path(root) == Path(self.source_directory):
+                self.refresh_projects(names)
+            elif Path(root) == Path(self.destination_directory):
+                self.refresh_destination()
 
     def create_dest_thumbnail(self):
         """
@@ -317,13 +682,8 @@ class CadreSelecteur:
                 logger.debug(f"Destination images absentes: {file_path_1}, {file_path_4}")
                 return
 
-            with Image.open(file_path_1) as img:
-                img.thumbnail((THUMBNAIL_H, THUMBNAIL_L))  # Thumbnail size
-                thumbnail_img_1 = self._photoimage_from_pil(img)
-
-            with Image.open(file_path_4) as img:
-                img.thumbnail((THUMBNAIL_H, THUMBNAIL_L))  # Thumbnail size
-                thumbnail_img_4 = self._photoimage_from_pil(img)
+            thumbnail_img_1 = self._photoimage_from_pil(self.thumbnail_cache.get_or_create(file_path_1))
+            thumbnail_img_4 = self._photoimage_from_pil(self.thumbnail_cache.get_or_create(file_path_4))
 
             if thumbnail_img_1 and thumbnail_img_4:
                 # Display the image on the canvas
@@ -362,144 +722,297 @@ class CadreSelecteur:
 
     def create_src_thumbnail(self, project_dir_name):
         """
-        Génère la vignette pour le répertoire du projet et crée
-        l'élément UI associé (radio, vignettes, étiquette et bouton supprimer).
+        Retourne le projet à afficher dans la liste des cadres (fichiers _1 et
+        _4, et fichier JSON éventuel), tel que recensé par l'inventaire. Les
+        widgets de la ligne ne sont créés que lorsqu'elle devient visible
+        (cf. _bind_project_row).
 
         :param project_dir_name: nom du répertoire du projet
+        :return: Project de l'inventaire, ou None s'il est absent ou incomplet
         """
-        try:
-            project_path = path.join(self.source_directory, project_dir_name)
+        project = self.repository.get(project_dir_name)
+        if project is None:
+            logger.debug(f"Could not read project directory {project_dir_name}")
+            return None
 
-            # Chercher les fichiers _1.png et _4.png dans le répertoire
-            file_path_1 = None
-            file_path_4 = None
+        # Ignorer le répertoire s'il n'a pas les fichiers requis
+        if not project.is_complete:
+            logger.debug(f"Skipping project {project_dir_name}: missing _1.png or _4.png")
+            return None
 
-            for filename in listdir(project_path):
-                if filename.endswith('_1.png'):
-                    file_path_1 = path.join(project_path, filename)
-                elif filename.endswith('_4.png'):
-                    file_path_4 = path.join(project_path, filename)
+        return project
 
-            # Ignorer le répertoire s'il n'a pas les fichiers requis
-            if not file_path_1 or not file_path_4:
-                logger.debug(f"Skipping project {project_dir_name}: missing _1.png or _4.png")
+    def _create_project_row(self, parent):
+        """Crée une ligne recyclable de la liste des cadres (appelé par VirtualList)."""
+        return ProjectRow(self, parent)
+
+    def _bind_project_row(self, row, project, index):
+        """
+        Affiche un projet dans une ligne recyclée et demande ses vignettes
+        (priorité aux lignes visibles, puis à celles de la marge d'overscan).
+        """
+        try:
+            previous = row.project
+            row.bind_project(project)
+            if previous and previous != project.name:
+                if self._rows_by_project.get(previous) is row:
+                    del self._rows_by_project[previous]
+                # la ligne change de projet : le décodage en attente est devenu inutile
+                self._cancel_thumbnails(previous)
+            self._rows_by_project[project.name] = row
+
+            thumbnails = self._thumbnail_images.get(project.name)
+            if thumbnails is not None:
+                self._thumbnail_images.move_to_end(project.name)
+                self._set_row_thumbnails(row, thumbnails)
                 return
 
-            with Image.open(file_path_1) as img:
-                img.thumbnail((THUMBNAIL_H, THUMBNAIL_L))  # Thumbnail size
-                thumbnail_img_1 = self._photoimage_from_pil(img)
+            row.show_placeholders(self.placeholder_thumbnail)
+            self._request_thumbnails(project.name, project.frame_1, project.frame_4,
+                                     priority=self._row_priority(index))
+        except (tk.TclError, RuntimeError) as e:
+            handle_exception(e, operation=f"create_thumbnail_{project.name}",
+                             show_messagebox=False, log_level='warning')
+
+    @staticmethod
+    def initial_row_count():
+        """
+        Nombre de lignes visibles à l'ouverture de la fenêtre, estimé d'après
+        WINDOWS_SIZE (la fenêtre n'est pas encore affichée).
+        """
+        try:
+            height = int(WINDOWS_SIZE.split('x')[1].split('+')[0])
+        except (IndexError, ValueError):
+            height = 600
+        return height // (THUMBNAIL_L + ROW_SPACING) + 1
+
+    def preload_thumbnails(self, count, on_progress=None):
+        """
+        Décode en priorité les vignettes des `count` premiers projets (ceux
+        affichés à l'ouverture) : la fenêtre apparaît avec ses vignettes.
 
-            with Image.open(file_path_4) as img:
-                img.thumbnail((THUMBNAIL_H, THUMBNAIL_L))  # Thumbnail size
-                thumbnail_img_4 = self._photoimage_from_pil(img)
+        :param count: nombre de projets à partir du début de la liste
+        :param on_progress: appelé (thread Tk) avec (décodés, total) après chaque projet
+        :return: nombre de projets à décoder (0 si tout est déjà en mémoire)
+        """
+        pending = [p for p in self.projects[:count] if p.name not in self._thumbnail_images]
+        if not pending:
+            return 0
+        # La progression est comptée par projet dans _apply_project_thumbnails :
+        # une tâche remplacée par celle d'une ligne liée au même projet compte aussi
+        self._preload = ({p.name for p in pending}, len(pending), on_progress)
+        if on_progress:
+            on_progress(0, len(pending))
+        for project in pending:
+            self._request_thumbnails(project.name, project.frame_1, project.frame_4, priority=0)
+        return len(pending)
+
+    def _preload_settled(self, project_dir_name):
+        """Compte un projet du préchargement comme traité (décodé, en erreur ou annulé)."""
+        if self._preload is None:
+            return
+        waiting, total, on_progress = self._preload
+        if project_dir_name not in waiting:
+            return
+        waiting.discard(project_dir_name)
+        if not waiting:
+            self._preload = None
+        if on_progress:
+            on_progress(total - len(waiting), total)
+
+    def _cancel_thumbnails(self, project_dir_name):
+        """Abandonne le décodage en attente des vignettes d'un projet."""
+        if self.thumbnail_loader:
+            self.thumbnail_loader.cancel(project_dir_name)
+        # ne pas retenir l'écran de démarrage pour un décodage qui n'aura pas lieu
+        self._preload_settled(project_dir_name)
+
+    def _row_priority(self, index):
+        """Priorité de décodage d'une ligne : 0 si visible, 1 si dans la marge d'overscan."""
+        if self.virtual_list is None:
+            return 0
+        first, last = self.virtual_list.visible_range()
+        return 0 if first <= index < last else 1
+
+    def _request_thumbnails(self, project_dir_name, file_path_1, file_path_4, priority=0):
+        """
+        Demande le décodage des vignettes d'un projet au pool de threads.
+        Sans pool, décode en synchrone.
+        """
+        loader = self.thumbnail_loader
+        if loader is None:
+            try:
+                result, error = self._load_project_thumbnails(file_path_1, file_path_4), None
+            except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
+                result, error = None, e
+            self._apply_project_thumbnails(project_dir_name, result, error)
+            return
+        loader.submit(project_dir_name,
+                      (file_path_1, file_path_4),
+                      lambda result, error, d=project_dir_name: self._apply_project_thumbnails(d, result, error),
+                      priority=priority)
 
-            if thumbnail_img_1 and thumbnail_img_4:
-                # Garder les références via le manager
-                self.image_ref_manager.add_ref(thumbnail_img_1, 'thumbnails')
-                self.image_ref_manager.add_ref(thumbnail_img_4, 'thumbnails')
-
-                # Create a frame for each image and radio button
-                item_frame = Frame(self.list_frameSrc)
-                item_frame.pack(side="top", fill="x", pady=5)
-
-                radio_button = Radiobutton(item_frame,
-                                           variable=self.selected_image,
-                                           value=project_dir_name)
-                radio_button.pack(side="left", padx=5)
-
-                # Créer les labels avec les thumbnails (Tkinter gère le type automatiquement)
-                thumbnail_label_1 = Label(
-                    item_frame,
-                    image=thumbnail_img_1,
-                    borderwidth=1,
-                    relief="solid"
-                )
+    @timed('decode_thumbnails')
+    def _load_project_thumbnails(self, file_path_1, file_path_4):
+        """
+        Décode (ou relit depuis le cache disque) les vignettes _1 et _4 d'un projet.
+        Exécuté dans un thread de travail : ne doit toucher à aucun objet Tk.
 
-                thumbnail_label_4 = Label(
-                    item_frame,
-                    image=thumbnail_img_4,
-                    borderwidth=1,
-                    relief="solid"
-                )
+        :return: tuple (vignette_1, vignette_4) d'images PIL
+        """
+        return (self.thumbnail_cache.get_or_create(file_path_1),
+                self.thumbnail_cache.get_or_create(file_path_4))
 
-                # IMPORTANT: Garder les références DANS les labels (pattern Tkinter)
-                thumbnail_label_1.image = thumbnail_img_1
-                thumbnail_label_4.image = thumbnail_img_4
-
-                # Afficher les labels
-                thumbnail_label_1.pack(side='left', padx=5)
-                thumbnail_label_4.pack(side='left', padx=5)
-
-                # Bind click event to show full size image
-                thumbnail_label_1.bind("<Button-1>", lambda e1, f=file_path_1: self.show_full_image(f))
-                thumbnail_label_4.bind("<Button-1>", lambda e4, f=file_path_4: self.show_full_image(f))
-
-                # Utiliser l'icône poubelle préchargée si disponible
-                icon_trash = None
-                if self.trash_icon:
-                    icon_trash = self.trash_icon
-                else:
-                    # Chargement de secours si la précharge a échoué
-                    icon_path = resources_path / "trash.png"
-                    try:
-                        with Image.open(icon_path) as img_icon:
-                            img2 = img_icon.resize((30, 30))
-                            icon_trash = self._photoimage_from_pil(img2)
-                            self.image_ref_manager.add_ref(icon_trash, 'icons_fallback')
-                    except (FileNotFoundError, UnidentifiedImageError, OSError):
-                        logger.debug(f"Fallback trash icon failed for {project_dir_name}")
-                        icon_trash = None
-
-                # check if json config file are present
-                json_file = self.find_json_file_in_project(project_dir_name)
-                if json_file:
-                    icon_edit = None
-                    if self.edit_icon:
-                        icon_edit = self.edit_icon
-                    else:
-                        # Chargement de secours si la précharge a échoué
-                        icon_path = resources_path / "edit.png"
-                        try:
-                            with Image.open(icon_path) as img_icon:
-                                img2 = img_icon.resize((30, 30))
-                                icon_edit = self._photoimage_from_pil(img2)
-                                self.image_ref_manager.add_ref(icon_edit, 'icons_fallback')
-                        except (FileNotFoundError, UnidentifiedImageError, OSError):
-                            logger.debug(f"Fallback edit icon failed for {project_dir_name}")
-                            icon_edit = None
-
-                    # Créer le bouton avec l'image
-                    if icon_edit:
-                        button_edit = Button(item_frame,
-                                             command=lambda d=project_dir_name: self.edit_border(d),
-                                             image=icon_edit)
-                    else:
-                        button_edit = Button(item_frame,
-                                             command=lambda d=project_dir_name: self.edit_border(d),
-                                             text=t('image.button.edit'))
-
-                    button_edit.pack(side='right')
-
-                # Créer le bouton avec l'image poubelle
-                if icon_trash:
-                    bouton_supprimer = Button(item_frame,
-                                              command=lambda d=project_dir_name: self.del_border(d),
-                                              image=icon_trash)
-                else:
-                    bouton_supprimer = Button(item_frame,
-                                              command=lambda d=project_dir_name: self.del_border(d),
-                                              text=t('image.button.delete'))
-
-                bouton_supprimer.pack(side='right', padx=20, pady=20)
-
-                text_label = Label(item_frame, text=project_dir_name)
-                text_label.pack(side='left', padx=5)
+    def _apply_project_thumbnails(self, project_dir_name, result, error):
+        """
+        Mémorise les vignettes décodées d'un projet et les affiche si sa ligne
+        est matérialisée (thread Tk uniquement).
+        """
+        if error is not None:
+            logger.debug(f"Image processing for {project_dir_name}: {type(error).__name__}")
+            self._preload_settled(project_dir_name)
+            return
 
-        except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
-            logger.debug(f"Image processing for {project_dir_name}: {type(e).__name__}")
-        except (tk.TclError, RuntimeError) as e:
-            handle_exception(e, operation=f"create_thumbnail_{project_dir_name}",
-                             show_messagebox=False, log_level='warning')
+        self._thumbnail_images[project_dir_name] = result
+        self._thumbnail_images.move_to_end(project_dir_name)
+        while len(self._thumbnail_images) > THUMBNAIL_MEMORY_ITEMS:
+            self._forget_thumbnails(next(iter(self._thumbnail_images)))
+
+        row = self._rows_by_project.get(project_dir_name)
+        if row is not None and row.project == project_dir_name:
+            try:
+                self._set_row_thumbnails(row, result)
+            except (tk.TclError, RuntimeError) as e:
+                handle_exception(e, operation=f"create_thumbnail_{project_dir_name}",
+                                 show_messagebox=False, log_level='warning')
+        self._preload_settled(project_dir_name)
+
+    def _forget_thumbnails(self, project_dir_name):
+        """Oublie les vignettes d'un projet (mémoire et cases de l'atlas)."""
+        self._thumbnail_images.pop(project_dir_name, None)
+        if self.thumbnail_atlas is not None:
+            for slot in range(2):
+                self.thumbnail_atlas.discard((project_dir_name, slot))
+
+    def _set_row_thumbnails(self, row, thumbnails):
+        """
+        Affiche des vignettes PIL dans une ligne. Les PhotoImage de la ligne sont
+        réutilisées (paste) quand la taille est identique : pas d'allocation Tk
+        au défilement.
+
+        Avec l'atlas, les vignettes sont collées dans les pages PIL de l'atlas
+        (recopiées vers Tk une fois par page et par rafraîchissement) et la
+        ligne n'affiche que des cases de ces pages.
+        """
+        atlas = self.thumbnail_atlas
+        if atlas is not None:
+            for slot, pil_image in enumerate(thumbnails):
+                region = atlas.add((row.project, slot), pil_image)
+                page_photo = atlas.photo(region.page)
+                if page_photo is None:
+                    continue
+                # les PhotoImage des pages sont référencées par l'atlas lui-même
+                row.show_region(slot, page_photo, region)
+            return
+
+        for slot, pil_image in enumerate(thumbnails):
+            # PhotoImage propre à la ligne (réutilisée d'un projet à l'autre),
+            # recréée par le manager si elle a été évincée
+            key = (id(row), slot)
+            photo = self.image_ref_manager.get_ref(key, 'thumbnails')
+            if photo is not None and (photo.width(), photo.height()) == pil_image.size:
+                photo.paste(pil_image)
+            else:
+                photo = self._photoimage_from_pil(pil_image)
+                if not photo:
+                    continue
+                # Garder les références via le manager (remplace la PhotoImage précédente)
+                self.image_ref_manager.add_ref(photo, 'thumbnails', key=key,
+                                               rematerialize=lambda k, r=row: self._rematerialize_thumbnail(r, k[1]),
+                                               on_evict=lambda k, r=row: r.show_placeholder(
+                                                   k[1], self.placeholder_thumbnail))
+            row.show_thumbnail(slot, photo)
+
+    def _restore_visible_thumbnails(self):
+        """
+        Réaffiche les vignettes évincées des lignes entrées dans la zone visible
+        sans être recyclées (lignes de la marge d'overscan).
+        """
+        if self.thumbnail_atlas is not None:
+            return
+        first, last = self.virtual_list.visible_range()
+        for index, row in self.virtual_list.bound_rows().items():
+            if not first <= index < last:
+                continue
+            for slot in range(2):
+                key = (id(row), slot)
+                if not self.image_ref_manager.is_evicted(key, 'thumbnails'):
+                    continue
+                photo = self.image_ref_manager.get_ref(key, 'thumbnails')
+                if photo is not None:
+                    row.show_thumbnail(slot, photo)
+
+    def _visible_thumbnail_keys(self):
+        """Clés (cf. _set_row_thumbnails) des vignettes des lignes visibles : jamais évincées."""
+        if self.virtual_list is None:
+            return set()
+        first, last = self.virtual_list.visible_range()
+        return {(id(row), slot)
+                for index, row in self.virtual_list.bound_rows().items() if first <= index < last
+                for slot in range(2)}
+
+    def _rematerialize_thumbnail(self, row, slot):
+        """
+        Recrée la PhotoImage évincée d'une ligne à partir des vignettes PIL
+        gardées en mémoire (None si elles ont été oubliées entre-temps).
+        """
+        thumbnails = self._thumbnail_images.get(row.project)
+        if thumbnails is None:
+            return None
+        return self._photoimage_from_pil(thumbnails[slot])
+
+    def _create_atlas_page(self, pil_image):
+        """PhotoImage d'une page de l'atlas, comptée par le manager (non évictable)."""
+        photo = self._photoimage_from_pil(pil_image)
+        if photo:
+            self.image_ref_manager.add_ref(photo, 'atlas')
+        return photo
+
+    def _on_selection_changed(self, *_args):
+        """Le bouton radio sélectionné a changé : précharger les prévisualisations."""
+        self.prefetch_previews(self.selected_image.get())
+
+    def prefetch_previews(self, project_dir_name):
+        """
+        Précharge en arrière-plan les prévisualisations (_1 et _4) du projet
+        sélectionné, puis celles des projets voisins dans la liste.
+
+        :param project_dir_name: nom du projet sélectionné
+        """
+        if self.preview_loader is None:
+            return
+        names = [p.name for p in self.projects]
+        if project_dir_name not in names:
+            return
+        index = names.index(project_dir_name)
+
+        # Les préchargements de la sélection précédente sont devenus inutiles
+        self.preview_loader.cancel_all()
+        for priority, i in ((0, index), (1, index - 1), (1, index + 1)):
+            if not 0 <= i < len(self.projects):
+                continue
+            project = self.projects[i]
+            for file_path in (project.frame_1, project.frame_4):
+                if not self.preview_cache.contains(file_path, PREVIEW_SIZE):
+                    self.preview_loader.submit(file_path, (file_path, PREVIEW_SIZE),
+                                               lambda result, error, f=file_path: self._on_preview_loaded(f, error),
+                                               priority=priority)
+
+    @staticmethod
+    def _on_preview_loaded(file_path, error):
+        """Fin d'un préchargement (thread Tk) : l'image est déjà dans le cache."""
+        if error is not None:
+            logger.debug(f"Preview prefetch failed for {file_path}: {type(error).__name__}")
 
     def create_action_buttons(self):
         """
@@ -514,7 +1027,7 @@ class CadreSelecteur:
         self.add_new_border.pack(side='left', padx=10)
         self.quit_button = Button(button_frame,
                                   text=t('selector.button.quit'),
-                                  command=self.master.quit)
+                                  command=self.close)
         self.quit_button.pack(side="right", padx=10)
 
         self.apply_button = Button(button_frame,
@@ -522,6 +1035,9 @@ class CadreSelecteur:
                                    command=self.apply_selection)
         self.apply_button.pack(side="right", padx=10)
 
+        # Affiché après une suppression, tant qu'elle peut être annulée
+        self.undo_button = Button(button_frame, command=self.undo_delete)
+
         # expose references for refresh
         return
 
@@ -537,6 +1053,7 @@ class CadreSelecteur:
             self.add_new_border.config(text=t('selector.button.new_frame'))
             self.apply_button.config(text=t('selector.button.apply'))
             self.quit_button.config(text=t('selector.button.quit'))
+            self._update_undo_button()
             # menu langue
             if hasattr(self, 'lang_btn'):
                 self.lang_btn.config(text=get_language())
@@ -590,30 +1107,17 @@ class CadreSelecteur:
 
     def apply_selection(self):
         """
-        Applique le cadre sélectionné : copie les fichiers _1 et _4 ainsi que
+        Applique le cadre sélectionné : installe les fichiers _1 et _4 ainsi que
         le template associé depuis le répertoire du projet dans le dossier de
-        destination et rafraîchit l'affichage.
+        destination (cf. FrameInstaller) et rafraîchit l'affichage.
         """
         selected_project = self.selected_image.get()
         if selected_project:
             logger.info(f"Selected frame: {selected_project}")
 
-            project_path = path.join(self.source_directory, selected_project)
-
-            # Chercher les fichiers _1.png et _4.png dans le répertoire
-            file_path_1 = None
-            file_path_4 = None
-            file_path_xml = None
-
-            for filename in listdir(project_path):
-                if filename.endswith('_1.png'):
-                    file_path_1 = path.join(project_path, filename)
-                elif filename.endswith('_4.png'):
-                    file_path_4 = path.join(project_path, filename)
-                elif filename.endswith('.xml'):
-                    file_path_xml = path.join(project_path, filename)
-
-            if not file_path_1 or not file_path_4:
+            # Réinventorier le seul projet sélectionné (il a pu changer depuis l'affichage)
+            project = self.repository.scan_project(selected_project)
+            if project is None or not project.is_complete:
                 messagebox.showerror(
                     t('selector.msg.error.no_selection_title'),
                     "Projet incomplet: fichiers _1.png ou _4.png manquants"
@@ -621,42 +1125,20 @@ class CadreSelecteur:
                 logger.warning(f"Incomplete project: {selected_project}")
                 return
 
-            dest_file_1 = path.join(self.destination_directory, CADRE_NAME_1)
-            dest_file_4 = path.join(self.destination_directory, CADRE_NAME_4)
-
-            # Copier les fichiers cadre
-            logger.debug(f"Copying frames: {file_path_1} & {file_path_4} → {dest_file_1} & {dest_file_4}")
+            # Installation atomique ; les fichiers déjà identiques dans Cadres ne sont pas recopiés
+            from .frame_installer import install_project
             try:
-                copy(file_path_1, dest_file_1)
-                copy(file_path_4, dest_file_4)
-                logger.info("Frame files copied successfully")
+                result = install_project(project, self.source_directory, self.destination_directory)
+                logger.info(f"Frame installed: {len(result.installed)} file(s) replaced, "
+                            f"{len(result.skipped)} unchanged")
             except OSError as e:
-                handle_exception(e, operation="copy_frame_files",
-                                 context={'source': file_path_1, 'dest': dest_file_1},
-                                 log_level='exception')
-                return
-
-            # Copier le fichier template
-            dest_file_tpl = path.join(self.destination_directory, TEMPLATE_NAME)
-
-            try:
-                if file_path_xml and path.exists(file_path_xml):
-                    logger.debug(f"Copying custom template: {file_path_xml} → {dest_file_tpl}")
-                    copy(file_path_xml, dest_file_tpl)
-                    logger.info("Custom template copied")
-                else:
-                    source_file_tpl = path.join(self.source_directory, TEMPLATE_NAME_STD)
-                    logger.debug(f"Custom template not found, using standard: {source_file_tpl}")
-                    copy(source_file_tpl, dest_file_tpl)
-                    logger.info("Standard template copied")
-            except OSError as e:
-                handle_exception(e, operation="copy_template",
-                                 context={'source': file_path_xml or source_file_tpl, 'dest': dest_file_tpl},
+                handle_exception(e, operation="install_frame",
+                                 context={'source': project.path, 'dest': self.destination_directory},
                                  log_level='exception')
                 return
 
             # rafraichie l'image dans dest
-            self.create_dest_thumbnail()
+            self.refresh_destination()
 
         else:
             messagebox.showerror(t('selector.msg.error.no_selection_title'),
@@ -666,7 +1148,8 @@ class CadreSelecteur:
     def show_full_image(self, file_path, width=720, height=480):
         """
         Ouvre une fenêtre de prévisualisation affichant l'image en taille
-        complète (redimensionnée aux dimensions fournies).
+        complète (redimensionnée aux dimensions fournies). L'image réduite
+        vient du cache des prévisualisations quand elle y est déjà.
         """
         try:
             window = Toplevel(self.master)  # Create a Toplevel window
@@ -675,15 +1158,19 @@ class CadreSelecteur:
             # without affecting the main app
             window.protocol("WM_DELETE_WINDOW", window.destroy)
 
-            with Image.open(file_path) as img:
-                img_resized = img.resize((width, height))
-                img_full: PhotoImage = ImageTk.PhotoImage(img_resized, master=window)
-                # Créer le label (Tkinter gère le type automatiquement)
-                label = Label(window, image=img_full)
-                label.pack()
-                window.resizable(False, False)
-                # Garder la référence attachée à la fenêtre (évite GC)
-                label.image = img_full
+            # Décodage directement à la taille de prévisualisation (ou image en cache)
+            if self.preview_cache is not None:
+                img_resized = self.preview_cache.get_or_create(file_path, (width, height))
+            else:
+                img_resized = load_preview(file_path, (width, height))
+            from PIL import ImageTk
+            img_full = ImageTk.PhotoImage(img_resized, master=window)
+            # Créer le label (Tkinter gère le type automatiquement)
+            label = Label(window, image=img_full)
+            label.pack()
+            window.resizable(False, False)
+            # Garder la référence attachée à la fenêtre (évite GC)
+            label.image = img_full
 
         except (FileNotFoundError, UnidentifiedImageError, OSError, tk.TclError, RuntimeError) as e:
             # Erreurs d'I/O, PIL ou Tkinter lors de la prévisualisation
@@ -701,6 +1188,8 @@ class CadreSelecteur:
         # Lier la fonction on_closing à l'événement de fermeture de la fenêtre
         self.tk_editor.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Import différé : l'éditeur et ses calques ne sont chargés qu'à l'ouverture
+        from .CadreEditeur.imageeditorapp import ImageEditorApp
         ImageEditorApp(self.tk_editor,
                        template=template_path,
                        destination=destination_path)
@@ -708,26 +1197,28 @@ class CadreSelecteur:
     def on_closing(self):
         """
         Fermeture de l'éditeur : détruit la fenêtre d'édition, restaure la
-        fenêtre principale et rafraîchit la liste des vignettes.
+        fenêtre principale et met à jour les seuls projets modifiés.
         """
         self.tk_editor.destroy()
         self.master.deiconify()
-        # List and generate image thumbnails
-        self.list_files_and_generate_thumbnails()
+        self.refresh_projects()
+        self.refresh_destination()
+        # les enregistrements de l'éditeur ont pu retirer des images des manifestes
+        self._submit_asset_collect()
 
     def del_border(self, project_dir_name):
         """
-        Supprime le répertoire du projet (contenant tous les fichiers du cadre).
+        Supprime le projet (répertoire contenant tous les fichiers du cadre).
         Refuse la suppression si c'est le dernier cadre disponible et
         affiche un message de confirmation avant suppression.
-        Rafraîchir ensuite la liste.
-        """
 
-        project_path = path.join(self.source_directory, project_dir_name)
+        Le répertoire est renommé dans la corbeille (instantané) et sa ligne
+        disparaît aussitôt ; la suppression peut être annulée pendant
+        TRASH_UNDO_SECONDS, puis les fichiers sont effacés en arrière-plan.
+        """
 
         # Compte le nombre de cadres disponibles
-        nb_cadres = len([d for d in listdir(self.source_directory)
-                         if path.isdir(path.join(self.source_directory, d))])
+        nb_cadres = len(self.repository)
         if nb_cadres <= 1:
             messagebox.showwarning(
                 t('selector.msg.warn.delete_impossible_title'),
@@ -743,10 +1234,9 @@ class CadreSelecteur:
             return  # abandon si non
 
         try:
-            rmtree(project_path)
-            logger.info(f"Project directory deleted successfully: {project_dir_name}")
-            messagebox.showinfo(t('selector.msg.info.deleted_title'), t('selector.msg.info.deleted_message'))
-        except (OSError, PermissionError) as e:
+            entry = self.trash.move(project_dir_name)
+            logger.info(f"Project moved to trash: {project_dir_name}")
+        except (OSError, ValueError) as e:
             logger.warning(f"Failed to delete project {project_dir_name}: {type(e).__name__}")
             handle_exception(
                 FileOperationError(f"Failed to delete project directory: {str(e)}"),
@@ -754,9 +1244,96 @@ class CadreSelecteur:
                 show_messagebox=True,
                 log_level='warning'
             )
+            entry = None
 
-        # Rafraîchir la liste
-        self.list_files_and_generate_thumbnails()
+        if self.selected_image.get() == project_dir_name:
+            self.selected_image.set('')
+        # Rafraîchir la liste (seule la ligne du projet supprimé change)
+        self.refresh_projects([project_dir_name])
+
+        if entry is not None:
+            after_id = self.master.after(TRASH_UNDO_SECONDS * 1000, lambda: self._purge_trash_entry(entry))
+            self._pending_trash[entry.container] = (entry, after_id)
+            self._update_undo_button()
+
+    def undo_delete(self):
+        """
+        Annule la dernière suppression encore annulable : le projet est remis
+        à sa place et sa ligne réapparaît.
+        """
+        if not self._pending_trash:
+            return
+        _, (entry, after_id) = self._pending_trash.popitem()
+        self.master.after_cancel(after_id)
+        try:
+            self.trash.restore(entry)
+            logger.info(f"Project restored: {entry.name}")
+        except OSError as e:
+            handle_exception(
+                FileOperationError(f"Failed to restore project directory: {str(e)}"),
+                operation="restore_project",
+                show_messagebox=True,
+                log_level='warning'
+            )
+            # l'entrée reste dans la corbeille : effacement comme prévu
+            self._submit_trash_purge(entry)
+        self.refresh_projects([entry.name])
+        self._update_undo_button()
+
+    def _purge_trash_entry(self, entry):
+        """Fin du délai d'annulation : la suppression devient définitive."""
+        self._pending_trash.pop(entry.container, None)
+        self._update_undo_button()
+        self._submit_trash_purge(entry)
+
+    def _purge_trash_and_assets(self, entry=None):
+        """
+        Efface une entrée de la corbeille (si `entry`) puis les images importées
+        que plus aucun projet ne référence (thread de la corbeille, sans Tk).
+
+        :return: True si l'entrée a été effacée (toujours True sans entrée)
+        """
+        purged = entry is None or self.trash.purge_entry(entry)
+        if purged and self.asset_store is not None:
+            self.asset_store.collect()
+        return purged
+
+    def _submit_asset_collect(self):
+        """
+        Efface dans le thread de la corbeille les images importées que plus aucun
+        projet ne référence (une seule collecte en attente à la fois).
+        """
+        if self.trash_worker is None:
+            return
+        self.trash_worker.submit('collect_assets', (None,), self._on_asset_collect_done)
+
+    @staticmethod
+    def _on_asset_collect_done(_purged, error):
+        """Fin d'une collecte des images importées (thread Tk)."""
+        if error is not None:
+            logger.warning(f"Imported images not collected: {error}")
+
+    def _submit_trash_purge(self, entry):
+        """Efface une entrée de la corbeille dans le thread dédié (tentatives bornées)."""
+        self.trash_worker.submit(str(entry.container), (entry,),
+                                 lambda purged, error, e=entry: self._on_trash_purged(e, purged, error))
+
+    @staticmethod
+    def _on_trash_purged(entry, purged, error):
+        """Fin d'un effacement (thread Tk) ; une entrée non effacée sera reprise au prochain démarrage."""
+        if error is not None or not purged:
+            logger.warning(f"Trash entry not purged, kept for next start: {entry.container} ({error})")
+
+    def _update_undo_button(self):
+        """Affiche le bouton d'annulation pour la dernière suppression annulable, sinon le masque."""
+        if self.undo_button is None:
+            return
+        if self._pending_trash:
+            entry, _ = next(reversed(self._pending_trash.values()))
+            self.undo_button.config(text=t('selector.button.undo_delete', name=entry.name))
+            self.undo_button.pack(side='left', padx=10)
+        else:
+            self.undo_button.pack_forget()
 
     def edit_border(self, project_dir_name):
         """
@@ -775,6 +1352,7 @@ class CadreSelecteur:
             logger.debug(f"Could not find json file in : {project_dir_name}")
             return
         else:
+            from .CadreEditeur.imageeditorapp import ImageEditorApp
             ImageEditorApp(self.tk_editor,
                            template=template_path,
                            destination=destination_path,
@@ -783,16 +1361,18 @@ class CadreSelecteur:
     def _photoimage_from_pil(self, pil_image):
         """
         Crée et retourne un ImageTk.PhotoImage à partir d'une image PIL.
-        Fait une copie et attache l'image au master de l'instance pour
-        éviter des erreurs Tkinter et la collecte par le garbage collector.
+        Attache l'image au master de l'instance pour éviter des erreurs
+        Tkinter. Les pixels sont recopiés dans l'image Tk : pas besoin de
+        copier l'image PIL au préalable.
         """
+        from PIL import ImageTk
         try:
-            return ImageTk.PhotoImage(pil_image.copy(), master=getattr(self, 'master', None))
+            return ImageTk.PhotoImage(pil_image, master=getattr(self, 'master', None))
         except (RuntimeError, tk.TclError) as e:
             # Environnements headless ou erreur Tkinter : retenter sans master
             logger.debug(f"PhotoImage with master failed: {e}; retrying without master")
             try:
-                return ImageTk.PhotoImage(pil_image.copy())
+                return ImageTk.PhotoImage(pil_image)
             except tk.TclError as e2:
                 # Errors from Tk internals when running headless or no display.
                 logger.exception("Failed to create PhotoImage (even without master)", exc_info=e2)
@@ -803,16 +1383,11 @@ class CadreSelecteur:
         Trouve le fichier JSON dans le répertoire du projet.
         Retourne le chemin complet du fichier JSON ou None s'il n'existe pas.
         """
-        project_path = path.join(self.source_directory, project_dir_name)
-
-        try:
-            for filename in listdir(project_path):
-                if filename.endswith('.json'):
-                    return path.join(project_path, filename)
-        except (OSError, FileNotFoundError):
-            logger.debug(f"Could not read project directory {project_path}")
-
-        return None
+        project = self.repository.get(project_dir_name)
+        if project is None:
+            logger.debug(f"Could not read project directory {project_dir_name}")
+            return None
+        return project.json
 
 
 if __name__ == "__main__":
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Détection des modifications des répertoires Templates et Cadres.
+
+Le sélecteur n'a besoin de savoir que *quels* projets ont changé pour ne
+mettre à jour que leurs lignes. Deux mécanismes :
+- inotify (Linux, via ctypes, sans dépendance) : le noyau signale les
+  créations / suppressions / écritures dans le répertoire surveillé et
+  dans chacun de ses sous-répertoires de premier niveau ;
+- scrutation des dates de modification (autres systèmes, ou si inotify
+  est indisponible) : un instantané (nom, mtime, taille) par entrée de
+  premier niveau est comparé au précédent.
+
+Dans les deux cas, les changements sont regroupés (une période calme
+d'un intervalle de scrutation) puis transmis au callback dans le thread Tk
+sous la forme {répertoire surveillé: noms des entrées de premier niveau
+modifiées}, ou None si tout le répertoire doit être réexaminé.
+"""
+
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Intervalles de scrutation (ms)
+INOTIFY_POLL_MS = 250
+MTIME_POLL_MS = 2000
+
+# Constantes inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+               | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+Changes = Dict[Path, Optional[Set[str]]]
+
+
+class ProjectDiff:
+    """Différence entre deux inventaires : projets ajoutés, supprimés, modifiés."""
+
+    def __init__(self, added: Set[str], removed: Set[str], modified: Set[str]):
+        self.added = added
+        self.removed = removed
+        self.modified = modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self) -> str:
+        return (f"ProjectDiff(added={sorted(self.added)}, removed={sorted(self.removed)}, "
+                f"modified={sorted(self.modified)})")
+
+
+def diff_snapshots(old: Dict[str, Hashable], new: Dict[str, Hashable]) -> ProjectDiff:
+    """
+    Compare deux instantanés {nom: signature}.
+
+    Args:
+        old: instantané précédent
+        new: instantané courant
+
+    Returns:
+        ProjectDiff des noms ajoutés, supprimés et dont la signature a changé
+    """
+    added = set(new) - set(old)
+    removed = set(old) - set(new)
+    modified = {name for name in set(old) & set(new) if old[name] != new[name]}
+    return ProjectDiff(added, removed, modified)
+
+
+def parse_inotify_events(buffer: bytes) -> Iterable[Tuple[int, int, str]]:
+    """
+    Décode les événements lus sur un descripteur inotify.
+
+    Args:
+        buffer: octets lus (un ou plusieurs struct inotify_event)
+
+    Returns:
+        Itérable de (wd, mask, nom) ; nom vide pour un événement sur le répertoire lui-même
+    """
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(buffer):
+        wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+        offset += _EVENT_HEADER.size
+        raw_name = buffer[offset:offset + length]
+        offset += length
+        yield wd, mask, raw_name.split(b'\0', 1)[0].decode('utf-8', 'surrogateescape')
+
+
+def snapshot_entries(root: Union[str, Path]) -> Dict[str, Tuple]:
+    """
+    Instantané des entrées de premier niveau d'un répertoire (hors entrées cachées).
+    Pour un sous-répertoire, la signature inclut (nom, mtime, taille) de ses fichiers.
+
+    Returns:
+        {nom: signature} ; vide si le répertoire est inaccessible
+    """
+    snapshot = {}
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return snapshot
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        try:
+            st = entry.stat()
+            if entry.is_dir():
+                with os.scandir(entry.path) as sub:
+                    children = []
+                    for child in sub:
+                        try:
+                            cst = child.stat()
+                        except OSError:
+                            continue
+                        children.append((child.name, cst.st_mtime_ns, cst.st_size))
+                snapshot[entry.name] = (st.st_mtime_ns, tuple(sorted(children)))
+            else:
+                snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+    return snapshot
+
+
+class _Inotify:
+    """Accès minimal à inotify via ctypes (Linux uniquement)."""
+
+    def __init__(self):
+        # ctypes n'est chargé que si inotify est utilisé
+        import ctypes
+        import ctypes.util
+        self._ctypes = ctypes
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.fd = fd
+
+    def add_watch(self, path: Union[str, Path]) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(self._ctypes.get_errno(), f'inotify_add_watch failed for {path}')
+        return wd
+
+    def read(self) -> bytes:
+        chunks = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            chunks.append(data)
+        return b''.join(chunks)
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class ChangeWatcher:
+    """Surveille des répertoires et signale les entrées de premier niveau modifiées."""
+
+    def __init__(self,
+                 widget,
+                 callback: Callable[[Changes], None],
+                 use_inotify: Optional[bool] = None,
+                 poll_ms: Optional[int] = None):
+        """
+        Args:
+            widget: widget Tk utilisé pour planifier la scrutation (after)
+            callback: appelé dans le thread Tk avec {répertoire: noms modifiés ou None}
+            use_inotify: forcer (True) ou interdire (False) inotify ; None = auto (Linux)
+            poll_ms: intervalle de scrutation (défaut selon le mécanisme)
+        """
+        self.widget = widget
+        self.callback = callback
+        self.roots = []
+        self._inotify: Optional[_Inotify] = None
+        # wd -> (répertoire surveillé, sous-répertoire ou None)
+        self._watches: Dict[int, Tuple[Path, Optional[str]]] = {}
+        self._snapshots: Dict[Path, Dict[str, Tuple]] = {}
+        self._pending: Changes = {}
+        self._after_id = None
+        self._running = False
+
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith('linux')
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify unavailable, falling back to mtime polling: {e}")
+        self.backend = 'inotify' if self._inotify else 'polling'
+        self.poll_ms = poll_ms or (INOTIFY_POLL_MS if self._inotify else MTIME_POLL_MS)
+
+    def watch(self, root: Union[str, Path]) -> None:
+        """Ajoute un répertoire à surveiller (et ses sous-répertoires de premier niveau)."""
+        root = Path(root)
+        self.roots.append(root)
+        if self._inotify:
+            self._add_watch(root, None)
+            try:
+                with os.scandir(root) as it:
+                    subdirs = [e.name for e in it if not e.name.startswith('.') and e.is_dir()]
+            except OSError:
+                subdirs = []
+            for name in subdirs:
+                self._add_watch(root, name)
+        else:
+            self._snapshots[root] = snapshot_entries(root)
+
+    def _add_watch(self, root: Path, name: Optional[str]) -> None:
+        try:
+            wd = self._inotify.add_watch(root / name if name else root)
+        except OSError as e:
+            logger.debug(f"ChangeWatcher: {e}")
+            return
+        self._watches[wd] = (root, name)
+
+    def start(self) -> None:
+        """Démarre la scrutation périodique."""
+        self._running = True
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.poll_ms, self._tick)
+
+    def stop(self) -> None:
+        """Arrête la surveillance et libère le descripteur inotify."""
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception as e:
+                logger.debug(f"ChangeWatcher: after_cancel failed: {e}")
+            self._after_id = None
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+            self._watches.clear()
+
+    def poll(self) -> Changes:
+        """
+        Relève les changements survenus depuis le dernier appel (sans regroupement).
+
+        Returns:
+            {répertoire surveillé: noms modifiés, ou None pour tout réexaminer}
+        """
+        changes: Changes = {}
+        if self._inotify:
+            for wd, mask, name in parse_inotify_events(self._inotify.read()):
+                self._record_event(changes, wd, mask, name)
+        else:
+            for root in self.roots:
+                snapshot = snapshot_entries(root)
+                diff = diff_snapshots(self._snapshots.get(root, {}), snapshot)
+                self._snapshots[root] = snapshot
+                if diff:
+                    changes[root] = diff.added | diff.removed | diff.modified
+        return changes
+
+    def _record_event(self, changes: Changes, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            # file d'événements saturée : tout réexaminer
+            for root in self.roots:
+                changes[root] = None
+            return
+        target = self._watches.get(wd)
+        if target is None:
+            return
+        root, subdir = target
+        if mask & IN_IGNORED:
+            del self._watches[wd]
+            return
+        if subdir is None:
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changes[root] = None
+                return
+            if not name or name.startswith('.'):
+                return
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch(root, name)
+            changed = name
+        else:
+            changed = subdir
+        if root in changes and changes[root] is None:
+            return
+        changes.setdefault(root, set()).add(changed)
+
+    def _merge(self, changes: Changes) -> None:
+        for root, names in changes.items():
+            if names is None or self._pending.get(root, set()) is None:
+                self._pending[root] = None
+            else:
+                self._pending.setdefault(root, set()).update(names)
+
+    def _tick(self) -> None:
+        self._after_id = None
+        try:
+            changes = self.poll()
+            if changes:
+                # attendre une période calme pour regrouper les écritures en rafale
+                self._merge(changes)
+            elif self._pending:
+                pending, self._pending = self._pending, {}
+                self.callback(pending)
+        except Exception as e:
+            logger.exception("ChangeWatcher: error while processing changes", exc_info=e)
+        if self._running:
+            self.start()
+
+
+__all__ = [
+    'ChangeWatcher',
+    'ProjectDiff',
+    'diff_snapshots',
+    'parse_inotify_events',
+    'snapshot_entries',
+]
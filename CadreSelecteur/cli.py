@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Interface en ligne de commande, sans Tkinter.
+
+Permet aux hooks pibooth et aux scripts de démarrage de changer de cadre
+sans interface graphique :
+
+    python -m CadreSelecteur list
+    python -m CadreSelecteur install <projet>
+
+Seuls des modules sans dépendance graphique sont importés (inventaire des
+projets, installation atomique, configuration) : ni tkinter, ni PIL, ni
+l'éditeur. Le module d'installation (hashlib, shutil, configuration) n'est
+importé que par la commande install. Les messages sont en anglais et
+stables pour pouvoir être analysés par des scripts.
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from . import __version__
+from .path_resolver import resolve_frames_dir, resolve_templates_dir
+from .project_repository import ProjectRepository
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m CadreSelecteur',
+                                     description='Frame selector for pibooth (command-line mode).')
+    parser.add_argument('--version', action='version', version=__version__)
+    parser.add_argument('--templates', default=None,
+                        help='Templates directory (default: next to the application)')
+    parser.add_argument('--destination', default=None,
+                        help='Cadres directory read by pibooth (default: next to the application)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='debug logging on stderr')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='list installable projects')
+    list_parser.add_argument('--all', action='store_true', help='include incomplete projects')
+
+    install_parser = subparsers.add_parser('install', help='install a project as the current frame')
+    install_parser.add_argument('project', help='project directory name in Templates')
+    install_parser.add_argument('--link-mode', default='reflink',
+                                help='how files are placed in Cadres: reflink (default, falls back to copy), '
+                                     'hardlink or copy')
+    return parser
+
+
+def cmd_list(templates, show_all: bool = False) -> int:
+    """Affiche un projet par ligne (projets installables uniquement, sauf --all)."""
+    try:
+        repository = ProjectRepository(templates).scan()
+    except FileNotFoundError:
+        print(f"error: templates directory not found: {templates}", file=sys.stderr)
+        return EXIT_ERROR
+    projects = repository.projects() if show_all else repository.complete_projects()
+    for project in projects:
+        print(project.name)
+    return EXIT_OK
+
+
+def cmd_install(templates, destination, project_name: str, link_mode: str = 'reflink') -> int:
+    """Installe un projet ; seul le répertoire de ce projet est parcouru."""
+    from .exceptions import ProjectError
+    from .frame_installer import install_project
+
+    project = ProjectRepository(templates).scan_project(project_name)
+    if project is None:
+        print(f"error: project not found: {project_name}", file=sys.stderr)
+        return EXIT_ERROR
+    try:
+        result = install_project(project, templates, destination, link_mode=link_mode)
+    except ProjectError as e:
+        print(f"error: {e.message}", file=sys.stderr)
+        return EXIT_ERROR
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except OSError as e:
+        print(f"error: installation failed: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    status = 'installed' if result.changed else 'unchanged'
+    print(f"{status}: {project_name} ({len(result.installed)} replaced, {len(result.skipped)} unchanged)")
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de la ligne de commande.
+
+    Args:
+        argv: arguments (sans le nom du programme) ; sys.argv[1:] par défaut
+
+    Returns:
+        Code de sortie (0 = succès, 1 = erreur, 2 = usage incorrect)
+    """
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(levelname)s: %(message)s')
+
+    templates = args.templates or resolve_templates_dir()
+    if args.command == 'list':
+        return cmd_list(templates, show_all=args.all)
+    destination = args.destination or resolve_frames_dir()
+    return cmd_install(templates, destination, args.project, link_mode=args.link_mode)
+
+
+__all__ = ['main', 'cmd_list', 'cmd_install']
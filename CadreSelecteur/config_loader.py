@@ -4,11 +4,19 @@ Ce module vit en dehors du dossier `resources` afin que `resources/` reste non-m
 comme demandé.
 
 Exporte des constantes : WINDOWS_SIZE, THUMBNAIL_H, THUMBNAIL_L, TEMPLATE_NAME,
-TEMPLATE_NAME_STD, CADRE_NAME_1, CADRE_NAME_4
+TEMPLATE_NAME_STD, CADRE_NAME_1, CADRE_NAME_4, LANGUAGE, TTK_THEME,
+THUMBNAIL_CACHE_MAX_MB, PREVIEW_CACHE_MAX_MB, TIMING_TRACE_FILE, TRASH_UNDO_SECONDS,
+THUMBNAIL_ATLAS, IMAGE_MEMORY_BUDGET_MB, EDITOR_MAX_FPS,
+EDITOR_RENDER_MODE, PYRAMID_CACHE_MB, IMPORT_STORE_DERIVATIVE, ASSET_STORE
+
+L'import du module ne lit aucun fichier : config.json est lu une seule fois
+par load_config(), appelée explicitement par les points d'entrée graphiques
+(après setup_logging(), pour que les erreurs de lecture soient journalisées),
+ou à défaut au premier accès à une constante.
 """
 import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from .path_resolver import resolve_file_in_resources, resolve_resources_dir
 
@@ -31,34 +39,146 @@ _defaults = {
     "LANGUAGE": "fr",
     # thème ttk par défaut
     "TTK_THEME": "clam",
+    # taille maximale du cache disque des vignettes (en Mo)
+    "THUMBNAIL_CACHE_MAX_MB": 32,
+    # budget mémoire des prévisualisations 720x480 (en Mo, ~1,4 Mo par image)
+    "PREVIEW_CACHE_MAX_MB": 24,
+    # fichier JSON de trace des temps de démarrage (chrome://tracing), vide = désactivé
+    "TIMING_TRACE_FILE": "",
+    # délai pendant lequel la suppression d'un cadre peut être annulée (en secondes)
+    "TRASH_UNDO_SECONDS": 30,
+    # vignettes regroupées dans quelques grandes PhotoImage (atlas) plutôt qu'une par vignette
+    "THUMBNAIL_ATLAS": True,
+    # mémoire maximale des PhotoImage du sélecteur (Mo, 0 = sans limite) ; au-delà les vignettes
+    # les moins récemment affichées sont libérées et recréées au défilement
+    "IMAGE_MEMORY_BUDGET_MB": 32,
+    # cadence maximale de rafraîchissement de l'aperçu de l'éditeur (images/s, 0 = sans limite)
+    "EDITOR_MAX_FPS": 60,
+    # rendu de l'aperçu de l'éditeur : "composite" (image PIL aplatie) ou "items" (un item
+    # du canvas par calque : déplacement sans travail PIL, pour les machines modestes)
+    "EDITOR_RENDER_MODE": "composite",
+    # budget mémoire des réductions (mip-map) des images importées dans l'éditeur (en Mo)
+    "PYRAMID_CACHE_MB": 64,
+    # import d'image dans l'éditeur : enregistrer l'image réduite (taille utile à l'export,
+    # orientation EXIF appliquée) dans le répertoire du cadre au lieu de copier l'original
+    "IMPORT_STORE_DERIVATIVE": False,
+    # images importées rangées une seule fois par contenu dans Templates/.assets,
+    # référencées par le manifeste de chaque projet (False : copie dans le projet) ;
+    # change l'organisation des fichiers sur disque, donc désactivé par défaut
+    "ASSET_STORE": False,
 }
 
-_config: dict[str, Any] = _defaults.copy()
-
-try:
-    if CONFIG_PATH.exists():
-        with CONFIG_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                _config.update(data)
-            else:
-                logger.warning("config.json does not contain a JSON object; using defaults")
-    else:
-        logger.info(f"config.json not found at {CONFIG_PATH}; using defaults")
-except Exception as e:
-    logger.exception(f"Failed to load config.json: {e}; using defaults")
-
-WINDOWS_SIZE: str = str(_config.get("WINDOWS_SIZE", _defaults["WINDOWS_SIZE"]))
-THUMBNAIL_H: int = int(_config.get("THUMBNAIL_H", _defaults["THUMBNAIL_H"]))
-THUMBNAIL_L: int = int(_config.get("THUMBNAIL_L", _defaults["THUMBNAIL_L"]))
-TEMPLATE_NAME: str = str(_config.get("TEMPLATE_NAME", _defaults["TEMPLATE_NAME"]))
-TEMPLATE_NAME_STD: str = str(_config.get("TEMPLATE_NAME_STD", _defaults["TEMPLATE_NAME_STD"]))
-CADRE_NAME_1: str = str(_config.get("CADRE_NAME_1", _defaults["CADRE_NAME_1"]))
-CADRE_NAME_4: str = str(_config.get("CADRE_NAME_4", _defaults["CADRE_NAME_4"]))
+# Configuration lue (None tant que load_config() n'a pas été appelée)
+_config: Optional[dict[str, Any]] = None
+
+
+def load_config() -> dict[str, Any]:
+    """
+    Lit config.json (une seule fois) et le fusionne avec les valeurs par défaut.
+    Idempotente : peut être appelée par chaque point d'entrée.
+
+    Returns:
+        Configuration complète (clés de _defaults et clés lues)
+    """
+    global _config
+    if _config is not None:
+        return _config
+    config = _defaults.copy()
+    try:
+        if CONFIG_PATH.exists():
+            with CONFIG_PATH.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+                if isinstance(data, dict):
+                    config.update(data)
+                else:
+                    logger.warning("config.json does not contain a JSON object; using defaults")
+        else:
+            logger.info(f"config.json not found at {CONFIG_PATH}; using defaults")
+    except Exception as e:
+        logger.exception(f"Failed to load config.json: {e}; using defaults")
+    _config = config
+    return _config
+
+
+# Constantes exportées : type (conversion de la valeur lue), valeur calculée par __getattr__
+WINDOWS_SIZE: str
+THUMBNAIL_H: int
+THUMBNAIL_L: int
+TEMPLATE_NAME: str
+TEMPLATE_NAME_STD: str
+CADRE_NAME_1: str
+CADRE_NAME_4: str
 # Exposer la langue choisie dans 'config.json' (fallback sur la valeur par défaut)
-LANGUAGE: str = str(_config.get("LANGUAGE", _defaults["LANGUAGE"]))
+LANGUAGE: str
 # Exposer le thème ttk choisi dans 'config.json' (fallback sur la valeur par défaut)
-TTK_THEME: str = str(_config.get("TTK_THEME", _defaults["TTK_THEME"]))
+TTK_THEME: str
+# Budget du cache disque des vignettes (en Mo)
+THUMBNAIL_CACHE_MAX_MB: int
+# Budget mémoire du cache des prévisualisations (en Mo)
+PREVIEW_CACHE_MAX_MB: int
+# Trace Chrome des temps de démarrage (chemin, vide = désactivée)
+TIMING_TRACE_FILE: str
+# Délai d'annulation d'une suppression avant effacement définitif (en secondes)
+TRASH_UNDO_SECONDS: int
+# Affichage des vignettes via un atlas de PhotoImage (False = une PhotoImage par vignette)
+THUMBNAIL_ATLAS: bool
+# Budget mémoire des PhotoImage du sélecteur (Mo, 0 = sans limite)
+IMAGE_MEMORY_BUDGET_MB: int
+# Cadence maximale de l'aperçu de l'éditeur (images/s, 0 = sans limite)
+EDITOR_MAX_FPS: int
+# Rendu de l'aperçu de l'éditeur : "composite" ou "items"
+EDITOR_RENDER_MODE: str
+# Budget mémoire des réductions des images importées (Mo)
+PYRAMID_CACHE_MB: int
+# Import : enregistrer l'image réduite plutôt que l'original
+IMPORT_STORE_DERIVATIVE: bool
+# Import : store d'images partagé par contenu
+ASSET_STORE: bool
+
+
+_TRUE_STRINGS = ('true', '1', 'yes', 'on')
+_FALSE_STRINGS = ('false', '0', 'no', 'off', '')
+
+
+def _parse_bool(value: Any) -> bool:
+    """
+    Booléen de config.json : true/false JSON, 0/1, ou chaîne true/false, 1/0, yes/no, on/off.
+
+    Raises:
+        ValueError si la valeur n'est pas reconnue
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE_STRINGS:
+            return True
+        if text in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Valeur d'une constante de configuration, lue au premier accès (PEP 562)
+    puis gardée comme attribut du module. Une valeur invalide est journalisée
+    et remplacée par la valeur par défaut.
+    """
+    kind = __annotations__.get(name) if name in _defaults else None
+    if kind is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parse = _parse_bool if kind is bool else kind
+    value = load_config().get(name)
+    try:
+        value = parse(_defaults[name] if value is None else value)
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Invalid value for {name} in config.json ({e}); using default {_defaults[name]!r}")
+        value = parse(_defaults[name])
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "WINDOWS_SIZE",
@@ -70,5 +190,17 @@ __all__ = [
     "CADRE_NAME_4",
     "LANGUAGE",
     "TTK_THEME",
+    "THUMBNAIL_CACHE_MAX_MB",
+    "PREVIEW_CACHE_MAX_MB",
+    "TIMING_TRACE_FILE",
+    "TRASH_UNDO_SECONDS",
+    "THUMBNAIL_ATLAS",
+    "IMAGE_MEMORY_BUDGET_MB",
+    "EDITOR_MAX_FPS",
+    "EDITOR_RENDER_MODE",
+    "PYRAMID_CACHE_MB",
+    "IMPORT_STORE_DERIVATIVE",
+    "ASSET_STORE",
     "RESOURCES_DIR",
+    "load_config",
 ]
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Installation atomique d'un cadre dans le répertoire Cadres.
+
+Installer un cadre revient à déposer cadre_1.png, cadre_4.png et le
+template XML dans Cadres, où pibooth les lit. Ce module :
+- saute les fichiers dont le contenu est déjà identique (même inode, ou
+  même taille et même empreinte SHA-256) ;
+- prépare les fichiers modifiés dans un répertoire temporaire situé dans
+  Cadres (donc sur le même système de fichiers), puis les met en place
+  avec `os.replace` : chaque fichier lu par pibooth est soit l'ancien, soit
+  le nouveau, jamais un fichier à moitié écrit, même après une coupure ;
+- conserve un lien vers chaque fichier remplacé le temps de l'installation :
+  si un renommage échoue, les fichiers déjà mis en place sont restaurés ;
+- évite la copie des données quand c'est possible :
+  * 'reflink' (défaut) : clone copy-on-write (Btrfs, XFS...), sinon copie ;
+  * 'hardlink' : lien physique, sinon reflink, sinon copie. Attention : un
+    lien physique partage l'inode avec le fichier de Templates, une
+    modification *sur place* du cadre source modifierait donc aussi le
+    cadre installé. À réserver aux sources qui ne sont remplacées que par
+    renommage ;
+  * 'copy' : copie systématique.
+
+Le module ne dépend pas de Tkinter (utilisable en ligne de commande).
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .config_loader import CADRE_NAME_1, CADRE_NAME_4, TEMPLATE_NAME, TEMPLATE_NAME_STD
+from .exceptions import ProjectError
+
+logger = logging.getLogger(__name__)
+
+LINK_MODES = ('reflink', 'hardlink', 'copy')
+
+# ioctl FICLONE (linux/fs.h) : clone copy-on-write d'un fichier entier
+_FICLONE = 0x40049409
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: Union[str, Path]) -> str:
+    """
+    Empreinte SHA-256 du contenu d'un fichier.
+
+    Args:
+        file_path: chemin du fichier
+
+    Returns:
+        Empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def files_identical(source: Union[str, Path], dest: Union[str, Path]) -> bool:
+    """
+    Indique si `dest` a déjà exactement le contenu de `source`.
+    Le hachage n'est fait que si les tailles sont égales.
+
+    Returns:
+        False si `dest` n'existe pas ou diffère
+    """
+    try:
+        src_st = os.stat(source)
+        dst_st = os.stat(dest)
+    except FileNotFoundError:
+        return False
+    if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+        return True
+    if src_st.st_size != dst_st.st_size:
+        return False
+    return file_digest(source) == file_digest(dest)
+
+
+def _reflink(source: Path, dest: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, dest)
+        return True
+    except OSError:
+        try:
+            os.remove(dest)
+        except OSError:
+            pass
+        return False
+
+
+def _copy_durable(source: Path, dest: Path) -> None:
+    shutil.copy2(source, dest)
+    # Forcer l'écriture sur disque avant la mise en place (carte SD, coupure secteur)
+    with open(dest, 'rb+') as f:
+        os.fsync(f.fileno())
+
+
+def _backup(target: Path, backup: Path) -> Optional[Path]:
+    # Lien physique (instantané, même système de fichiers), sinon copie ;
+    # None si la destination n'existe pas encore
+    if not target.exists():
+        return None
+    try:
+        os.link(target, backup)
+    except OSError:
+        _copy_durable(target, backup)
+    return backup
+
+
+def _fsync_dir(directory: Path) -> None:
+    # Rend le renommage durable (POSIX) ; impossible sous Windows
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class InstallResult:
+    """Bilan d'une installation : fichiers mis en place et fichiers inchangés."""
+
+    def __init__(self):
+        self.installed: List[str] = []
+        self.skipped: List[str] = []
+
+    @property
+    def changed(self) -> bool:
+        """True si au moins un fichier a été remplacé."""
+        return bool(self.installed)
+
+    def __repr__(self) -> str:
+        return f"InstallResult(installed={self.installed}, skipped={self.skipped})"
+
+
+class FrameInstaller:
+    """Installe des fichiers dans un répertoire de destination, de façon atomique."""
+
+    def __init__(self, destination_dir: Union[str, Path], link_mode: str = 'reflink'):
+        """
+        Args:
+            destination_dir: répertoire Cadres
+            link_mode: 'reflink' (défaut), 'hardlink' ou 'copy' (cf. docstring du module)
+
+        Raises:
+            ValueError si link_mode est inconnu
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode!r} (expected one of {LINK_MODES})")
+        self.destination_dir = Path(destination_dir)
+        self.link_mode = link_mode
+
+    def install(self, files: Dict[str, Union[str, Path]]) -> InstallResult:
+        """
+        Installe les fichiers donnés ; les fichiers déjà identiques sont sautés.
+
+        Les fichiers sont mis en place dans l'ordre du dictionnaire (les
+        cadres avant le template, pour que le template ne désigne jamais un
+        cadre absent).
+
+        Args:
+            files: {nom dans la destination: chemin source}
+
+        Returns:
+            InstallResult
+
+        Raises:
+            OSError si une source est illisible ou la destination inaccessible ;
+            dans ce cas les fichiers déjà remplacés sont restaurés (sauf
+            coupure pendant la restauration elle-même)
+        """
+        result = InstallResult()
+        pending = []
+        for dest_name, source in files.items():
+            if files_identical(source, self.destination_dir / dest_name):
+                result.skipped.append(dest_name)
+            else:
+                pending.append((dest_name, Path(source)))
+        if not pending:
+            logger.debug(f"Frame already installed, nothing to do: {result.skipped}")
+            return result
+
+        staging = Path(tempfile.mkdtemp(prefix='.install-', dir=self.destination_dir))
+        try:
+            # 1. tout préparer à côté de la destination (aucun fichier visible modifié)
+            for dest_name, source in pending:
+                self._stage(source, staging / dest_name)
+            # 2. garder un lien vers les fichiers qui vont être remplacés
+            backups = {}
+            for dest_name, _ in pending:
+                backup = _backup(self.destination_dir / dest_name, staging / f'{dest_name}.bak')
+                if backup is not None:
+                    backups[dest_name] = backup
+            # 3. mise en place : un renommage atomique par fichier
+            try:
+                for dest_name, _ in pending:
+                    os.replace(staging / dest_name, self.destination_dir / dest_name)
+                    result.installed.append(dest_name)
+            except OSError:
+                self._rollback(result.installed, backups)
+                result.installed.clear()
+                raise
+            finally:
+                _fsync_dir(self.destination_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        logger.debug(f"Frame installed: {result}")
+        return result
+
+    def _rollback(self, installed: List[str], backups: Dict[str, Path]) -> None:
+        # Ordre inverse : le template est restauré avant les cadres qu'il désigne
+        for dest_name in reversed(installed):
+            target = self.destination_dir / dest_name
+            try:
+                if dest_name in backups:
+                    os.replace(backups[dest_name], target)
+                else:
+                    target.unlink()
+            except OSError as e:
+                logger.error(f"Unable to restore {target}: {e}")
+
+    def _stage(self, source: Path, staged: Path) -> None:
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(source, staged)
+                return
+            except OSError as e:
+                logger.debug(f"Hardlink unavailable for {source}: {type(e).__name__}")
+        if self.link_mode in ('hardlink', 'reflink') and _reflink(source, staged):
+            return
+        _copy_durable(source, staged)
+
+
+def install_project(project,
+                    templates_dir: Union[str, Path],
+                    destination_dir: Union[str, Path],
+                    link_mode: str = 'reflink') -> InstallResult:
+    """
+    Installe un projet de Templates comme cadre courant : ses cadres _1 et _4,
+    et son template XML ou, à défaut, le template standard.
+
+    Args:
+        project: Project de l'inventaire (cf. project_repository)
+        templates_dir: répertoire Templates (contient le template standard)
+        destination_dir: répertoire Cadres
+        link_mode: cf. FrameInstaller
+
+    Returns:
+        InstallResult
+
+    Raises:
+        ProjectError si le projet n'a pas ses deux cadres
+        OSError si l'installation échoue (la destination reste inchangée)
+    """
+    if not project.is_complete:
+        raise ProjectError(f"Incomplete project: {project.name}",
+                           context={'path': project.path, 'reason': 'missing _1.png or _4.png'})
+
+    template = project.xml
+    if not template:
+        template = str(Path(templates_dir) / TEMPLATE_NAME_STD)
+        logger.debug(f"Custom template not found, using standard: {template}")
+
+    # Les cadres d'abord, le template ensuite
+    files = {
+        CADRE_NAME_1: project.frame_1,
+        CADRE_NAME_4: project.frame_4,
+        TEMPLATE_NAME: template,
+    }
+    return FrameInstaller(destination_dir, link_mode=link_mode).install(files)
+
+
+__all__ = ['FrameInstaller', 'install_project', 'InstallResult', 'files_identical', 'file_digest', 'LINK_MODES']
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Décodage à résolution réduite pour les vignettes et prévisualisations.
+
+Les cadres sont des PNG 1800x1200 RGBA ; le sélecteur ne les affiche
+jamais qu'en vignette (128x85) ou en prévisualisation (720x480). Ce
+module produit directement l'image à la taille d'affichage :
+- JPEG : `Image.draft` fait décoder l'image par libjpeg à 1/2, 1/4 ou 1/8
+  de sa taille (le plus petit facteur qui reste au-dessus de la cible) ;
+- tous formats : `Image.reduce` (moyenne par blocs entiers, très rapide)
+  ramène l'image à environ REDUCING_GAP fois la cible, puis un seul
+  rééchantillonnage de qualité produit la taille finale ;
+- aucune copie intermédiaire : chaque étape produit une image plus petite
+  et l'image source est fermée dès la fin du décodage.
+"""
+
+import logging
+from pathlib import Path
+from typing import Tuple, Union
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# La réduction entière s'arrête à ce multiple de la taille cible,
+# le rééchantillonnage final garde ainsi une bonne qualité
+REDUCING_GAP = 2.0
+
+DEFAULT_RESAMPLE = Image.Resampling.LANCZOS
+
+# Prévisualisation plein écran : le rapport de réduction est faible (1800 -> 720),
+# on réduit jusqu'à la taille cible et on finit en bicubique (comme Image.resize)
+PREVIEW_REDUCING_GAP = 1.0
+PREVIEW_RESAMPLE = Image.Resampling.BICUBIC
+
+
+def fit_size(source: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Dimensions de `source` réduites pour tenir dans `box` en gardant les proportions
+    (jamais agrandies, comme Image.thumbnail).
+
+    Args:
+        source: (largeur, hauteur) de l'image
+        box: (largeur, hauteur) maximales
+
+    Returns:
+        (largeur, hauteur) d'au moins 1 pixel
+    """
+    width, height = source
+    scale = min(box[0] / width, box[1] / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def reduce_factor(source: Tuple[int, int], target: Tuple[int, int], gap: float = REDUCING_GAP) -> int:
+    """
+    Facteur entier de Image.reduce qui laisse l'image à au moins `gap` fois la cible.
+
+    Returns:
+        Facteur >= 1 (1 = pas de réduction)
+    """
+    ratio = min(source[0] / target[0], source[1] / target[1])
+    return max(1, int(ratio / gap))
+
+
+def decode_preview(file_path: Union[str, Path],
+                   size: Tuple[int, int],
+                   exact: bool = False,
+                   resample: int = DEFAULT_RESAMPLE,
+                   reducing_gap: float = REDUCING_GAP) -> Image.Image:
+    """
+    Décode une image directement à la taille d'affichage.
+
+    Args:
+        file_path: chemin de l'image source
+        size: (largeur, hauteur) cible
+        exact: True pour produire exactement `size` (prévisualisation),
+               False pour tenir dans `size` en gardant les proportions (vignette)
+        resample: filtre du rééchantillonnage final
+        reducing_gap: multiple de la cible auquel s'arrête la réduction entière
+
+    Returns:
+        Image PIL chargée, indépendante du fichier source
+
+    Raises:
+        FileNotFoundError, UnidentifiedImageError, OSError si la source est illisible
+    """
+    with Image.open(file_path) as img:
+        target = tuple(size) if exact else fit_size(img.size, size)
+        if img.format == 'JPEG':
+            # libjpeg décode directement à l'échelle 1/2, 1/4 ou 1/8
+            img.draft(img.mode, (int(target[0] * reducing_gap), int(target[1] * reducing_gap)))
+        img.load()
+
+        out = img
+        factor = reduce_factor(img.size, target, reducing_gap)
+        if factor > 1:
+            out = out.reduce(factor)
+        if out.size != target:
+            out = out.resize(target, resample)
+    # Une image chargée reste utilisable après fermeture du fichier
+    return out
+
+
+__all__ = [
+    'decode_preview',
+    'fit_size',
+    'reduce_factor',
+    'REDUCING_GAP',
+    'PREVIEW_REDUCING_GAP',
+    'PREVIEW_RESAMPLE',
+]
@@ -5,35 +5,240 @@ Gestionnaire centralisé de références PhotoImage.
 Tkinter garbage-collect les PhotoImage si on ne garde pas de référence.
 Ce module fournit une API propre pour gérer ces références sans les
 disperser partout dans le code (plus de `_image_refs.append()` partout).
+
+Le manager compte aussi la mémoire retenue (largeur x hauteur x 4 octets
+par image, par catégorie). Avec un budget global (`budget_bytes`), les
+images les moins récemment utilisées des catégories « évictables » sont
+libérées quand le budget est dépassé. Une image enregistrée avec une clé et
+une fonction `rematerialize` est recréée à la demande par get_ref() (ex :
+vignette réaffichée au défilement). Les clés retournées par `pinned` (ex :
+vignettes des lignes affichées à l'écran) ne sont jamais évincées.
+
+Le manager ne libère que sa propre référence : une image encore affichée
+par un widget resterait en mémoire. La fonction `on_evict` d'une image est
+appelée à son éviction pour que l'appelant retire l'image du widget.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Dict, List
-from PIL.ImageTk import PhotoImage
+from typing import TYPE_CHECKING, Any, Callable, Container, Dict, Hashable, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL.ImageTk import PhotoImage
 
 logger = logging.getLogger(__name__)
 
+# Octets par pixel d'une PhotoImage (RGBA)
+BYTES_PER_PIXEL = 4
+
+
+def image_bytes(ref: Any) -> int:
+    """Mémoire estimée d'une PhotoImage : largeur x hauteur x 4 (0 si inconnue)."""
+    try:
+        return int(ref.width()) * int(ref.height()) * BYTES_PER_PIXEL
+    except (AttributeError, TypeError, ValueError, RuntimeError):
+        return 0
+
+
+class _ImageRef:
+    """Référence conservée : image, taille, clé et date de dernière utilisation."""
+
+    __slots__ = ('ref', 'nbytes', 'key', 'rematerialize', 'on_evict', 'last_used')
+
+    def __init__(self, ref, nbytes: int, key: Optional[Hashable],
+                 rematerialize: Optional[Callable], on_evict: Optional[Callable], last_used: int):
+        self.ref = ref
+        self.nbytes = nbytes
+        self.key = key
+        self.rematerialize = rematerialize
+        self.on_evict = on_evict
+        self.last_used = last_used
+
 
 class ImageRefManager:
     """Gère les références PhotoImage pour éviter le garbage collection."""
 
-    def __init__(self):
-        """Initialise le manager."""
+    def __init__(self,
+                 budget_bytes: Optional[int] = None,
+                 evictable: Iterable[str] = ('thumbnails',),
+                 pinned: Optional[Callable[[], Container[Hashable]]] = None):
+        """
+        Initialise le manager.
+
+        Args:
+            budget_bytes: mémoire maximale retenue par toutes les catégories
+                          (None ou 0 = pas de limite)
+            evictable: catégories dont les images peuvent être libérées pour
+                       respecter le budget
+            pinned: retourne les clés à ne pas évincer (appelé à chaque
+                    application du budget)
+        """
         # Dictionnaire des listes de références par catégorie
-        self._refs: Dict[str, List[PhotoImage]] = {}
+        self._refs: Dict[str, List[_ImageRef]] = {}
+        self._bytes: Dict[str, int] = {}
+        # (catégorie, clé) -> référence vivante / (rematerialize, on_evict) d'une image évincée
+        self._keyed: Dict[Tuple[str, Hashable], _ImageRef] = {}
+        self._evicted: Dict[Tuple[str, Hashable], Tuple[Callable, Optional[Callable]]] = {}
+        self.budget_bytes = budget_bytes or None
+        self.evictable = set(evictable)
+        self.pinned = pinned
+        self._clock = 0
+        self.evictions = 0
+        self.rematerializations = 0
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
 
-    def add_ref(self, ref: PhotoImage, category: str = 'default') -> None:
+    def add_ref(self,
+                ref: PhotoImage,
+                category: str = 'default',
+                key: Optional[Hashable] = None,
+                rematerialize: Optional[Callable[[Hashable], Optional[PhotoImage]]] = None,
+                on_evict: Optional[Callable[[Hashable], None]] = None) -> None:
         """
         Ajoute une référence à une catégorie.
 
         Args:
             ref: PhotoImage à conserver
             category: catégorie pour grouper les références (ex: 'thumbnails', 'icons', 'backgrounds')
+            key: identifiant de l'image pour get_ref() (remplace l'image de même clé)
+            rematerialize: recrée l'image (appelé avec `key`) si elle a été évincée
+            on_evict: appelé avec `key` quand l'image est évincée (ex : retirer
+                      l'image du widget qui l'affiche, pour qu'elle soit libérée)
         """
-        if category not in self._refs:
-            self._refs[category] = []
-        self._refs[category].append(ref)
+        if key is not None:
+            previous = self._keyed.get((category, key))
+            if previous is not None:
+                self._remove_entry(category, previous)
+            self._evicted.pop((category, key), None)
+
+        entry = _ImageRef(ref, image_bytes(ref), key, rematerialize, on_evict, self._tick())
+        self._refs.setdefault(category, []).append(entry)
+        self._bytes[category] = self._bytes.get(category, 0) + entry.nbytes
+        if key is not None:
+            self._keyed[(category, key)] = entry
         logger.debug(f"Added PhotoImage ref to category '{category}' (total: {len(self._refs[category])})")
+        self._enforce_budget(keep=entry)
+
+    def get_ref(self, key: Hashable, category: str = 'default') -> Optional[PhotoImage]:
+        """
+        Retourne l'image enregistrée sous `key` (marquée comme utilisée), en la
+        recréant si elle a été évincée.
+
+        Returns:
+            PhotoImage, ou None si la clé est inconnue ou si la recréation échoue
+        """
+        entry = self._keyed.get((category, key))
+        if entry is not None:
+            entry.last_used = self._tick()
+            return entry.ref
+
+        evicted = self._evicted.pop((category, key), None)
+        if evicted is None:
+            return None
+        rematerialize, on_evict = evicted
+        ref = rematerialize(key)
+        if ref is None:
+            return None
+        self.rematerializations += 1
+        self.add_ref(ref, category, key=key, rematerialize=rematerialize, on_evict=on_evict)
+        return ref
+
+    def is_evicted(self, key: Hashable, category: str = 'default') -> bool:
+        """True si l'image de `key` a été évincée et peut être recréée par get_ref()."""
+        return (category, key) in self._evicted
+
+    def touch(self, ref: PhotoImage, category: str = 'default') -> bool:
+        """
+        Marque une image comme utilisée (elle sera évincée parmi les dernières).
+
+        Returns:
+            True si l'image est présente dans la catégorie
+        """
+        for entry in self._refs.get(category, ()):
+            if entry.ref is ref:
+                entry.last_used = self._tick()
+                return True
+        return False
+
+    def remove_ref(self, ref: PhotoImage, category: str = 'default') -> bool:
+        """
+        Retire une référence d'une catégorie (ex: PhotoImage remplacée).
+
+        Args:
+            ref: PhotoImage à libérer
+            category: catégorie de la référence
+
+        Returns:
+            True si la référence a été trouvée et retirée
+        """
+        refs = self._refs.get(category)
+        if not refs:
+            return False
+        for entry in refs:
+            if entry.ref is ref:
+                self._remove_entry(category, entry)
+                logger.debug(f"Removed PhotoImage ref from category '{category}' (total: {len(refs)})")
+                return True
+        return False
+
+    def _remove_entry(self, category: str, entry: _ImageRef) -> None:
+        refs = self._refs[category]
+        for i, existing in enumerate(refs):
+            if existing is entry:
+                del refs[i]
+                break
+        self._bytes[category] -= entry.nbytes
+        if entry.key is not None and self._keyed.get((category, entry.key)) is entry:
+            del self._keyed[(category, entry.key)]
+
+    def _enforce_budget(self, keep: Optional[_ImageRef] = None) -> int:
+        """
+        Évince les images les moins récemment utilisées des catégories
+        évictables tant que le budget est dépassé (`keep` et les clés
+        retournées par `pinned` sont épargnées).
+
+        Returns:
+            Nombre d'images évincées
+        """
+        if not self.budget_bytes:
+            return 0
+        count = 0
+        pinned = self.pinned() if self.pinned is not None else ()
+        while self.get_bytes() > self.budget_bytes:
+            candidates = [(entry.last_used, category, entry)
+                          for category in self.evictable
+                          for entry in self._refs.get(category, ())
+                          if entry is not keep and (entry.key is None or entry.key not in pinned)]
+            if not candidates:
+                break
+            _, category, entry = min(candidates, key=lambda c: c[0])
+            self._remove_entry(category, entry)
+            if entry.key is not None and entry.rematerialize is not None:
+                self._evicted[(category, entry.key)] = (entry.rematerialize, entry.on_evict)
+            if entry.on_evict is not None:
+                try:
+                    entry.on_evict(entry.key)
+                except Exception as e:
+                    logger.exception(f"on_evict failed for {entry.key}", exc_info=e)
+            count += 1
+        if count:
+            self.evictions += count
+            logger.debug(f"Evicted {count} PhotoImage refs (total: {self.get_bytes()} bytes, "
+                         f"budget: {self.budget_bytes} bytes)")
+        return count
+
+    def set_budget(self, budget_bytes: Optional[int]) -> int:
+        """
+        Change le budget mémoire (None ou 0 = pas de limite) et l'applique.
+
+        Returns:
+            Nombre d'images évincées
+        """
+        self.budget_bytes = budget_bytes or None
+        return self._enforce_budget()
 
     def clear_category(self, category: str) -> int:
         """
@@ -49,6 +254,11 @@ class ImageRefManager:
             return 0
         count = len(self._refs[category])
         self._refs[category].clear()
+        self._bytes[category] = 0
+        for index in [k for k in self._keyed if k[0] == category]:
+            del self._keyed[index]
+        for index in [k for k in self._evicted if k[0] == category]:
+            del self._evicted[index]
         logger.debug(f"Cleared {count} PhotoImage refs from category '{category}'")
         return count
 
@@ -61,6 +271,9 @@ class ImageRefManager:
         """
         total = sum(len(refs) for refs in self._refs.values())
         self._refs.clear()
+        self._bytes.clear()
+        self._keyed.clear()
+        self._evicted.clear()
         logger.debug(f"Cleared all {total} PhotoImage refs")
         return total
 
@@ -78,13 +291,50 @@ class ImageRefManager:
             return sum(len(refs) for refs in self._refs.values())
         return len(self._refs.get(category, []))
 
+    def get_bytes(self, category: str = None) -> int:
+        """
+        Retourne la mémoire retenue (octets, estimation largeur x hauteur x 4).
+
+        Args:
+            category: catégorie (None = toutes)
+        """
+        if category is None:
+            return sum(self._bytes.values())
+        return self._bytes.get(category, 0)
+
     def get_categories(self) -> list:
         """Retourne les catégories existantes."""
         return list(self._refs.keys())
 
+    def get_stats(self) -> dict:
+        """
+        Statistiques pour le suivi mémoire.
+
+        Returns:
+            dict : count, bytes, budget_bytes, evictions, rematerializations,
+            evicted (images recréables en attente) et categories
+            ({catégorie: {count, bytes, evictable}})
+        """
+        return {
+            'count': self.get_count(),
+            'bytes': self.get_bytes(),
+            'budget_bytes': self.budget_bytes,
+            'evictions': self.evictions,
+            'rematerializations': self.rematerializations,
+            'evicted': len(self._evicted),
+            'categories': {
+                category: {
+                    'count': len(refs),
+                    'bytes': self._bytes.get(category, 0),
+                    'evictable': category in self.evictable,
+                }
+                for category, refs in self._refs.items()
+            },
+        }
+
     def __repr__(self) -> str:
         details = ", ".join(f"{cat}: {len(refs)}" for cat, refs in self._refs.items())
         return f"ImageRefManager({details})"
 
 
-__all__ = ['ImageRefManager']
+__all__ = ['ImageRefManager', 'image_bytes']
@@ -194,6 +194,60 @@ class PathResolver:
         logger.debug(f"Falling back to i18n/{lang}.json")
         return i18n_file
 
+    @classmethod
+    def resolve_cache_dir(cls) -> Path:
+        """
+        Résout le répertoire de cache persistant (vignettes, etc.).
+
+        Stratégie:
+        1. Si PyInstaller: tempdir/CadreSelecteur/cache (_MEIPASS est en lecture seule)
+        2. Sinon: resources/cache/ du package
+
+        Le répertoire n'est pas créé ici : c'est au consommateur de le faire.
+
+        Returns:
+            Path absolue au répertoire de cache
+        """
+        cache_key = 'cache_dir'
+        if cache_key in cls._cache:
+            return cls._cache[cache_key]
+
+        if cls.is_frozen():
+            import tempfile
+            cache_dir = Path(tempfile.gettempdir()) / 'CadreSelecteur' / 'cache'
+        else:
+            cache_dir = cls.resolve_resources_dir() / 'cache'
+
+        logger.debug(f"Resolved cache_dir: {cache_dir}")
+        cls._cache[cache_key] = cache_dir
+        return cache_dir
+
+    @classmethod
+    def resolve_base_dir(cls) -> Path:
+        """
+        Résout le répertoire de base contenant Templates/ et Cadres/.
+
+        Stratégie:
+        1. Si PyInstaller: répertoire de l'exécutable (données modifiables à côté du .exe)
+        2. Sinon: répertoire du package
+
+        Returns:
+            Path absolue au répertoire de base
+        """
+        if cls.is_frozen():
+            return Path(sys.executable).resolve().parent
+        return cls._BASE_DIR
+
+    @classmethod
+    def resolve_templates_dir(cls) -> Path:
+        """Résout le répertoire Templates/ (tous les cadres disponibles)."""
+        return cls.resolve_base_dir() / 'Templates'
+
+    @classmethod
+    def resolve_frames_dir(cls) -> Path:
+        """Résout le répertoire Cadres/ (cadre installé, lu par pibooth)."""
+        return cls.resolve_base_dir() / 'Cadres'
+
     @classmethod
     def clear_cache(cls):
         """Vide le cache. Utile pour les tests."""
@@ -222,10 +276,28 @@ def resolve_i18n_file(lang: str) -> Path:
     return PathResolver.resolve_i18n_file(lang)
 
 
+def resolve_cache_dir() -> Path:
+    """Résout le répertoire de cache persistant (API publique)."""
+    return PathResolver.resolve_cache_dir()
+
+
+def resolve_templates_dir() -> Path:
+    """Résout le répertoire Templates/ (API publique)."""
+    return PathResolver.resolve_templates_dir()
+
+
+def resolve_frames_dir() -> Path:
+    """Résout le répertoire Cadres/ (API publique)."""
+    return PathResolver.resolve_frames_dir()
+
+
 __all__ = [
     'PathResolver',
     'resolve_resources_dir',
     'resolve_file_in_resources',
     'resolve_file_in_package',
     'resolve_i18n_file',
+    'resolve_cache_dir',
+    'resolve_templates_dir',
+    'resolve_frames_dir',
 ]
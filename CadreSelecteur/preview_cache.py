@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Cache mémoire des prévisualisations plein écran du sélecteur.
+
+Un clic sur une vignette ouvre une prévisualisation 720x480 ; les
+opérateurs passent sans cesse d'un cadre à l'autre parmi quelques-uns.
+Les images déjà réduites sont conservées en mémoire (images PIL, LRU borné
+par un budget en octets), indexées par (chemin, mtime, taille du fichier,
+dimensions cibles) : un cadre modifié sur disque produit une nouvelle clé,
+l'ancienne entrée vieillit puis est évincée.
+
+Le cache est partagé avec le thread de préchargement (cf. background_worker).
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+from PIL import Image
+
+from .image_decode import decode_preview, PREVIEW_REDUCING_GAP, PREVIEW_RESAMPLE
+
+logger = logging.getLogger(__name__)
+
+# Dimensions par défaut de la prévisualisation
+PREVIEW_SIZE = (720, 480)
+
+
+def image_bytes(image: Image.Image) -> int:
+    """Taille mémoire approximative des pixels d'une image PIL."""
+    return image.width * image.height * len(image.getbands())
+
+
+def load_preview(file_path: Union[str, Path], size: Tuple[int, int]) -> Image.Image:
+    """Décode une prévisualisation exactement à la taille demandée."""
+    return decode_preview(file_path, size, exact=True,
+                          resample=PREVIEW_RESAMPLE,
+                          reducing_gap=PREVIEW_REDUCING_GAP)
+
+
+class PreviewCache:
+    """Cache LRU de prévisualisations PIL, borné en octets."""
+
+    def __init__(self,
+                 max_bytes: int,
+                 loader: Callable[[Union[str, Path], Tuple[int, int]], Image.Image] = load_preview):
+        """
+        Args:
+            max_bytes: budget mémoire (octets)
+            loader: fonction (chemin, taille) -> Image utilisée en cas d'absence
+        """
+        self.max_bytes = int(max_bytes)
+        self.loader = loader
+        self._entries: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(file_path: Union[str, Path], size: Tuple[int, int]) -> Optional[tuple]:
+        """
+        Clé de cache (chemin absolu, mtime, taille du fichier, dimensions).
+
+        Returns:
+            Clé, ou None si le fichier est inaccessible
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size, int(size[0]), int(size[1])
+
+    def get(self, file_path: Union[str, Path], size: Tuple[int, int] = PREVIEW_SIZE) -> Optional[Image.Image]:
+        """Retourne la prévisualisation en cache, ou None."""
+        key = self.key_for(file_path, size)
+        if key is None:
+            return None
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return image
+
+    def get_or_create(self,
+                      file_path: Union[str, Path],
+                      size: Tuple[int, int] = PREVIEW_SIZE) -> Image.Image:
+        """
+        Retourne la prévisualisation depuis le cache, ou la décode et la met en cache.
+
+        Raises:
+            FileNotFoundError, UnidentifiedImageError, OSError si la source est illisible
+        """
+        image = self.get(file_path, size)
+        if image is not None:
+            return image
+        key = self.key_for(file_path, size)
+        image = self.loader(file_path, size)
+        with self._lock:
+            self.misses += 1
+        if key is not None:
+            self._put(key, image)
+        return image
+
+    def contains(self, file_path: Union[str, Path], size: Tuple[int, int] = PREVIEW_SIZE) -> bool:
+        """True si la prévisualisation est déjà en cache (sans la marquer comme utilisée)."""
+        key = self.key_for(file_path, size)
+        with self._lock:
+            return key is not None and key in self._entries
+
+    def _put(self, key: tuple, image: Image.Image) -> None:
+        size = image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= image_bytes(previous)
+            self._entries[key] = image
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= image_bytes(evicted)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Octets actuellement occupés par les prévisualisations."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (f"PreviewCache(entries={len(self._entries)}, bytes={self._total_bytes}/{self.max_bytes}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+__all__ = ['PreviewCache', 'load_preview', 'image_bytes', 'PREVIEW_SIZE']
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Inventaire des projets de cadres du répertoire Templates.
+
+Un seul parcours `os.scandir` du répertoire Templates (puis de chaque
+répertoire de projet) recense les fichiers de chaque projet avec leur rôle
+et leurs informations `stat`. Le sélecteur interroge ensuite cet inventaire
+au lieu de relancer un `listdir` par opération, ce qui compte sur une carte
+SD lente ou un montage réseau.
+
+Rôles reconnus dans un répertoire de projet :
+- frame_1      : cadre une photo (`*_1.png`)
+- frame_4      : cadre quatre photos (`*_4.png`)
+- project_json : projet de l'éditeur (`*.json`)
+- template_xml : template pibooth associé (`*.xml`)
+- asset        : tout autre fichier (images importées, etc.)
+
+Les entrées cachées (nom commençant par '.') sont ignorées.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ROLE_FRAME_1 = 'frame_1'
+ROLE_FRAME_4 = 'frame_4'
+ROLE_PROJECT_JSON = 'project_json'
+ROLE_TEMPLATE_XML = 'template_xml'
+ROLE_ASSET = 'asset'
+
+# Suffixe -> rôle (les rôles uniques d'un projet)
+_ROLE_SUFFIXES = (
+    ('_1.png', ROLE_FRAME_1),
+    ('_4.png', ROLE_FRAME_4),
+    ('.json', ROLE_PROJECT_JSON),
+    ('.xml', ROLE_TEMPLATE_XML),
+)
+
+
+def file_role(filename: str) -> str:
+    """Retourne le rôle d'un fichier de projet d'après son nom."""
+    for suffix, role in _ROLE_SUFFIXES:
+        if filename.endswith(suffix):
+            return role
+    return ROLE_ASSET
+
+
+class ProjectFile:
+    """Fichier d'un projet avec son rôle et ses informations stat."""
+
+    __slots__ = ('name', 'path', 'role', 'size', 'mtime_ns')
+
+    def __init__(self, name: str, path: str, role: str, size: int, mtime_ns: int):
+        self.name = name
+        self.path = path
+        self.role = role
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def __repr__(self) -> str:
+        return f"ProjectFile({self.name!r}, role={self.role!r}, size={self.size})"
+
+
+class Project:
+    """Projet de cadre : un répertoire de Templates et ses fichiers classés par rôle."""
+
+    def __init__(self, name: str, path: str):
+        """
+        Args:
+            name: nom du répertoire du projet
+            path: chemin complet du répertoire
+        """
+        self.name = name
+        self.path = path
+        # rôle unique -> fichier
+        self.files: Dict[str, ProjectFile] = {}
+        self.assets: List[ProjectFile] = []
+
+    def add_file(self, project_file: ProjectFile) -> None:
+        """
+        Range un fichier selon son rôle. Si plusieurs fichiers ont le même rôle,
+        celui qui porte le nom du projet est préféré, sinon le premier par ordre alphabétique.
+        """
+        if project_file.role == ROLE_ASSET:
+            self.assets.append(project_file)
+            return
+        current = self.files.get(project_file.role)
+        if current is None or (not current.name.startswith(self.name)
+                               and project_file.name.startswith(self.name)):
+            self.files[project_file.role] = project_file
+
+    def _path_for(self, role: str) -> Optional[str]:
+        project_file = self.files.get(role)
+        return project_file.path if project_file else None
+
+    @property
+    def frame_1(self) -> Optional[str]:
+        """Chemin du cadre une photo (_1.png)."""
+        return self._path_for(ROLE_FRAME_1)
+
+    @property
+    def frame_4(self) -> Optional[str]:
+        """Chemin du cadre quatre photos (_4.png)."""
+        return self._path_for(ROLE_FRAME_4)
+
+    @property
+    def json(self) -> Optional[str]:
+        """Chemin du projet de l'éditeur (.json), None si le projet n'est pas éditable."""
+        return self._path_for(ROLE_PROJECT_JSON)
+
+    @property
+    def xml(self) -> Optional[str]:
+        """Chemin du template pibooth propre au projet (.xml)."""
+        return self._path_for(ROLE_TEMPLATE_XML)
+
+    @property
+    def is_complete(self) -> bool:
+        """Un projet est installable s'il contient ses deux cadres."""
+        return ROLE_FRAME_1 in self.files and ROLE_FRAME_4 in self.files
+
+    @property
+    def signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Empreinte (nom, taille, mtime) de tous les fichiers, pour détecter les modifications."""
+        all_files = list(self.files.values()) + self.assets
+        return tuple(sorted((f.name, f.size, f.mtime_ns) for f in all_files))
+
+    def __repr__(self) -> str:
+        return f"Project({self.name!r}, roles={sorted(self.files)}, assets={len(self.assets)})"
+
+
+def scan_project_dir(name: str, path: Union[str, Path]) -> Project:
+    """
+    Inventorie un répertoire de projet (un seul scandir).
+
+    Args:
+        name: nom du projet
+        path: chemin du répertoire
+
+    Raises:
+        OSError si le répertoire est illisible
+    """
+    project = Project(name, str(path))
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            st = entry.stat()
+        except OSError:
+            continue
+        project.add_file(ProjectFile(entry.name, entry.path, file_role(entry.name),
+                                     st.st_size, st.st_mtime_ns))
+    return project
+
+
+class ProjectRepository:
+    """Inventaire des projets d'un répertoire Templates, construit en un seul parcours."""
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Args:
+            root: répertoire Templates contenant un sous-répertoire par projet
+        """
+        self.root = Path(root)
+        self._projects: Dict[str, Project] = {}
+
+    def scan(self) -> 'ProjectRepository':
+        """
+        (Re)construit l'inventaire complet.
+
+        Returns:
+            self (pour chaîner : ProjectRepository(root).scan())
+
+        Raises:
+            FileNotFoundError si le répertoire racine n'existe pas
+        """
+        projects = {}
+        with os.scandir(self.root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+                projects[entry.name] = scan_project_dir(entry.name, entry.path)
+            except OSError as e:
+                logger.debug(f"Could not scan project directory {entry.path}: {type(e).__name__}")
+        self._projects = projects
+        logger.debug(f"ProjectRepository: {len(projects)} projects scanned in {self.root}")
+        return self
+
+    def scan_project(self, name: str) -> Optional[Project]:
+        """
+        Réinventorie un seul projet (ex : juste avant de l'installer).
+
+        Returns:
+            Le projet à jour, ou None s'il n'existe plus
+        """
+        path = self.root / name
+        try:
+            project = scan_project_dir(name, path)
+        except OSError:
+            self._projects.pop(name, None)
+            return None
+        self._projects[name] = project
+        return project
+
+    def get(self, name: str) -> Optional[Project]:
+        """Retourne le projet `name` de l'inventaire, ou None."""
+        return self._projects.get(name)
+
+    def projects(self) -> List[Project]:
+        """Tous les projets (répertoires), triés par nom."""
+        return [self._projects[name] for name in sorted(self._projects)]
+
+    def complete_projects(self) -> List[Project]:
+        """Projets installables (avec _1.png et _4.png), triés par nom."""
+        return [p for p in self.projects() if p.is_complete]
+
+    def names(self) -> List[str]:
+        """Noms des projets, triés."""
+        return sorted(self._projects)
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._projects
+
+    def __repr__(self) -> str:
+        return f"ProjectRepository({self.root}, projects={len(self._projects)})"
+
+
+__all__ = [
+    'ProjectRepository',
+    'Project',
+    'ProjectFile',
+    'scan_project_dir',
+    'file_role',
+    'ROLE_FRAME_1',
+    'ROLE_FRAME_4',
+    'ROLE_PROJECT_JSON',
+    'ROLE_TEMPLATE_XML',
+    'ROLE_ASSET',
+]
@@ -1,84 +1,94 @@
 # -*- coding: utf-8 -*-
-""" splash screen """
+""" splash screen
+
+    Écran de démarrage affiché dans le processus de l'application (Toplevel
+    de la fenêtre principale, masquée pendant sa construction). Il affiche
+    l'étape de démarrage en cours et est fermé dès que le sélecteur est prêt
+    (cf. __main__.run_gui), sans délai fixe.
+"""
 
 from os import path
-from time import sleep
 import tkinter as tk
 from PIL import Image, ImageTk
 import logging
-from .logging_config import LOG_PATH  # noqa: F401
 from .config_loader import RESOURCES_DIR
+from .i18n import t
 
 logger = logging.getLogger(__name__)
 
+SPLASH_WIDTH = 500
+SPLASH_HEIGHT = 250
+
+# Durée maximale d'attente des vignettes avant d'afficher le sélecteur (ms)
+MAX_WAIT_MS = 3000
+
+
+class SplashScreen:
+    """Fenêtre de démarrage sans décoration, centrée, avec l'étape en cours."""
+
+    def __init__(self, master: tk.Misc):
+        """
+        Crée et affiche immédiatement l'écran de démarrage.
 
-def splash(timeout_ms: int = 5000) -> None:
-    """
-    Affiche un écran de splash avec timeout.
-
-    IMPORTANT: Cette fonction NE DOIT PAS appeler mainloop() indéfiniment
-    car elle bloquerait le processus parent. À la place, elle affiche
-    la fenêtre et attend avec un timeout.
-
-    Args:
-        timeout_ms: Timeout en millisecondes avant fermeture automatique
-    """
-    root = tk.Tk()
-    root.overrideredirect(True)
-    root.geometry("500x250+600+300")
-
-    try:
-        image = Image.open(path.join(RESOURCES_DIR, 'cadreSelecteur.png'))
-        photo = ImageTk.PhotoImage(image)
-        label = tk.Label(root, image=photo)
-        label.image = photo
-        label.pack(padx=5, pady=5)
-    except Exception as e:
-        logger.error(f'Erreur de chargement image : {e}')
-        pass
-
-    tk.Label(
-        root,
-        text="Cadre Selecteur / Cadre Editeur",
-        font=("Arial", 15)
-    ).pack(padx=5, pady=5)
-
-    tk.Label(
-        root,
-        text="Chargement en cours...\nVeuillez patienter...",
-        font=("Arial", 12)
-    ).pack(padx=5, pady=5)
-
-    # Afficher la fenêtre
-    root.update()
-    logger.debug(f"Splash: fenêtre affichée, timeout={timeout_ms}ms")
-
-    # Attendre avec timeout et traiter les événements
-    # Cela permet au process parent de nous terminer via signal
-    elapsed = 0
-    step = 100  # ms par itération
-
-    while elapsed < timeout_ms:
+        Args:
+            master: fenêtre principale (généralement masquée par withdraw())
+        """
+        self.window = tk.Toplevel(master)
+        self.window.overrideredirect(True)
+        x = (self.window.winfo_screenwidth() - SPLASH_WIDTH) // 2
+        y = (self.window.winfo_screenheight() - SPLASH_HEIGHT) // 2
+        self.window.geometry(f"{SPLASH_WIDTH}x{SPLASH_HEIGHT}+{x}+{y}")
+
+        try:
+            with Image.open(path.join(RESOURCES_DIR, 'cadreSelecteur.png')) as image:
+                photo = ImageTk.PhotoImage(image, master=self.window)
+            label = tk.Label(self.window, image=photo)
+            label.image = photo
+            label.pack(padx=5, pady=5)
+        except (OSError, tk.TclError) as e:
+            logger.error(f'Erreur de chargement image : {e}')
+
+        tk.Label(
+            self.window,
+            text="Cadre Selecteur / Cadre Editeur",
+            font=("Arial", 15)
+        ).pack(padx=5, pady=5)
+
+        self.phase = tk.StringVar(self.window, value=t('splash.phase.start'))
+        tk.Label(
+            self.window,
+            textvariable=self.phase,
+            font=("Arial", 12)
+        ).pack(padx=5, pady=5)
+
+        # Afficher la fenêtre avant la suite du démarrage
+        self.window.update()
+        logger.debug("Splash: fenêtre affichée")
+
+    def set_phase(self, text: str) -> None:
+        """
+        Affiche l'étape de démarrage en cours.
+
+        Seul le réaffichage est traité (update_idletasks) : les événements
+        utilisateur attendent la fin du démarrage.
+
+        Args:
+            text: texte de l'étape (déjà traduit)
+        """
+        logger.debug(f"Splash: {text}")
         try:
-            # Traiter les événements Tkinter
-            root.update()
+            self.phase.set(text)
+            self.window.update_idletasks()
         except tk.TclError:
-            # Fenêtre fermée par le parent
-            logger.debug("Splash: fenêtre fermée")
-            return
+            # Fenêtre déjà fermée
+            pass
 
-        # Attendre un peu avant la prochaine itération
-        # root.after(step)
-        sleep(step / 1000)
-        elapsed += step
-
-    # Timeout atteint, fermer proprement
-    logger.debug("Splash: timeout atteint, fermeture")
-    try:
-        root.destroy()
-    except Exception as e:
-        logger.warning(f"Splash: erreur lors de la destruction - {e}")
+    def close(self) -> None:
+        """Ferme l'écran de démarrage (sans effet s'il est déjà fermé)."""
+        try:
+            self.window.destroy()
+        except tk.TclError as e:
+            logger.debug(f"Splash: déjà fermé - {e}")
 
 
-if __name__ == "__main__":
-    splash()
+__all__ = ['SplashScreen', 'MAX_WAIT_MS']
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Atlas de vignettes : plusieurs vignettes par PhotoImage.
+
+Au lieu d'une PhotoImage Tk par vignette, les vignettes sont rangées dans
+les cases d'une grille, sur quelques grandes pages. Chaque page existe deux
+fois : une image PIL (où sont collées les vignettes, sans appel Tk) et une
+PhotoImage (ce que Tk affiche). Les pages modifiées sont recopiées dans leur
+PhotoImage en un seul appel (flush), regroupé par `scheduler` (after_idle) :
+un rafraîchissement coûte un appel Tk par page modifiée, quel que soit le
+nombre de vignettes.
+
+L'affichage d'une case se fait par un item image de canvas, décalé de
+(-x, -y) dans un canvas de la taille de la vignette qui ne montre que la
+case (cf. ProjectRow).
+
+Les cases sont recyclées dans l'ordre LRU quand l'atlas est plein.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Grille d'une page (cases) : 8 x 8 vignettes 128x85 = page 1024x680
+DEFAULT_COLUMNS = 8
+DEFAULT_ROWS = 8
+
+
+class AtlasRegion:
+    """Emplacement d'une vignette dans l'atlas : page et rectangle (pixels)."""
+
+    __slots__ = ('page', 'x', 'y', 'width', 'height')
+
+    def __init__(self, page: int, x: int, y: int, width: int, height: int):
+        self.page = page
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def __repr__(self) -> str:
+        return f"AtlasRegion(page={self.page}, x={self.x}, y={self.y}, size={self.width}x{self.height})"
+
+
+class _Slot:
+    __slots__ = ('index', 'image', 'region')
+
+    def __init__(self, index: int, image: Image.Image, region: AtlasRegion):
+        self.index = index
+        self.image = image
+        self.region = region
+
+
+class ThumbnailAtlas:
+    """Range des vignettes PIL dans quelques grandes PhotoImage."""
+
+    def __init__(self,
+                 cell_size: Tuple[int, int],
+                 capacity: int,
+                 columns: int = DEFAULT_COLUMNS,
+                 rows: int = DEFAULT_ROWS,
+                 photo_factory: Optional[Callable[[Image.Image], Any]] = None,
+                 scheduler: Optional[Callable[[Callable[[], None]], Any]] = None):
+        """
+        Args:
+            cell_size: (largeur, hauteur) maximales d'une vignette
+            capacity: nombre maximal de vignettes (arrondi à des pages entières)
+            columns, rows: grille d'une page
+            photo_factory: crée la PhotoImage d'une page à partir de l'image PIL
+                           (défaut : ImageTk.PhotoImage, importé à la demande)
+            scheduler: planifie flush() (ex : widget.after_idle) ; None = flush() explicite
+        """
+        self.cell_width, self.cell_height = int(cell_size[0]), int(cell_size[1])
+        self.columns = max(1, int(columns))
+        self.rows = max(1, int(rows))
+        self.slots_per_page = self.columns * self.rows
+        self.page_count = max(1, -(-int(capacity) // self.slots_per_page))
+        self.capacity = self.page_count * self.slots_per_page
+        self.page_size = (self.columns * self.cell_width, self.rows * self.cell_height)
+        self.photo_factory = photo_factory
+        self.scheduler = scheduler
+
+        self._pages: List[Optional[Image.Image]] = [None] * self.page_count
+        self._photos: List[Any] = [None] * self.page_count
+        self._dirty = set()
+        self._flush_scheduled = False
+        self._slots: "OrderedDict[Hashable, _Slot]" = OrderedDict()
+        self._free: List[int] = list(range(self.capacity - 1, -1, -1))
+        # Appels Tk effectués (création ou recopie d'une page)
+        self.tk_calls = 0
+
+    def _region_for(self, index: int, size: Tuple[int, int]) -> AtlasRegion:
+        page, cell = divmod(index, self.slots_per_page)
+        row, column = divmod(cell, self.columns)
+        return AtlasRegion(page, column * self.cell_width, row * self.cell_height, size[0], size[1])
+
+    def region(self, key: Hashable) -> Optional[AtlasRegion]:
+        """Emplacement de la vignette `key` (marquée comme utilisée), ou None."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        self._slots.move_to_end(key)
+        return slot.region
+
+    def add(self, key: Hashable, image: Image.Image) -> AtlasRegion:
+        """
+        Range une vignette dans l'atlas (sans appel Tk) ; sans effet si cette
+        même image y est déjà.
+
+        Args:
+            key: identifiant de la vignette (ex : (projet, 0))
+            image: vignette PIL, au plus de la taille d'une case
+
+        Returns:
+            Emplacement de la vignette
+
+        Raises:
+            ValueError si l'image dépasse la taille d'une case
+        """
+        if image.width > self.cell_width or image.height > self.cell_height:
+            raise ValueError(f"Thumbnail {image.size} larger than atlas cell "
+                             f"{(self.cell_width, self.cell_height)}")
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+            if slot.image is image:
+                return slot.region
+            index = slot.index
+        else:
+            if not self._free:
+                evicted, old = self._slots.popitem(last=False)
+                logger.debug(f"Atlas full, recycling slot of {evicted!r}")
+                self._free.append(old.index)
+            index = self._free.pop()
+
+        region = self._region_for(index, image.size)
+        page = self._pages[region.page]
+        if page is None:
+            page = self._pages[region.page] = Image.new('RGBA', self.page_size, (0, 0, 0, 0))
+        # effacer la case (vignette précédente éventuellement plus grande)
+        page.paste((0, 0, 0, 0), (region.x, region.y, region.x + self.cell_width, region.y + self.cell_height))
+        page.paste(image.convert('RGBA') if image.mode != 'RGBA' else image, (region.x, region.y))
+        self._slots[key] = _Slot(index, image, region)
+        self._mark_dirty(region.page)
+        return region
+
+    def discard(self, key: Hashable) -> bool:
+        """Libère la case d'une vignette (le contenu de la page n'est pas modifié)."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        self._free.append(slot.index)
+        return True
+
+    def clear(self) -> None:
+        """Libère toutes les cases (les pages et PhotoImage sont conservées)."""
+        self._slots.clear()
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def photo(self, page: int):
+        """
+        PhotoImage d'une page, créée au premier besoin avec le contenu courant.
+
+        Returns:
+            PhotoImage (ou None si la page n'a jamais reçu de vignette)
+        """
+        photo = self._photos[page]
+        if photo is None and self._pages[page] is not None:
+            photo = self._photos[page] = self._create_photo(self._pages[page])
+            self.tk_calls += 1
+            self._dirty.discard(page)
+        return photo
+
+    def photos(self) -> List[Any]:
+        """PhotoImage déjà créées (pour en garder la référence)."""
+        return [p for p in self._photos if p is not None]
+
+    def flush(self) -> int:
+        """
+        Recopie chaque page modifiée dans sa PhotoImage (un appel Tk par page).
+
+        Returns:
+            Nombre de pages recopiées
+        """
+        self._flush_scheduled = False
+        count = 0
+        for page in sorted(self._dirty):
+            photo = self._photos[page]
+            if photo is not None:
+                photo.paste(self._pages[page])
+                self.tk_calls += 1
+                count += 1
+        self._dirty.clear()
+        return count
+
+    def _mark_dirty(self, page: int) -> None:
+        self._dirty.add(page)
+        if self.scheduler is not None and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.scheduler(self.flush)
+
+    def _create_photo(self, image: Image.Image):
+        if self.photo_factory is not None:
+            return self.photo_factory(image)
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(image)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def stats(self) -> Dict[str, int]:
+        """Occupation de l'atlas et nombre d'appels Tk effectués."""
+        return {
+            'thumbnails': len(self._slots),
+            'capacity': self.capacity,
+            'pages': sum(1 for p in self._pages if p is not None),
+            'photos': len(self.photos()),
+            'tk_calls': self.tk_calls,
+        }
+
+
+__all__ = ['ThumbnailAtlas', 'AtlasRegion']
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Cache disque persistant des vignettes du sélecteur.
+
+Décoder un PNG 1800x1200 pour n'en garder qu'une vignette de 128x85 coûte
+cher, surtout sur une carte SD de Raspberry Pi. Ce module conserve les
+vignettes déjà calculées dans un répertoire de cache, sous forme de petits
+PNG, et ne redécode l'image source que lorsqu'elle a changé.
+
+La clé d'une vignette dépend :
+- du chemin absolu du fichier source
+- de sa date de modification (mtime en ns) et de sa taille
+- des dimensions de vignette demandées (THUMBNAIL_H / THUMBNAIL_L)
+
+Le cache est borné en taille : au-delà du budget, les entrées les moins
+récemment utilisées sont supprimées.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+from PIL import Image
+
+from .image_decode import decode_preview
+
+logger = logging.getLogger(__name__)
+
+# Budget par défaut du cache (octets)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+_CACHE_SUFFIX = '.png'
+
+
+def make_thumbnail(file_path: Union[str, Path], size: Tuple[int, int]) -> Image.Image:
+    """
+    Décode une image et retourne sa vignette (sans passer par le cache).
+
+    Args:
+        file_path: chemin de l'image source
+        size: dimensions maximales (largeur, hauteur) de la vignette
+
+    Returns:
+        Image PIL de la vignette, entièrement chargée en mémoire
+    """
+    return decode_preview(file_path, size)
+
+
+class ThumbnailCache:
+    """Cache disque des vignettes, indexé par (chemin, mtime, taille, dimensions)."""
+
+    def __init__(self,
+                 cache_dir: Union[str, Path],
+                 size: Tuple[int, int],
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: répertoire où stocker les vignettes (créé si besoin)
+            size: dimensions (largeur, hauteur) des vignettes
+            max_bytes: taille maximale du cache sur disque (octets)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.size = (int(size[0]), int(size[1]))
+        self.max_bytes = int(max_bytes)
+        # Total courant (octets) : calculé paresseusement au premier besoin
+        self._total_bytes: Optional[int] = None
+        # Le cache est partagé par les threads de décodage (cf. background_worker)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Calcule la clé de cache d'un fichier source.
+
+        Args:
+            file_path: chemin de l'image source
+
+        Returns:
+            Clé hexadécimale, ou None si le fichier est inaccessible
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        raw = (f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}|"
+               f"{self.size[0]}x{self.size[1]}")
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_CACHE_SUFFIX}"
+
+    def get(self, file_path: Union[str, Path]) -> Optional[Image.Image]:
+        """
+        Retourne la vignette en cache pour ce fichier, ou None (cache miss).
+
+        Args:
+            file_path: chemin de l'image source
+        """
+        key = self.key_for(file_path)
+        if key is None:
+            return None
+        entry = self._entry_path(key)
+        try:
+            with Image.open(entry) as thumb:
+                thumb.load()
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        # Mettre à jour la date d'accès pour l'éviction LRU
+        # (les montages noatime ne mettent pas à jour st_atime)
+        try:
+            os.utime(entry, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return thumb
+
+    def put(self, file_path: Union[str, Path], image: Image.Image) -> None:
+        """
+        Enregistre une vignette dans le cache.
+
+        Args:
+            file_path: chemin de l'image source
+            image: vignette à enregistrer
+        """
+        key = self.key_for(file_path)
+        if key is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = self._entry_path(key)
+            # Écriture dans un fichier temporaire puis renommage atomique
+            tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            image.save(tmp, format='PNG', compress_level=1)
+            os.replace(tmp, entry)
+            written = entry.stat().st_size
+        except OSError as e:
+            logger.debug(f"Thumbnail cache write failed for {file_path}: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += written
+            if self._get_total_bytes() > self.max_bytes:
+                self._evict_locked()
+
+    def get_or_create(self,
+                      file_path: Union[str, Path],
+                      factory: Optional[Callable[[Union[str, Path], Tuple[int, int]], Image.Image]] = None
+                      ) -> Image.Image:
+        """
+        Retourne la vignette depuis le cache, ou la génère et la met en cache.
+
+        Args:
+            file_path: chemin de l'image source
+            factory: fonction (chemin, taille) -> Image ; make_thumbnail par défaut
+
+        Raises:
+            FileNotFoundError, UnidentifiedImageError, OSError si la source est illisible
+        """
+        thumb = self.get(file_path)
+        if thumb is not None:
+            return thumb
+        self.misses += 1
+        thumb = (factory or make_thumbnail)(file_path, self.size)
+        self.put(file_path, thumb)
+        return thumb
+
+    def _iter_entries(self):
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(_CACHE_SUFFIX):
+                        yield entry
+        except FileNotFoundError:
+            return
+
+    def _get_total_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(e.stat().st_size for e in self._iter_entries())
+        return self._total_bytes
+
+    def evict(self) -> int:
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à repasser
+        sous 90 % du budget (évite d'évincer à chaque écriture).
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        with self._lock:
+            return self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        entries = []
+        for e in self._iter_entries():
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, entry_path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(entry_path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+        self._total_bytes = total
+        if removed:
+            logger.debug(f"Thumbnail cache: evicted {removed} entries ({total} bytes remaining)")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Vide complètement le cache.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        removed = 0
+        for e in list(self._iter_entries()):
+            try:
+                os.remove(e.path)
+                removed += 1
+            except OSError:
+                continue
+        with self._lock:
+            self._total_bytes = 0
+        return removed
+
+    def __repr__(self) -> str:
+        return (f"ThumbnailCache(dir={self.cache_dir}, size={self.size}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+__all__ = ['ThumbnailCache', 'make_thumbnail', 'DEFAULT_MAX_BYTES']
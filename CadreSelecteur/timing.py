@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Mesure des temps des phases de démarrage.
+
+Chaque phase est une « span » (nom, début, fin, thread) enregistrée par un
+gestionnaire de contexte ou un décorateur :
+
+    with span('scan_templates'):
+        ...
+
+    @timed('ImageEditorApp.__init__', report=True)
+    def __init__(self, ...):
+
+Les spans comprises dans une autre (même thread) sont indentées dans le
+rapport. Avec report=True, la fin de la span écrit dans le log le rapport
+de toutes les spans qu'elle englobe et, si un fichier de trace est
+configuré (set_trace_file), un fichier JSON au format Chrome Trace Event
+(chrome://tracing, Perfetto).
+
+Le coût par span est de deux lectures d'horloge et d'un ajout dans une
+file bornée : les spans peuvent rester en production.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Nombre maximal de spans conservées (les plus anciennes sont oubliées)
+MAX_SPANS = 10000
+
+
+def now_ns() -> int:
+    """Horloge monotone utilisée par les spans (ns)."""
+    return time.perf_counter_ns()
+
+
+class Span:
+    """Phase mesurée : nom, bornes (ns, horloge monotone) et thread."""
+
+    __slots__ = ('name', 'start_ns', 'end_ns', 'thread_id', 'thread_name', 'args')
+
+    def __init__(self, name: str, start_ns: int, end_ns: int, args: Optional[dict] = None):
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        current = threading.current_thread()
+        self.thread_id = current.ident
+        self.thread_name = current.name
+        self.args = args or {}
+
+    @property
+    def duration_ms(self) -> float:
+        """Durée de la span en millisecondes."""
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def contains(self, other: 'Span') -> bool:
+        """True si `other` se déroule entièrement pendant cette span."""
+        return self.start_ns <= other.start_ns and other.end_ns <= self.end_ns
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.duration_ms:.1f} ms)"
+
+
+class Tracer:
+    """Collecte les spans (tous threads) et produit le rapport et la trace Chrome."""
+
+    def __init__(self, max_spans: int = MAX_SPANS):
+        self.origin_ns = now_ns()
+        self.trace_file: Optional[Path] = None
+        self._spans: 'deque[Span]' = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, report: bool = False, **args) -> Iterator[None]:
+        """
+        Mesure le bloc `with` (même s'il lève une exception).
+
+        Args:
+            name: nom de la phase
+            report: écrire le rapport de cette span (et de ses sous-spans) à sa fin
+            **args: informations jointes à la span dans la trace Chrome
+        """
+        start = now_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, report=report, **args)
+
+    def timed(self, name: Optional[str] = None, report: bool = False) -> Callable:
+        """
+        Décorateur : mesure chaque appel de la fonction.
+
+        Args:
+            name: nom de la phase (défaut : nom qualifié de la fonction)
+            report: cf. span()
+        """
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*a, **kw):
+                with self.span(span_name, report=report):
+                    return func(*a, **kw)
+            return wrapper
+        return decorator
+
+    def record(self,
+               name: str,
+               start_ns: int,
+               end_ns: Optional[int] = None,
+               report: bool = False,
+               **args) -> Span:
+        """
+        Enregistre une span déjà mesurée (ex : phase terminée dans un callback Tk).
+
+        Args:
+            name: nom de la phase
+            start_ns: début (now_ns())
+            end_ns: fin (défaut : maintenant)
+            report: cf. span()
+            **args: informations jointes à la span dans la trace Chrome
+
+        Returns:
+            Span enregistrée
+        """
+        item = Span(name, start_ns, end_ns if end_ns is not None else now_ns(), args=args)
+        with self._lock:
+            self._spans.append(item)
+        if report:
+            self.log_report(item)
+        return item
+
+    def spans(self, root: Optional[Span] = None) -> List[Span]:
+        """
+        Spans enregistrées, par ordre de début.
+
+        Args:
+            root: ne garder que les spans comprises dans celle-ci (elle incluse)
+        """
+        with self._lock:
+            items = list(self._spans)
+        if root is not None:
+            items = [s for s in items if root.contains(s)]
+        # à début égal, la span englobante d'abord
+        return sorted(items, key=lambda s: (s.start_ns, -s.end_ns))
+
+    def format_report(self, root: Optional[Span] = None) -> str:
+        """Rapport texte : une ligne par span, indentée selon l'imbrication."""
+        items = self.spans(root)
+        title = f"Timing report: {root.name}" if root is not None else "Timing report"
+        lines = [title]
+        for i, s in enumerate(items):
+            # englobantes : la span racine et les spans du même thread qui la contiennent
+            level = sum(1 for other in items[:i]
+                        if other.contains(s) and (other is root or other.thread_id == s.thread_id))
+            indent = '  ' * (level + 1)
+            thread = '' if s.thread_name == 'MainThread' else f"  [{s.thread_name}]"
+            lines.append(f"{indent}{s.name:<{max(1, 40 - len(indent))}} {s.duration_ms:9.1f} ms{thread}")
+        return '\n'.join(lines)
+
+    def log_report(self, root: Optional[Span] = None, level: int = logging.INFO) -> None:
+        """Écrit le rapport dans le log, puis la trace Chrome si un fichier est configuré."""
+        logger.log(level, self.format_report(root))
+        if self.trace_file is not None:
+            try:
+                self.write_chrome_trace(self.trace_file)
+            except OSError as e:
+                logger.warning(f"Failed to write timing trace {self.trace_file}: {e}")
+
+    def chrome_trace(self) -> dict:
+        """Spans au format Chrome Trace Event (événements complets 'X', en µs)."""
+        pid = os.getpid()
+        events = []
+        for s in self.spans():
+            events.append({
+                'name': s.name,
+                'cat': 'startup',
+                'ph': 'X',
+                'ts': (s.start_ns - self.origin_ns) / 1000,
+                'dur': (s.end_ns - s.start_ns) / 1000,
+                'pid': pid,
+                'tid': s.thread_id,
+                'args': {k: str(v) for k, v in s.args.items()},
+            })
+        threads = {s.thread_id: s.thread_name for s in self.spans()}
+        for tid, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, file_path: Union[str, Path]) -> Path:
+        """
+        Écrit la trace Chrome (JSON) de toutes les spans enregistrées.
+
+        Returns:
+            Chemin du fichier écrit
+
+        Raises:
+            OSError si le fichier ne peut pas être écrit
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open('w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+        return file_path
+
+    def clear(self) -> None:
+        """Oublie les spans enregistrées."""
+        with self._lock:
+            self._spans.clear()
+
+
+# Collecteur du processus, utilisé par les fonctions du module
+tracer = Tracer()
+
+
+def span(name: str, report: bool = False, **args):
+    """Gestionnaire de contexte mesurant un bloc (cf. Tracer.span)."""
+    return tracer.span(name, report=report, **args)
+
+
+def timed(name: Optional[str] = None, report: bool = False) -> Callable:
+    """Décorateur mesurant chaque appel d'une fonction (cf. Tracer.timed)."""
+    return tracer.timed(name, report=report)
+
+
+def record(name: str, start_ns: int, end_ns: Optional[int] = None, report: bool = False, **args: Any) -> Span:
+    """Enregistre une span déjà mesurée (cf. Tracer.record)."""
+    return tracer.record(name, start_ns, end_ns, report=report, **args)
+
+
+def set_trace_file(file_path: Union[str, Path, None]) -> None:
+    """
+    Active (chemin) ou désactive (None ou '') l'écriture de la trace Chrome
+    à chaque rapport.
+    """
+    tracer.trace_file = Path(file_path) if file_path else None
+
+
+__all__ = ['Span', 'Tracer', 'tracer', 'span', 'timed', 'record', 'set_trace_file', 'now_ns']
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Corbeille des projets supprimés depuis le sélecteur.
+
+Supprimer un projet avec `rmtree` sur le thread Tk fige l'interface le
+temps d'effacer tous ses fichiers. La suppression se fait en deux temps :
+1. `move()` : renommage atomique du répertoire du projet dans
+   Templates/.trash/<horodatage>-<aléa>/<projet> (même système de fichiers,
+   donc instantané). L'inventaire et la surveillance des répertoires ignorent
+   les entrées commençant par un point : le projet disparaît aussitôt, et
+   `restore()` permet d'annuler ;
+2. `purge_entry()` : effacement réel, à exécuter hors du thread Tk, avec un
+   nombre borné de tentatives (fichiers encore ouverts sous Windows,
+   antivirus...). Une entrée qui résiste reste dans la corbeille et sera
+   reprise par le prochain `purge()` (au démarrage suivant).
+
+Le module ne dépend pas de Tkinter.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TRASH_DIR_NAME = '.trash'
+
+# Tentatives d'effacement d'une entrée et délai initial entre deux tentatives (doublé à chaque échec)
+PURGE_RETRIES = 3
+PURGE_RETRY_DELAY = 0.2
+
+
+class TrashEntry:
+    """Projet placé dans la corbeille."""
+
+    __slots__ = ('name', 'container', 'deleted_at')
+
+    def __init__(self, name: str, container: Path, deleted_at: float):
+        """
+        Args:
+            name: nom d'origine du projet
+            container: répertoire propre à cette entrée dans la corbeille
+            deleted_at: date de suppression (time.time())
+        """
+        self.name = name
+        self.container = Path(container)
+        self.deleted_at = deleted_at
+
+    @property
+    def path(self) -> Path:
+        """Emplacement du projet dans la corbeille."""
+        return self.container / self.name
+
+    def __repr__(self) -> str:
+        return f"TrashEntry({self.name!r}, deleted_at={self.deleted_at:.0f})"
+
+
+class Trash:
+    """Corbeille d'un répertoire Templates."""
+
+    def __init__(self,
+                 root: Union[str, Path],
+                 retries: int = PURGE_RETRIES,
+                 retry_delay: float = PURGE_RETRY_DELAY):
+        """
+        Args:
+            root: répertoire Templates (la corbeille est root/.trash)
+            retries: nombre de tentatives d'effacement d'une entrée
+            retry_delay: délai avant la 2e tentative (s), doublé ensuite
+        """
+        self.root = Path(root)
+        self.trash_dir = self.root / TRASH_DIR_NAME
+        self.retries = max(1, int(retries))
+        self.retry_delay = retry_delay
+
+    def move(self, name: str) -> TrashEntry:
+        """
+        Place le projet `name` dans la corbeille (renommage atomique).
+
+        Returns:
+            TrashEntry permettant restore() ou purge_entry()
+
+        Raises:
+            ValueError si le nom désigne autre chose qu'un projet de Templates
+            FileNotFoundError si le projet n'existe pas
+            OSError si le renommage échoue (fichier verrouillé...) : rien n'a été déplacé
+        """
+        if not name or name in ('.', '..') or name.startswith('.') or Path(name).name != name:
+            raise ValueError(f"Invalid project name: {name!r}")
+        source = self.root / name
+        if not source.is_dir():
+            raise FileNotFoundError(f"Project directory not found: {source}")
+
+        self.trash_dir.mkdir(exist_ok=True)
+        deleted_at = time.time()
+        container = Path(tempfile.mkdtemp(prefix=f"{int(deleted_at)}-", dir=self.trash_dir))
+        target = container / name
+        try:
+            os.rename(source, target)
+        except OSError:
+            try:
+                container.rmdir()
+            except OSError:
+                pass
+            raise
+        logger.debug(f"Project moved to trash: {name} -> {target}")
+        return TrashEntry(name, container, deleted_at)
+
+    def restore(self, entry: TrashEntry) -> Path:
+        """
+        Remet un projet de la corbeille à sa place d'origine.
+
+        Returns:
+            Chemin du projet restauré
+
+        Raises:
+            FileExistsError si un projet du même nom a été créé entre-temps
+            FileNotFoundError si l'entrée a déjà été effacée
+        """
+        destination = self.root / entry.name
+        if destination.exists():
+            raise FileExistsError(f"Project already exists: {destination}")
+        os.rename(entry.path, destination)
+        try:
+            entry.container.rmdir()
+        except OSError:
+            pass
+        logger.debug(f"Project restored from trash: {entry.name}")
+        return destination
+
+    def entries(self) -> List[TrashEntry]:
+        """Entrées présentes dans la corbeille, les plus anciennes d'abord."""
+        result = []
+        try:
+            containers = list(os.scandir(self.trash_dir))
+        except FileNotFoundError:
+            return result
+        for container in containers:
+            if not container.is_dir(follow_symlinks=False):
+                continue
+            try:
+                deleted_at = float(container.name.split('-', 1)[0])
+            except ValueError:
+                deleted_at = 0.0
+            try:
+                names = os.listdir(container.path)
+            except OSError:
+                # conteneur effacé entre-temps (purge en arrière-plan) ou illisible
+                continue
+            # conteneur vide (effacement interrompu) : entrée sans nom, à nettoyer
+            result.append(TrashEntry(names[0] if names else '', Path(container.path), deleted_at))
+        result.sort(key=lambda e: e.deleted_at)
+        return result
+
+    def purge_entry(self, entry: TrashEntry) -> bool:
+        """
+        Efface définitivement une entrée (bloquant : à appeler hors du thread Tk).
+
+        Returns:
+            True si l'entrée a été effacée, False si elle résiste après
+            `retries` tentatives (elle reste dans la corbeille)
+        """
+        delay = self.retry_delay
+        for attempt in range(1, self.retries + 1):
+            try:
+                shutil.rmtree(entry.container)
+                logger.debug(f"Trash entry purged: {entry.name}")
+                return True
+            except FileNotFoundError:
+                return True
+            except OSError as e:
+                logger.debug(f"Purge of {entry.name} failed (attempt {attempt}/{self.retries}): {e}")
+                if attempt < self.retries:
+                    time.sleep(delay)
+                    delay *= 2
+        logger.warning(f"Could not purge trash entry {entry.container}; will retry later")
+        return False
+
+    def purge(self, older_than: Optional[float] = None) -> int:
+        """
+        Efface les entrées de la corbeille (bloquant : à appeler hors du thread Tk).
+
+        Args:
+            older_than: n'effacer que les entrées supprimées depuis plus de
+                        `older_than` secondes (None = toutes)
+
+        Returns:
+            Nombre d'entrées effacées
+        """
+        now = time.time()
+        count = 0
+        for entry in self.entries():
+            if older_than is not None and now - entry.deleted_at < older_than:
+                continue
+            if self.purge_entry(entry):
+                count += 1
+        try:
+            self.trash_dir.rmdir()
+        except OSError:
+            pass  # absente ou encore occupée
+        return count
+
+
+__all__ = ['Trash', 'TrashEntry', 'TRASH_DIR_NAME']
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Liste virtualisée dans un Canvas Tkinter.
+
+Au lieu de créer une ligne de widgets par élément (ce qui produit des
+milliers de widgets Tk pour quelques centaines de cadres), seules les lignes
+visibles dans le canvas (plus une petite marge, « overscan ») sont
+matérialisées. Quand l'utilisateur fait défiler la liste, les lignes qui
+sortent de la zone visible sont recyclées pour afficher les nouveaux
+éléments : le nombre de widgets reste constant quelle que soit la taille de
+la liste.
+
+Le contenu des lignes est délégué à deux fonctions fournies par l'appelant :
+- row_factory(canvas) : crée une ligne (objet exposant un attribut `frame`)
+- row_binder(row, item, index) : affiche un élément dans une ligne existante
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Nombre de lignes matérialisées au-delà de la zone visible (de chaque côté)
+DEFAULT_OVERSCAN = 2
+
+# Ordonnée où sont rangées les lignes libres (hors de la zone de défilement)
+_PARKING_Y = -10000
+
+
+class VirtualList:
+    """Liste à lignes recyclées, positionnées comme fenêtres d'un Canvas."""
+
+    def __init__(self,
+                 canvas,
+                 row_factory: Callable[[Any], Any],
+                 row_binder: Callable[[Any, Any, int], None],
+                 row_height: Optional[int] = None,
+                 row_spacing: int = 0,
+                 overscan: int = DEFAULT_OVERSCAN):
+        """
+        Args:
+            canvas: Canvas Tk qui accueille la liste (défilement vertical)
+            row_factory: crée une nouvelle ligne ; la ligne doit exposer `frame`
+            row_binder: (ligne, élément, index) -> affiche l'élément dans la ligne
+            row_height: hauteur d'une ligne en pixels (None = mesurée sur la première ligne)
+            row_spacing: espace vertical ajouté à la hauteur mesurée
+            overscan: nombre de lignes supplémentaires matérialisées hors zone visible
+        """
+        self.canvas = canvas
+        self.row_factory = row_factory
+        self.row_binder = row_binder
+        self.row_height = row_height
+        self.row_spacing = row_spacing
+        self.overscan = overscan
+        self.items: List[Any] = []
+
+        # index -> ligne actuellement liée
+        self._bound: Dict[int, Any] = {}
+        # lignes créées mais non liées (réutilisables)
+        self._free: List[Any] = []
+        # ligne -> id de la fenêtre canvas
+        self._window_ids: Dict[Any, int] = {}
+        self._width = 0
+        self._height = 0
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure, add='+')
+
+    # --- API publique -------------------------------------------------
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """
+        Remplace les éléments de la liste et réaffiche les lignes visibles.
+
+        Args:
+            items: séquence d'éléments (passés tels quels à row_binder)
+        """
+        self.items = list(items)
+        # toutes les lignes liées sont libérées puis re-liées par refresh()
+        for index in list(self._bound):
+            self._release(index)
+        if self.row_height is None and self.items:
+            self._measure_row_height()
+        self._update_scrollregion()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Matérialise les lignes de la zone visible (+ overscan) et recycle
+        celles qui en sont sorties. À appeler après chaque défilement.
+        """
+        first, last = self.materialized_range()
+        wanted = set(range(first, last))
+
+        for index in [i for i in self._bound if i not in wanted]:
+            self._release(index)
+
+        for index in range(first, last):
+            if index not in self._bound:
+                row = self._free.pop() if self._free else self._new_row()
+                self._bound[index] = row
+                self._place(row, index)
+                self.row_binder(row, self.items[index], index)
+
+        # ranger les lignes inutilisées hors de la zone visible
+        for row in self._free:
+            self.canvas.coords(self._window_ids[row], 0, _PARKING_Y)
+
+    def rebind(self, index: int) -> None:
+        """Réaffiche l'élément `index` s'il est actuellement matérialisé."""
+        row = self._bound.get(index)
+        if row is not None:
+            self.row_binder(row, self.items[index], index)
+
+    def update_item(self, index: int, item: Any) -> None:
+        """Remplace l'élément `index` (même position) et réaffiche sa ligne si elle est matérialisée."""
+        self.items[index] = item
+        self.rebind(index)
+
+    def visible_range(self) -> Tuple[int, int]:
+        """
+        Indices [premier, dernier[ des éléments visibles dans le canvas.
+        """
+        if not self.items or not self.row_height:
+            return 0, 0
+        top = self.canvas.canvasy(0)
+        height = max(1, self.canvas.winfo_height())
+        first = max(0, int(top // self.row_height))
+        last = min(len(self.items), int((top + height) // self.row_height) + 1)
+        return first, last
+
+    def materialized_range(self) -> Tuple[int, int]:
+        """Indices [premier, dernier[ des éléments matérialisés (visibles + overscan)."""
+        first, last = self.visible_range()
+        if first == last:
+            return 0, 0
+        return max(0, first - self.overscan), min(len(self.items), last + self.overscan)
+
+    def row_for_index(self, index: int):
+        """Retourne la ligne liée à l'index, ou None si l'élément n'est pas matérialisé."""
+        return self._bound.get(index)
+
+    def bound_rows(self) -> Dict[int, Any]:
+        """Copie du mapping index -> ligne des éléments matérialisés."""
+        return dict(self._bound)
+
+    def row_count(self) -> int:
+        """Nombre total de lignes (widgets) créées : reste borné par la zone visible."""
+        return len(self._window_ids)
+
+    # --- interne ------------------------------------------------------
+
+    def _new_row(self):
+        row = self.row_factory(self.canvas)
+        window_id = self.canvas.create_window(0, _PARKING_Y, window=row.frame, anchor='nw')
+        if self._width > 1:
+            self.canvas.itemconfigure(window_id, width=self._width)
+        self._window_ids[row] = window_id
+        return row
+
+    def _measure_row_height(self) -> None:
+        row = self._new_row()
+        self._free.append(row)
+        try:
+            row.frame.update_idletasks()
+            height = row.frame.winfo_reqheight()
+        except Exception as e:
+            logger.debug(f"VirtualList: could not measure row height: {e}")
+            height = 0
+        self.row_height = max(1, int(height) + self.row_spacing)
+
+    def _place(self, row, index: int) -> None:
+        window_id = self._window_ids[row]
+        self.canvas.coords(window_id, 0, index * self.row_height + self.row_spacing // 2)
+
+    def _release(self, index: int) -> None:
+        row = self._bound.pop(index)
+        self._free.append(row)
+
+    def _update_scrollregion(self) -> None:
+        total = len(self.items) * (self.row_height or 0)
+        self.canvas.config(scrollregion=(0, 0, max(self._width, 1), total))
+
+    def _on_canvas_configure(self, event) -> None:
+        if (event.width, event.height) == (self._width, self._height):
+            return
+        if event.width != self._width:
+            # Les lignes occupent toute la largeur du canvas
+            self._width = event.width
+            for window_id in self._window_ids.values():
+                self.canvas.itemconfigure(window_id, width=self._width)
+            self._update_scrollregion()
+        self._height = event.height
+        self.refresh()
+
+
+__all__ = ['VirtualList', 'DEFAULT_OVERSCAN']
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark du temps de démarrage de la ligne de commande.
+
+Mesure le temps total (lancement de l'interpréteur compris) de
+`python -m CadreSelecteur list` et `install` (vers un répertoire Cadres
+temporaire), comparé à un interpréteur vide. Objectif : bien moins de 100 ms
+pour pouvoir l'exécuter à chaque démarrage du photomaton.
+
+Comme en production, le bytecode compilé est utilisé : il est écrit dans un
+répertoire temporaire (PYTHONPYCACHEPREFIX) lors d'une exécution de chauffe.
+
+Usage (depuis la racine du dépôt) :
+    python benchmarks/bench_cli_startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def measure(args, repeat, env):
+    """Temps médian et maximal (ms) d'une commande (après une exécution de chauffe)."""
+    subprocess.run(args, cwd=REPO_DIR, check=True, stdout=subprocess.DEVNULL, env=env)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=REPO_DIR, check=True, stdout=subprocess.DEVNULL, env=env)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_DIR))
+    from CadreSelecteur.path_resolver import resolve_templates_dir
+    from CadreSelecteur.project_repository import ProjectRepository
+    project = ProjectRepository(resolve_templates_dir()).scan().complete_projects()[0].name
+
+    with tempfile.TemporaryDirectory() as destination, tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        cases = [
+            ("python -c pass", [sys.executable, '-c', 'pass']),
+            ("list", [sys.executable, '-m', 'CadreSelecteur', 'list']),
+            (f"install {project}", [sys.executable, '-m', 'CadreSelecteur',
+                                    '--destination', destination, 'install', project]),
+        ]
+        for label, command in cases:
+            median, worst = measure(command, args.repeat, env)
+            print(f"{label:28s} median {median:6.1f} ms  (max {worst:6.1f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark du temps d'image pendant le déplacement d'un calque dans l'éditeur.
+
+Compare, pour 1, 10 et 50 calques, trois façons de produire l'aperçu
+600x400 à chaque mouvement de souris :
+- legacy : fond + tous les calques redessinés (ancien update_canvas) ;
+- cached : images aplaties sous / au-dessus du calque actif (render) ;
+- dirty  : recomposition du seul rectangle modifié (update).
+
+Seule la composition PIL est mesurée (pas la recopie vers Tk) ; la colonne
+« pixels » donne la surface recopiée dans la PhotoImage par image (canvas
+complet pour legacy et cached).
+
+Usage (depuis la racine du dépôt) :
+    python benchmarks/bench_editor_drag.py [--frames N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CadreSelecteur.CadreEditeur.compositor import LayerCompositor  # noqa: E402
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage  # noqa: E402
+
+CANVAS = (600, 400)
+LAYER_COUNTS = (1, 10, 50)
+BACKGROUND = '#FFFFFF'
+
+
+def make_layers(count):
+    """Pile de calques image 120x80 semi-transparents répartis sur le canvas."""
+    parent = SimpleNamespace(frame_dir=None)
+    layers = []
+    for i in range(count):
+        layer = LayerImage(None, parent, CANVAS, (1800, 1200), 3, name=f"Image {i}")
+        layer.display_imported_image = Image.new('RGBA', (120, 80), ((i * 37) % 256, 80, 160, 200))
+        layer.display_imported_image_size = (120, 80)
+        layer.display_position = ((i * 53) % 480, (i * 31) % 320)
+        layers.append(layer)
+    return layers
+
+
+def legacy_frame(layers, _active, _compositor):
+    image = Image.new('RGBA', CANVAS, BACKGROUND).copy()
+    for layer in reversed(layers):
+        layer.draw_on_image(image, export=False)
+    return CANVAS[0] * CANVAS[1]
+
+
+def cached_frame(layers, active, compositor):
+    compositor.render(layers, active, BACKGROUND)
+    return CANVAS[0] * CANVAS[1]
+
+
+def dirty_frame(layers, active, compositor):
+    _, box = compositor.update(layers, active, BACKGROUND)
+    return 0 if box is None else (box[2] - box[0]) * (box[3] - box[1])
+
+
+def measure(frame_func, count, frames):
+    """Temps médian (ms) et surface recopiée médiane (pixels) par image de drag."""
+    layers = make_layers(count)
+    active = count // 2
+    compositor = LayerCompositor(CANVAS)
+    frame_func(layers, active, compositor)  # première image : caches remplis
+    times, pixels = [], []
+    for step in range(1, frames + 1):
+        x, y = layers[active].display_position
+        layers[active].display_position = (x + (2 if step % 100 < 50 else -2), y + 1 if step % 2 else y)
+        start = time.perf_counter()
+        pixels.append(frame_func(layers, active, compositor))
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), statistics.median(pixels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"canvas {CANVAS[0]}x{CANVAS[1]}, {args.frames} drag frames")
+    print(f"{'layers':>6}  {'mode':<7} {'ms/frame':>9} {'pixels':>8}")
+    for count in LAYER_COUNTS:
+        for name, func in (('legacy', legacy_frame), ('cached', cached_frame), ('dirty', dirty_frame)):
+            ms, pixels = measure(func, count, args.frames)
+            print(f"{count:>6}  {name:<7} {ms:9.3f} {pixels:8.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
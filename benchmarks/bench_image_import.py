@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la mémoire et du temps d'import d'une photo dans un calque image.
+
+Compare, pour une photo JPEG générée (6000x4000 par défaut), l'ancien import
+(Image.open().convert('RGBA') de l'image complète) et le décodage borné
+(image_import.load_import_image : draft JPEG, limite à la taille export,
+orientation EXIF). Chaque mesure est faite dans un processus séparé : le
+pic de mémoire résidente (ru_maxrss) est celui de l'import seul, diminué
+du pic du même processus avant l'import.
+
+Linux / macOS uniquement (module resource).
+
+Usage (depuis la racine du dépôt) :
+    python benchmarks/bench_image_import.py [--size 6000x4000]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+EXPORT_SIZE = (1800, 1200)
+
+# Exécuté dans un processus neuf : affiche {"rss_mb", "ms", "size"} en JSON
+SCRIPT = """
+import json, resource, sys, time
+from PIL import Image
+from CadreSelecteur.CadreEditeur.image_import import load_import_image
+
+def maxrss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+mode, path = sys.argv[1], sys.argv[2]
+before = maxrss_mb()
+start = time.perf_counter()
+if mode == 'legacy':
+    image = Image.open(path).convert('RGBA')
+else:
+    image = load_import_image(path, (%d, %d))
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"rss_mb": maxrss_mb() - before, "ms": elapsed, "size": image.size}))
+""" % EXPORT_SIZE
+
+
+# Photo JPEG de test (dégradé), générée dans un processus à part : sous Linux,
+# un processus fils hérite du pic mémoire (ru_maxrss) de son parent
+MAKE_PHOTO_SCRIPT = """
+import sys
+from PIL import Image
+size = (int(sys.argv[2]), int(sys.argv[3]))
+gradient = Image.linear_gradient('L').resize(size)
+Image.merge('RGB', (gradient, gradient.transpose(Image.Transpose.ROTATE_180), gradient)).save(sys.argv[1], quality=90)
+"""
+
+
+def make_photo(path, size):
+    subprocess.run([sys.executable, '-c', MAKE_PHOTO_SCRIPT, str(path), str(size[0]), str(size[1])], check=True)
+
+
+def run(mode, path):
+    output = subprocess.run([sys.executable, '-c', SCRIPT, mode, str(path)], cwd=REPO_DIR,
+                            check=True, stdout=subprocess.PIPE, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', default='6000x4000')
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.split('x'))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'photo.jpg'
+        make_photo(path, size)
+        print(f"photo {size[0]}x{size[1]} ({path.stat().st_size / 1e6:.1f} MB JPEG), export {EXPORT_SIZE}")
+        print(f"{'mode':<8} {'peak RSS MB':>11} {'ms':>8}  decoded")
+        for mode in ('legacy', 'capped'):
+            result = run(mode, path)
+            print(f"{mode:<8} {result['rss_mb']:11.1f} {result['ms']:8.1f}  {tuple(result['size'])}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark du temps de démarrage de l'interface graphique (time-to-interactive).
+
+Mesure, depuis le lancement de l'interpréteur, le temps jusqu'à l'affichage
+de la fenêtre du sélecteur avec ses premières vignettes (callback on_ready
+de __main__.run_gui), comparé à la simple création d'une fenêtre Tk.
+
+Comme en production, le bytecode compilé est utilisé : il est écrit dans un
+répertoire temporaire (PYTHONPYCACHEPREFIX) lors d'une exécution de chauffe,
+qui remplit aussi le cache disque des vignettes.
+
+Nécessite un affichage (sur un serveur : xvfb-run).
+
+Usage (depuis la racine du dépôt) :
+    python benchmarks/bench_startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Exécuté dans un interpréteur neuf : quitte dès que la fenêtre est affichée
+GUI_SCRIPT = """
+from CadreSelecteur.__main__ import run_gui
+
+def ready(app):
+    print('ready', flush=True)
+    app.master.after(0, app.master.destroy)
+
+run_gui(on_ready=ready)
+"""
+
+TK_SCRIPT = """
+import tkinter
+root = tkinter.Tk()
+root.update()
+print('ready', flush=True)
+root.destroy()
+"""
+
+
+def time_to_ready(script, env):
+    """Temps (ms) entre le lancement de l'interpréteur et la ligne 'ready'."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', script], cwd=REPO_DIR, env=env,
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    process.wait(timeout=30)
+    if line.strip() != 'ready':
+        raise RuntimeError(f"startup failed (exit code {process.returncode})")
+    return elapsed
+
+
+def measure(script, repeat, env):
+    """Temps médian et maximal (ms) (après une exécution de chauffe)."""
+    time_to_ready(script, env)
+    samples = [time_to_ready(script, env) for _ in range(repeat)]
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache, PYTHONPATH=str(REPO_DIR))
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        for label, script in (("Tk window only", TK_SCRIPT), ("selector ready", GUI_SCRIPT)):
+            median, worst = measure(script, args.repeat, env)
+            print(f"{label:28s} median {median:7.1f} ms  (max {worst:7.1f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
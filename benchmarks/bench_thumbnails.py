@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark du décodage des vignettes et prévisualisations.
+
+Compare, sur les cadres livrés dans Templates/ et Cadres/, l'ancien chemin
+(décodage complet + thumbnail/resize + copie) et le chemin réduit
+(image_decode.decode_preview). Le cache disque des vignettes n'est pas
+utilisé : on mesure le coût d'un décodage à froid.
+
+Usage (depuis la racine du dépôt) :
+    python benchmarks/bench_thumbnails.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from CadreSelecteur.config_loader import THUMBNAIL_H, THUMBNAIL_L  # noqa: E402
+from CadreSelecteur.image_decode import (  # noqa: E402
+    decode_preview, PREVIEW_REDUCING_GAP, PREVIEW_RESAMPLE)
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / 'CadreSelecteur'
+PREVIEW_SIZE = (720, 480)
+
+
+def legacy_thumbnail(file_path, size):
+    """Ancien chemin : décodage complet, thumbnail, puis copie avant PhotoImage."""
+    with Image.open(file_path) as img:
+        img.thumbnail(size)
+        img.load()
+    return img.copy()
+
+
+def legacy_preview(file_path, size):
+    """Ancien chemin de show_full_image : décodage complet puis resize."""
+    with Image.open(file_path) as img:
+        return img.resize(size)
+
+
+def find_frames():
+    frames = sorted(PACKAGE_DIR.glob('Templates/*/*_[14].png'))
+    frames += sorted(PACKAGE_DIR.glob('Cadres/*_[14].png'))
+    return frames
+
+
+def measure(func, files, size, repeat):
+    """Latence médiane (ms) par image."""
+    samples = []
+    for _ in range(repeat):
+        for file_path in files:
+            start = time.perf_counter()
+            func(file_path, size)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    files = find_frames()
+    if not files:
+        print("No frames found")
+        return 1
+    print(f"{len(files)} frames, repeat={args.repeat}")
+
+    cases = [
+        (f"thumbnail {THUMBNAIL_H}x{THUMBNAIL_L}", (THUMBNAIL_H, THUMBNAIL_L),
+         legacy_thumbnail, lambda f, s: decode_preview(f, s)),
+        (f"preview {PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]}", PREVIEW_SIZE,
+         legacy_preview, lambda f, s: decode_preview(f, s, exact=True, resample=PREVIEW_RESAMPLE,
+                                                     reducing_gap=PREVIEW_REDUCING_GAP)),
+    ]
+    for label, size, before, after in cases:
+        before_med, before_max = measure(before, files, size, args.repeat)
+        after_med, after_max = measure(after, files, size, args.repeat)
+        print(f"{label:22s} before: median {before_med:6.1f} ms (max {before_max:6.1f})  "
+              f"after: median {after_med:6.1f} ms (max {after_max:6.1f})  "
+              f"x{before_med / after_med:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Fixtures partagées par les tests.
+
+FakeWidget remplace la boucle Tk des composants qui se replanifient par
+after() (BackgroundWorker, ChangeWatcher) : les callbacks sont exécutés à la
+demande, dans le thread du test.
+"""
+
+import pytest
+
+
+class FakeWidget:
+    """Simule after()/after_cancel() : les callbacks sont exécutés à la demande."""
+
+    def __init__(self):
+        self._callbacks = {}
+        self._next_id = 0
+
+    def after(self, _ms, func):
+        self._next_id += 1
+        self._callbacks[self._next_id] = func
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def run_pending(self):
+        callbacks, self._callbacks = self._callbacks, {}
+        for func in callbacks.values():
+            func()
+
+
+@pytest.fixture
+def widget():
+    return FakeWidget()
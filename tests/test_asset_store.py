@@ -0,0 +1,182 @@
+"""
+Tests du stockage par contenu des images importées (asset_store).
+
+Valide que:
+1. Un même contenu importé dans plusieurs projets n'est stocké qu'une fois
+2. Deux contenus différents de même nom ne s'écrasent pas
+3. Les noms sont résolus vers le blob, ou vers le répertoire du projet hors manifeste
+4. Enregistrer (retain) et dupliquer (copy_to) un projet ne touchent qu'au manifeste
+5. Le store et les manifestes sont ignorés par l'inventaire des projets
+6. collect() n'efface que les blobs que plus aucun manifeste (projets et corbeille) ne référence
+"""
+import json
+from types import SimpleNamespace
+
+from PIL import Image
+
+from CadreSelecteur.asset_store import AssetStore, ProjectAssets, ASSETS_DIR_NAME, MANIFEST_NAME
+from CadreSelecteur.trash import Trash
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage
+from CadreSelecteur.project_repository import ProjectRepository
+
+
+def _blobs(root):
+    return sorted(p for p in (root / ASSETS_DIR_NAME).rglob('*') if p.is_file())
+
+
+def _logo(path, color=(255, 0, 0)):
+    Image.new('RGB', (40, 20), color).save(path)
+    return path
+
+
+class TestDedup:
+    """Un blob par contenu."""
+
+    def test_same_file_stored_once(self, tmp_path):
+        logo = _logo(tmp_path / 'logo.png')
+        store = AssetStore(tmp_path / 'Templates')
+
+        names = [store.manifest(tmp_path / 'Templates' / f'prj{i}').add_file(logo) for i in range(5)]
+
+        assert names == ['logo.png'] * 5
+        assert len(_blobs(tmp_path / 'Templates')) == 1
+        assert (store.writes, store.dedup_hits) == (1, 4)
+
+    def test_same_name_other_content_not_overwritten(self, tmp_path):
+        assets = ProjectAssets(tmp_path / 'Templates' / 'prj')
+        (tmp_path / 'a').mkdir()
+        (tmp_path / 'b').mkdir()
+        first = assets.add_file(_logo(tmp_path / 'a' / 'logo.png'))
+        second = assets.add_file(_logo(tmp_path / 'b' / 'logo.png', (0, 0, 255)))
+
+        assert (first, second) == ('logo.png', 'logo_2.png')
+        with Image.open(assets.resolve('logo.png')) as img:
+            assert img.getpixel((0, 0)) == (255, 0, 0)
+        with Image.open(assets.resolve('logo_2.png')) as img:
+            assert img.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_same_content_keeps_first_name(self, tmp_path):
+        assets = ProjectAssets(tmp_path / 'Templates' / 'prj')
+        logo = _logo(tmp_path / 'logo.png')
+        assert assets.add_file(logo) == 'logo.png'
+        assert assets.add_bytes(logo.read_bytes(), 'copie.png') == 'logo.png'
+
+
+class TestManifest:
+    """Résolution et opérations sur le manifeste."""
+
+    def test_resolve_falls_back_to_project_dir(self, tmp_path):
+        project = tmp_path / 'Templates' / 'prj'
+        assets = ProjectAssets(project)
+        name = assets.add_file(_logo(tmp_path / 'logo.png'))
+
+        assert assets.resolve(name).parent.parent == tmp_path / 'Templates' / ASSETS_DIR_NAME
+        assert assets.resolve('ancien.png') == project / 'ancien.png'
+
+    def test_manifest_reloaded(self, tmp_path):
+        project = tmp_path / 'Templates' / 'prj'
+        name = ProjectAssets(project).add_file(_logo(tmp_path / 'logo.png'))
+
+        data = json.loads((project / MANIFEST_NAME).read_text(encoding='utf-8'))
+        assert list(data['assets']) == [name]
+        assert name in ProjectAssets(project)
+
+    def test_retain_and_copy_to(self, tmp_path):
+        root = tmp_path / 'Templates'
+        assets = ProjectAssets(root / 'prj')
+        (tmp_path / 'b').mkdir()
+        kept = assets.add_file(_logo(tmp_path / 'logo.png'))
+        dropped = assets.add_file(_logo(tmp_path / 'b' / 'fond.png', (0, 255, 0)))
+
+        assets.retain([kept])
+        copy = assets.copy_to(root / 'prj_copie')
+
+        assert dropped not in ProjectAssets(root / 'prj')
+        assert copy.resolve(kept) == assets.resolve(kept)
+        assert sorted(p.name for p in (root / 'prj_copie').iterdir()) == [MANIFEST_NAME]
+        # le blob n'est pas effacé : il peut servir à d'autres projets
+        assert len(_blobs(root)) == 2
+
+    def test_hidden_from_repository(self, tmp_path):
+        root = tmp_path / 'Templates'
+        project = root / 'prj'
+        ProjectAssets(project).add_file(_logo(tmp_path / 'logo.png'))
+        (project / 'prj_1.png').write_bytes(b'1')
+
+        repository = ProjectRepository(root).scan()
+
+        assert repository.names() == ['prj']
+        assert repository.get('prj').json is None
+        assert repository.get('prj').assets == []
+
+
+class TestCollect:
+    """Effacement des blobs qui ne sont plus référencés."""
+
+    def test_unreferenced_blob_removed(self, tmp_path):
+        root = tmp_path / 'Templates'
+        assets = ProjectAssets(root / 'prj')
+        (tmp_path / 'b').mkdir()
+        kept = assets.add_file(_logo(tmp_path / 'logo.png'))
+        assets.add_file(_logo(tmp_path / 'b' / 'fond.png', (0, 255, 0)))
+        assets.retain([kept])
+
+        assert assets.store.collect(min_age=0) == 1
+        assert _blobs(root) == [assets.resolve(kept)]
+
+    def test_shared_blob_kept_while_referenced(self, tmp_path):
+        root = tmp_path / 'Templates'
+        logo = _logo(tmp_path / 'logo.png')
+        first, second = ProjectAssets(root / 'a'), ProjectAssets(root / 'b')
+        first.add_file(logo)
+        second.add_file(logo)
+        first.retain([])
+
+        assert AssetStore(root).collect(min_age=0) == 0
+        second.retain([])
+        assert AssetStore(root).collect(min_age=0) == 1
+        assert _blobs(root) == []
+
+    def test_trashed_project_keeps_blobs_until_purged(self, tmp_path):
+        root = tmp_path / 'Templates'
+        name = ProjectAssets(root / 'prj').add_file(_logo(tmp_path / 'logo.png'))
+        trash = Trash(root)
+        entry = trash.move('prj')
+        store = AssetStore(root)
+
+        # encore restaurable : le blob est gardé
+        assert store.collect(min_age=0) == 0
+        assert trash.purge_entry(entry)
+        assert store.collect(min_age=0) == 1
+        assert name not in ProjectAssets(root / 'prj')
+
+    def test_recent_blob_kept(self, tmp_path):
+        root = tmp_path / 'Templates'
+        store = AssetStore(root)
+        store.put_file(_logo(tmp_path / 'logo.png'))
+
+        # import en cours : le manifeste n'est pas encore enregistré
+        assert store.collect() == 0
+        assert len(_blobs(root)) == 1
+
+    def test_unreadable_manifest_skips_collection(self, tmp_path):
+        root = tmp_path / 'Templates'
+        assets = ProjectAssets(root / 'prj')
+        assets.add_file(_logo(tmp_path / 'logo.png'))
+        assets.path.write_text('{', encoding='utf-8')
+
+        assert assets.store.collect(min_age=0) == 0
+        assert len(_blobs(root)) == 1
+
+
+def test_layer_loaded_from_store(tmp_path):
+    project = tmp_path / 'Templates' / 'prj'
+    name = ProjectAssets(project).add_file(_logo(tmp_path / 'logo.png'))
+
+    layer = LayerImage.from_dict({'imported_image_path': name,
+                                  'display_imported_image_size': (40, 20),
+                                  'image_imported_image_size': (120, 60)},
+                                 None, SimpleNamespace(frame_dir=project), (60, 40), (180, 120), 3)
+
+    assert layer.original_image.size == (40, 20)
+    assert layer.display_imported_image.getpixel((1, 1)) == (255, 0, 0, 255)
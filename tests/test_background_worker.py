@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour BackgroundWorker.
+
+Valide que:
+1. Les résultats sont remis au callback via after() (thread Tk simulé)
+2. Les tâches les plus prioritaires sont traitées en premier
+3. L'annulation ignore les résultats obsolètes
+"""
+
+import threading
+import time
+
+from CadreSelecteur.background_worker import BackgroundWorker
+
+
+def drain(widget, loader, timeout=5.0):
+    """Fait tourner la 'boucle Tk' jusqu'à épuisement des tâches."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        widget.run_pending()
+        if not loader.pending_count() and not widget._callbacks:
+            return
+        time.sleep(0.005)
+    raise AssertionError("loader did not finish in time")
+
+
+class TestBackgroundWorker:
+    """Tests du pool de threads de travail."""
+
+    def test_callback_runs_on_polling_thread(self, widget):
+        loader = BackgroundWorker(widget, lambda x: x * 2, max_workers=2)
+        results = {}
+        main_thread = threading.current_thread()
+
+        def callback(key):
+            def _cb(result, error):
+                assert threading.current_thread() is main_thread
+                results[key] = (result, error)
+            return _cb
+
+        for i in range(5):
+            loader.submit(i, (i,), callback(i))
+        drain(widget, loader)
+        loader.shutdown()
+
+        assert results == {i: (i * 2, None) for i in range(5)}
+
+    def test_errors_are_forwarded(self, widget):
+        def load(_):
+            raise OSError("boom")
+
+        loader = BackgroundWorker(widget, load, max_workers=1)
+        errors = []
+        loader.submit('a', (None,), lambda result, error: errors.append(error))
+        drain(widget, loader)
+        loader.shutdown()
+
+        assert len(errors) == 1 and isinstance(errors[0], OSError)
+
+    def test_priority_order(self, widget):
+        gate = threading.Event()
+        order = []
+
+        def load(key):
+            gate.wait(timeout=5)
+            order.append(key)
+            return key
+
+        loader = BackgroundWorker(widget, load, max_workers=1)
+        # La première tâche occupe l'unique thread pendant qu'on empile les autres
+        loader.submit('first', ('first',), lambda r, e: None, priority=0)
+        time.sleep(0.05)
+        loader.submit('low', ('low',), lambda r, e: None, priority=10)
+        loader.submit('mid', ('mid',), lambda r, e: None, priority=5)
+        loader.submit('late', ('late',), lambda r, e: None, priority=20)
+        # une nouvelle soumission remplace la tâche en attente et sa priorité
+        loader.submit('late', ('late',), lambda r, e: None, priority=0)
+        gate.set()
+        drain(widget, loader)
+        loader.shutdown()
+
+        assert order == ['first', 'late', 'mid', 'low']
+
+    def test_cancel_all_discards_results(self, widget):
+        gate = threading.Event()
+
+        def load(key):
+            gate.wait(timeout=5)
+            return key
+
+        loader = BackgroundWorker(widget, load, max_workers=1)
+        delivered = []
+        loader.submit('running', ('running',), lambda r, e: delivered.append(r))
+        time.sleep(0.05)
+        loader.submit('queued', ('queued',), lambda r, e: delivered.append(r))
+        assert loader.cancel_all() == 1
+        gate.set()
+        drain(widget, loader)
+        loader.shutdown()
+
+        assert delivered == []
+        assert loader.cancel('queued') is False
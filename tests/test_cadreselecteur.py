@@ -59,13 +59,15 @@ class DummyCanvas(DummyWidget):
 
 
 def test_create_src_thumbnail_no_gui(tmp_path, monkeypatch):
-    # Use a real image from the Templates folder
+    # Use a real project from the Templates folder
     tpl_dir = cs.template_path
     assert os.path.isdir(tpl_dir)
-    # pick a file that ends with _1.png
-    filenames = [f for f in os.listdir(tpl_dir) if f.lower().endswith('_1.png')]
-    assert filenames, "Aucune image template *_1.png trouvée"
-    filename = filenames[0]
+    # pick a project directory that contains a file ending with _1.png
+    projects = [d for d in sorted(os.listdir(tpl_dir))
+                if os.path.isdir(os.path.join(tpl_dir, d))
+                and any(f.lower().endswith('_1.png') for f in os.listdir(os.path.join(tpl_dir, d)))]
+    assert projects, "Aucun projet avec une image *_1.png trouvé"
+    project_name = projects[0]
 
     # Monkeypatch Tkinter widgets used in the module
     monkeypatch.setattr(cs, 'Frame', DummyFrame)
@@ -74,26 +76,479 @@ def test_create_src_thumbnail_no_gui(tmp_path, monkeypatch):
     monkeypatch.setattr(cs, 'Radiobutton', DummyRadiobutton)
     monkeypatch.setattr(cs, 'Canvas', DummyCanvas)
     # Mock ImageTk.PhotoImage to avoid creating real Tk images in headless test environment
-    monkeypatch.setattr(cs.ImageTk, 'PhotoImage', lambda *a, **kw: object())
+    monkeypatch.setattr('PIL.ImageTk.PhotoImage', lambda *a, **kw: object())
 
     # Create a fake instance of CadreSelecteur
     obj = object.__new__(cs.CadreSelecteur)
-    # minimal attributes required by create_src_thumbnail
+    # minimal attributes required by create_src_thumbnail / row binding
     obj.source_directory = tpl_dir
-    obj.list_frameSrc = DummyFrame()
+    from CadreSelecteur.project_repository import ProjectRepository
+    obj.repository = ProjectRepository(tpl_dir).scan()
     obj.selected_image = type('SV', (), {'set': lambda self, v: None, 'get': lambda self: ''})()
     obj.trash_icon = None
     obj.edit_icon = None
     # Initialiser le gestionnaire de références d'images
     from CadreSelecteur.image_ref_manager import ImageRefManager
     obj.image_ref_manager = ImageRefManager()
+    from CadreSelecteur.thumbnail_cache import ThumbnailCache
+    obj.thumbnail_cache = ThumbnailCache(tmp_path / 'thumbs', (cs.THUMBNAIL_H, cs.THUMBNAIL_L))
+    from collections import OrderedDict
+    obj._thumbnail_images = OrderedDict()
+    obj._rows_by_project = {}
     # Provide a dummy master to satisfy PhotoImage(master=...)
     obj.master = DummyWidget()
 
     # Call the function under test - should not raise
-    obj.create_src_thumbnail(filename)
+    project = obj.create_src_thumbnail(project_name)
+    assert project is not None
+    assert project.frame_1.endswith('_1.png')
+    assert project.frame_4.endswith('_4.png')
+
+    # Bind the project to a (dummy) row: without loader, thumbnails are decoded synchronously
+    row = obj._create_project_row(DummyFrame())
+    obj._bind_project_row(row, project, 0)
+    assert row.project == project_name
 
     # After call, image_ref_manager should contain at least the two thumbnails
     assert obj.image_ref_manager.get_count('thumbnails') >= 2
 
 
+def test_create_src_thumbnail_skips_incomplete_project(tmp_path):
+    (tmp_path / 'incomplet').mkdir()
+    (tmp_path / 'incomplet' / 'incomplet_1.png').touch()
+
+    obj = object.__new__(cs.CadreSelecteur)
+    obj.source_directory = tmp_path
+    from CadreSelecteur.project_repository import ProjectRepository
+    obj.repository = ProjectRepository(tmp_path).scan()
+
+    assert obj.create_src_thumbnail('incomplet') is None
+
+
+class RecordingVirtualList:
+    """Enregistre les mises à jour demandées à la liste virtualisée."""
+
+    def __init__(self):
+        self.calls = []
+
+    def set_items(self, items):
+        self.calls.append(('set_items', [p.name for p in items]))
+
+    def update_item(self, index, item):
+        self.calls.append(('update_item', index, item.name))
+
+
+def _selector_with_projects(tmp_path, names):
+    from collections import OrderedDict
+    from CadreSelecteur.project_repository import ProjectRepository
+    for name in names:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f'{name}_1.png').write_bytes(b'1')
+        (tmp_path / name / f'{name}_4.png').write_bytes(b'4')
+    obj = object.__new__(cs.CadreSelecteur)
+    obj.source_directory = tmp_path
+    obj.repository = ProjectRepository(tmp_path).scan()
+    obj.projects = obj.repository.complete_projects()
+    obj._thumbnail_images = OrderedDict((name, ('t1', 't4')) for name in names)
+    obj.virtual_list = RecordingVirtualList()
+    return obj
+
+
+class TestRefreshProjects:
+    """Tests de la mise à jour incrémentale de la liste des cadres."""
+
+    def test_modified_project_updates_only_its_row(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a', 'b', 'c'])
+        (tmp_path / 'b' / 'b_1.png').write_bytes(b'modifie')
+
+        diff = obj.refresh_projects()
+
+        assert diff.modified == {'b'}
+        assert obj.virtual_list.calls == [('update_item', 1, 'b')]
+        # seules les vignettes du projet modifié sont à redécoder
+        assert list(obj._thumbnail_images) == ['a', 'c']
+
+    def test_added_project_resets_items(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a', 'c'])
+        (tmp_path / 'b').mkdir()
+        (tmp_path / 'b' / 'b_1.png').write_bytes(b'1')
+        (tmp_path / 'b' / 'b_4.png').write_bytes(b'4')
+
+        diff = obj.refresh_projects(['b'])
+
+        assert diff.added == {'b'}
+        assert obj.virtual_list.calls == [('set_items', ['a', 'b', 'c'])]
+        assert list(obj._thumbnail_images) == ['a', 'c']
+
+    def test_no_change_is_noop(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a'])
+
+        assert not obj.refresh_projects()
+        assert obj.virtual_list.calls == []
+
+
+class RecordingLoader:
+    """Enregistre les préchargements soumis."""
+
+    def __init__(self):
+        self.submitted = []
+        self.stopped = False
+
+    def cancel_all(self):
+        self.submitted.clear()
+
+    def shutdown(self):
+        self.stopped = True
+
+    def submit(self, key, args, callback, priority=0):
+        self.submitted.append((priority, os.path.basename(key)))
+
+
+class KeyedLoader:
+    """Comme BackgroundWorker : une nouvelle soumission remplace la tâche de même clé."""
+
+    def __init__(self):
+        self.jobs = {}
+
+    def submit(self, key, args, callback, priority=0):
+        self.jobs[key] = (args, callback)
+
+    def cancel(self, key):
+        self.jobs.pop(key, None)
+
+    def run_all(self):
+        jobs, self.jobs = self.jobs, {}
+        for args, callback in jobs.values():
+            callback(args, None)
+
+
+class TestPrefetchPreviews:
+    """Tests du préchargement des prévisualisations."""
+
+    def test_selected_then_neighbours(self, tmp_path):
+        from CadreSelecteur.preview_cache import PreviewCache
+        obj = _selector_with_projects(tmp_path, ['a', 'b', 'c', 'd'])
+        obj.preview_cache = PreviewCache(1024 * 1024)
+        obj.preview_loader = RecordingLoader()
+
+        obj.prefetch_previews('b')
+
+        assert obj.preview_loader.submitted == [
+            (0, 'b_1.png'), (0, 'b_4.png'),
+            (1, 'a_1.png'), (1, 'a_4.png'),
+            (1, 'c_1.png'), (1, 'c_4.png'),
+        ]
+
+    def test_unknown_project_is_ignored(self, tmp_path):
+        from CadreSelecteur.preview_cache import PreviewCache
+        obj = _selector_with_projects(tmp_path, ['a'])
+        obj.preview_cache = PreviewCache(1024 * 1024)
+        obj.preview_loader = RecordingLoader()
+
+        obj.prefetch_previews('absent')
+
+        assert obj.preview_loader.submitted == []
+
+
+class TestPreloadThumbnails:
+    """Tests du décodage des premières vignettes pendant l'écran de démarrage."""
+
+    def test_decodes_first_projects_and_reports_progress(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a', 'b', 'c'])
+        obj._thumbnail_images.clear()
+        obj._rows_by_project = {}
+        obj.thumbnail_loader = None
+        obj._load_project_thumbnails = lambda f1, f4: (os.path.basename(f1), os.path.basename(f4))
+        progress = []
+
+        total = obj.preload_thumbnails(2, on_progress=lambda done, n: progress.append((done, n)))
+
+        assert total == 2
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert dict(obj._thumbnail_images) == {'a': ('a_1.png', 'a_4.png'), 'b': ('b_1.png', 'b_4.png')}
+
+    def test_thumbnails_in_memory_are_not_decoded_again(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a', 'b'])
+        obj.thumbnail_loader = RecordingLoader()
+        progress = []
+
+        assert obj.preload_thumbnails(5, on_progress=lambda done, n: progress.append((done, n))) == 0
+        assert obj.thumbnail_loader.submitted == []
+        assert progress == []
+
+    def test_submitted_with_top_priority(self, tmp_path):
+        obj = _selector_with_projects(tmp_path, ['a', 'b', 'c'])
+        obj._thumbnail_images.pop('b')
+        obj._thumbnail_images.pop('c')
+        obj.thumbnail_loader = RecordingLoader()
+
+        assert obj.preload_thumbnails(3) == 2
+        assert obj.thumbnail_loader.submitted == [(0, 'b'), (0, 'c')]
+
+    def test_progress_counted_when_job_replaced(self, tmp_path):
+        """Une ligne liée au projet remplace la tâche de préchargement : elle compte quand même."""
+        obj = _selector_with_projects(tmp_path, ['a', 'b'])
+        obj._thumbnail_images.clear()
+        obj._rows_by_project = {}
+        obj.thumbnail_loader = KeyedLoader()
+        progress = []
+
+        assert obj.preload_thumbnails(2, on_progress=lambda done, n: progress.append((done, n))) == 2
+        obj._request_thumbnails('a', 'a_1.png', 'a_4.png', priority=1)
+        obj.thumbnail_loader.run_all()
+
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert obj._preload is None
+
+    def test_progress_counted_when_job_cancelled(self, tmp_path):
+        """Un projet dont le décodage est annulé ne retient pas l'écran de démarrage."""
+        obj = _selector_with_projects(tmp_path, ['a', 'b'])
+        obj._thumbnail_images.clear()
+        obj._rows_by_project = {}
+        obj.thumbnail_loader = KeyedLoader()
+        progress = []
+
+        obj.preload_thumbnails(2, on_progress=lambda done, n: progress.append((done, n)))
+        obj._cancel_thumbnails('a')
+        obj.thumbnail_loader.run_all()
+
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert 'a' not in obj._thumbnail_images
+
+    def test_initial_row_count_covers_window_height(self):
+        count = cs.CadreSelecteur.initial_row_count()
+        height = int(cs.WINDOWS_SIZE.split('x')[1].split('+')[0])
+        assert count * (cs.THUMBNAIL_L + cs.ROW_SPACING) >= height
+
+
+class FakeMaster:
+    """Planifie les after() sans Tk (exécutés à la demande)."""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+    def after(self, ms, callback):
+        after_id = f'after#{len(self.scheduled)}'
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+
+class FakeVar:
+    def __init__(self, value=''):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def _selector_with_trash(tmp_path, monkeypatch, names):
+    from collections import OrderedDict
+    from CadreSelecteur.trash import Trash
+    obj = _selector_with_projects(tmp_path, names)
+    obj.master = FakeMaster()
+    obj.selected_image = FakeVar()
+    obj.thumbnail_loader = None
+    obj.trash = Trash(tmp_path)
+    obj.trash_worker = RecordingLoader()
+    obj._pending_trash = OrderedDict()
+    monkeypatch.setattr(cs.messagebox, 'askyesno', lambda *a, **k: True)
+    return obj
+
+
+class TestDeleteWithTrash:
+    """Suppression non bloquante via la corbeille."""
+
+    def test_row_removed_immediately_and_purge_deferred(self, tmp_path, monkeypatch):
+        obj = _selector_with_trash(tmp_path, monkeypatch, ['a', 'b'])
+        obj.selected_image.set('a')
+
+        obj.del_border('a')
+
+        assert [p.name for p in obj.projects] == ['b']
+        assert obj.virtual_list.calls == [('set_items', ['b'])]
+        assert obj.selected_image.get() == ''
+        # effacement réel seulement à la fin du délai d'annulation, dans le thread dédié
+        assert obj.trash_worker.submitted == []
+        (purge,) = obj.master.scheduled.values()
+        purge()
+        assert len(obj.trash_worker.submitted) == 1
+        assert not obj._pending_trash
+
+    def test_undo_restores_project(self, tmp_path, monkeypatch):
+        obj = _selector_with_trash(tmp_path, monkeypatch, ['a', 'b'])
+        obj.del_border('a')
+
+        obj.undo_delete()
+
+        assert [p.name for p in obj.projects] == ['a', 'b']
+        assert (tmp_path / 'a' / 'a_1.png').exists()
+        assert obj.master.scheduled == {}
+        assert obj.trash_worker.submitted == []
+
+
+class FakeWatcher:
+    def __init__(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+
+class TestClose:
+    """Fermeture du sélecteur."""
+
+    def test_stops_watcher_and_workers(self, tmp_path, monkeypatch):
+        obj = _selector_with_trash(tmp_path, monkeypatch, ['a'])
+        obj.thumbnail_loader = RecordingLoader()
+        obj.preview_loader = RecordingLoader()
+        obj.change_watcher = FakeWatcher()
+
+        obj.close()
+
+        assert not obj.change_watcher.running
+        assert obj.thumbnail_loader.stopped and obj.preview_loader.stopped and obj.trash_worker.stopped
+        assert obj.master.destroyed
+
+
+class FakePhoto:
+    """PhotoImage factice (sans Tk)."""
+
+    def __init__(self, size):
+        self.size = size
+
+    def width(self):
+        return self.size[0]
+
+    def height(self):
+        return self.size[1]
+
+    def paste(self, image):
+        pass
+
+
+def _project_row(project):
+    """ProjectRow sans Tk : labels factices, sans atlas."""
+    row = object.__new__(cs.ProjectRow)
+    row.project = project
+    row.thumbnail_labels = [DummyLabel(), DummyLabel()]
+    row.atlas_items = [None, None]
+    return row
+
+
+class FakeVirtualList:
+    def __init__(self, rows, visible):
+        self.rows = rows
+        self.visible = visible
+
+    def visible_range(self):
+        return self.visible
+
+    def bound_rows(self):
+        return dict(enumerate(self.rows))
+
+
+def _budget_selector(names, visible):
+    """Sélecteur sans atlas, dont le budget ne tient qu'une vignette de 10x10."""
+    from collections import OrderedDict
+    from PIL import Image
+    from CadreSelecteur.image_ref_manager import ImageRefManager
+    obj = object.__new__(cs.CadreSelecteur)
+    obj.thumbnail_atlas = None
+    obj.placeholder_thumbnail = 'placeholder'
+    obj._thumbnail_images = OrderedDict((n, (Image.new('RGB', (10, 10)),) * 2) for n in names)
+    obj.created = []
+    obj._photoimage_from_pil = lambda image: obj.created.append(FakePhoto(image.size)) or obj.created[-1]
+    rows = [_project_row(n) for n in names]
+    obj.virtual_list = FakeVirtualList(rows, visible)
+    obj.image_ref_manager = ImageRefManager(budget_bytes=400, pinned=obj._visible_thumbnail_keys)
+    for row in rows:
+        obj._set_row_thumbnails(row, obj._thumbnail_images[row.project])
+    return obj, rows
+
+
+class TestThumbnailBudget:
+    """Budget mémoire des vignettes : les images évincées sont libérées, jamais celles des lignes visibles."""
+
+    def test_visible_rows_keep_their_image(self):
+        obj, rows = _budget_selector(['a', 'b', 'c', 'd'], (0, 2))
+
+        manager = obj.image_ref_manager
+        assert manager.evictions > 0
+        for row in rows[:2]:
+            for slot in range(2):
+                image = row.thumbnail_labels[slot].image
+                assert isinstance(image, FakePhoto)
+                assert manager.get_ref((id(row), slot), 'thumbnails') is image
+
+    def test_evicted_photo_released(self):
+        import gc
+        import weakref
+        obj, rows = _budget_selector(['a', 'b', 'c', 'd'], (0, 2))
+        # première vignette de la ligne 'c' (marge d'overscan), évincée ensuite
+        evicted = weakref.ref(obj.created[4])
+        obj.created.clear()
+        gc.collect()
+
+        assert rows[2].thumbnail_labels[0].image == 'placeholder'
+        assert evicted() is None
+
+    def test_evicted_rows_restored_when_visible(self):
+        obj, rows = _budget_selector(['a', 'b', 'c', 'd'], (0, 2))
+
+        obj.virtual_list.visible = (2, 4)
+        obj._restore_visible_thumbnails()
+
+        for row in rows[2:]:
+            assert all(isinstance(label.image, FakePhoto) for label in row.thumbnail_labels)
+        # les lignes sorties de la zone visible ont été évincées à leur tour
+        assert rows[0].thumbnail_labels[0].image == 'placeholder'
+
+    def test_label_keeps_reference(self):
+        row = _project_row('a')
+        photo = FakePhoto((10, 10))
+
+        row.show_thumbnail(1, photo)
+
+        assert row.thumbnail_labels[1].image is photo
+
+
+class TestTrashAssets:
+    """Effacement définitif d'un projet : les images importées qu'il était seul à utiliser sont effacées."""
+
+    def test_purge_collects_unreferenced_blobs(self, tmp_path, monkeypatch):
+        from CadreSelecteur.asset_store import AssetStore
+        obj = _selector_with_trash(tmp_path, monkeypatch, ['a', 'b'])
+        obj.asset_store = AssetStore(tmp_path)
+        only_a = obj.asset_store.manifest(tmp_path / 'a').add_bytes(b'logo', 'logo.png')
+        blob = obj.asset_store.manifest(tmp_path / 'a').resolve(only_a)
+        os.utime(blob, (0, 0))
+        entry = obj.trash.move('a')
+
+        assert obj._purge_trash_and_assets(entry)
+        assert not blob.exists()
+
+    def test_collect_after_editor_save(self, tmp_path, monkeypatch):
+        from CadreSelecteur.asset_store import AssetStore
+        obj = _selector_with_trash(tmp_path, monkeypatch, ['a'])
+        obj.asset_store = AssetStore(tmp_path)
+        assets = obj.asset_store.manifest(tmp_path / 'a')
+        blob = assets.resolve(assets.add_bytes(b'logo', 'logo.png'))
+        os.utime(blob, (0, 0))
+        # l'éditeur enregistre le projet sans le calque qui utilisait l'image
+        assets.retain([])
+
+        obj._submit_asset_collect()
+
+        assert obj.trash_worker.submitted == [(0, 'collect_assets')]
+        assert obj._purge_trash_and_assets()
+        assert not blob.exists()
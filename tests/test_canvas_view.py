@@ -0,0 +1,163 @@
+"""
+Tests de l'aperçu par items du canvas (canvas_view, mode EDITOR_RENDER_MODE = "items").
+
+Valide que:
+1. La première synchronisation crée un item par calque et fixe le fond du canvas
+2. Déplacer un calque est un canvas.move(), sans nouvelle PhotoImage
+3. Un calque modifié (version) est recréé puis replacé sous le calque du dessus
+4. Un changement d'ordre de la pile est appliqué par tag_raise()
+5. Masquer / supprimer un calque modifie / supprime ses seuls items
+"""
+from types import SimpleNamespace
+
+from PIL import Image
+
+from CadreSelecteur.CadreEditeur.canvas_view import CanvasLayerView
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage
+
+SIZE = (120, 80)
+
+
+class FakeCanvas:
+    """Enregistre les appels au canvas Tk."""
+
+    def __init__(self):
+        self.calls = []
+        self.items = {}
+        self._next_id = 0
+
+    def config(self, **kwargs):
+        self.calls.append(('config', kwargs))
+
+    def create_image(self, x, y, **kwargs):
+        self._next_id += 1
+        self.items[self._next_id] = (x, y, kwargs)
+        self.calls.append(('create_image', kwargs['tags'][0]))
+        return self._next_id
+
+    def delete(self, tag):
+        self.calls.append(('delete', tag))
+
+    def move(self, tag, dx, dy):
+        self.calls.append(('move', tag, dx, dy))
+
+    def itemconfigure(self, tag, **kwargs):
+        self.calls.append(('itemconfigure', tag, kwargs))
+
+    def tag_raise(self, tag, *above):
+        self.calls.append(('tag_raise', tag) + above)
+
+    def tag_lower(self, tag, *below):
+        self.calls.append(('tag_lower', tag) + below)
+
+    def named(self, name):
+        return [c for c in self.calls if c[0] == name]
+
+
+def _image_layer(color, position, size=(30, 20)):
+    layer = LayerImage(None, SimpleNamespace(frame_dir=None), SIZE, SIZE, 1)
+    layer.display_imported_image = Image.new('RGBA', size, color)
+    layer.display_imported_image_size = size
+    layer.display_position = position
+    return layer
+
+
+def _setup(count=3):
+    canvas = FakeCanvas()
+    view = CanvasLayerView(canvas, photo_factory=lambda image: image.copy())
+    layers = [_image_layer((60 * i, 0, 0, 255), (i * 10, i * 5)) for i in range(count)]
+    view.sync(layers, '#ffffff')
+    canvas.calls.clear()
+    return canvas, view, layers
+
+
+def _tag(view, layer):
+    return view._items[id(layer)].tag
+
+
+class TestFirstSync:
+    """Création des items."""
+
+    def test_items_created_and_background_set(self):
+        canvas = FakeCanvas()
+        view = CanvasLayerView(canvas, photo_factory=lambda image: image.copy())
+        layers = [_image_layer((255, 0, 0, 255), (10, 10)), _image_layer((0, 255, 0, 255), (20, 15))]
+
+        view.sync(layers, '#336699')
+
+        assert canvas.named('config') == [('config', {'background': '#336699'})]
+        assert len(canvas.named('create_image')) == 2
+        assert view.photos_created == 2
+        assert sorted((x, y) for x, y, _ in canvas.items.values()) == [(10, 10), (20, 15)]
+        # pile restaurée du bas vers le haut : le calque 0 est relevé en dernier
+        assert canvas.named('tag_raise')[-1] == ('tag_raise', _tag(view, layers[0]))
+
+    def test_unchanged_stack_makes_no_call(self):
+        canvas, view, layers = _setup()
+        view.sync(layers, '#ffffff')
+        assert canvas.calls == []
+
+
+class TestDrag:
+    """Déplacement d'un calque."""
+
+    def test_drag_moves_items_only(self):
+        canvas, view, layers = _setup()
+
+        for step in range(1, 6):
+            layers[1].display_position = (10 + step, 5 + step)
+            view.sync(layers, '#ffffff')
+
+        assert canvas.named('move') == [('move', _tag(view, layers[1]), 1, 1)] * 5
+        assert canvas.named('create_image') == []
+        assert view.photos_created == 3
+
+
+class TestLayerChanges:
+    """Modification, ordre, visibilité et suppression."""
+
+    def test_changed_layer_rebuilt_below_upper_layer(self):
+        canvas, view, layers = _setup()
+
+        layers[2].display_imported_image = Image.new('RGBA', (30, 20), (0, 0, 255, 255))
+        layers[2].invalidate()
+        view.sync(layers, '#ffffff')
+
+        tag = _tag(view, layers[2])
+        assert canvas.named('delete') == [('delete', tag)]
+        assert canvas.named('create_image') == [('create_image', tag)]
+        assert canvas.named('tag_lower') == [('tag_lower', tag, _tag(view, layers[1]))]
+
+    def test_top_layer_rebuilt_without_restack(self):
+        canvas, view, layers = _setup()
+        layers[0].invalidate()
+        view.sync(layers, '#ffffff')
+        assert canvas.named('tag_lower') == []
+        assert canvas.named('tag_raise') == []
+
+    def test_order_change_restacks(self):
+        canvas, view, layers = _setup()
+
+        layers[0], layers[1] = layers[1], layers[0]
+        view.sync(layers, '#ffffff')
+
+        assert [c[1] for c in canvas.named('tag_raise')] == [_tag(view, layer) for layer in reversed(layers)]
+        assert canvas.named('create_image') == []
+        assert view.restacks == 2
+
+    def test_hide_layer(self):
+        canvas, view, layers = _setup()
+        layers[1].visible = False
+        view.sync(layers, '#ffffff')
+        assert canvas.calls == [('itemconfigure', _tag(view, layers[1]), {'state': 'hidden'})]
+
+    def test_removed_layer_deleted(self):
+        canvas, view, layers = _setup()
+        removed = layers.pop(1)
+        tag = _tag(view, removed)
+
+        view.sync(layers, '#ffffff')
+
+        assert ('delete', tag) in canvas.calls
+        assert id(removed) not in view._items
+        assert canvas.named('create_image') == []
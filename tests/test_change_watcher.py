@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour ChangeWatcher.
+
+Valide que:
+1. La différence entre deux instantanés distingue ajouts, suppressions et modifications
+2. Les événements inotify sont décodés
+3. Les deux mécanismes (inotify et scrutation) signalent les projets modifiés, regroupés
+"""
+
+import struct
+import sys
+
+import pytest
+
+from CadreSelecteur.change_watcher import (
+    ChangeWatcher,
+    diff_snapshots,
+    parse_inotify_events,
+    IN_CREATE,
+    IN_ISDIR,
+)
+
+
+@pytest.fixture
+def templates(tmp_path):
+    for name in ('noel', 'mariage'):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f'{name}_1.png').write_bytes(b'x')
+    return tmp_path
+
+
+def _run_until_quiet(widget, received):
+    # 1er tick : changements relevés ; 2e tick (période calme) : callback
+    widget.run_pending()
+    widget.run_pending()
+    return received
+
+
+class TestDiffSnapshots:
+    """Tests de la comparaison d'instantanés."""
+
+    def test_diff(self):
+        diff = diff_snapshots({'a': 1, 'b': 2, 'c': 3}, {'b': 2, 'c': 4, 'd': 5})
+        assert diff.added == {'d'}
+        assert diff.removed == {'a'}
+        assert diff.modified == {'c'}
+
+    def test_empty_diff_is_false(self):
+        assert not diff_snapshots({'a': 1}, {'a': 1})
+
+
+class TestParseInotifyEvents:
+    """Tests du décodage des événements inotify."""
+
+    def test_parse_events(self):
+        name = b'noel\0\0\0\0'
+        buffer = (struct.pack('iIII', 1, IN_CREATE | IN_ISDIR, 0, len(name)) + name
+                  + struct.pack('iIII', 2, IN_CREATE, 0, 0))
+        assert list(parse_inotify_events(buffer)) == [(1, IN_CREATE | IN_ISDIR, 'noel'),
+                                                      (2, IN_CREATE, '')]
+
+
+class TestChangeWatcher:
+    """Tests de la surveillance des répertoires."""
+
+    @pytest.mark.parametrize('use_inotify', [False, True])
+    def test_reports_modified_project(self, widget, templates, use_inotify):
+        """Modifier un fichier d'un projet ne signale que ce projet."""
+        if use_inotify and not sys.platform.startswith('linux'):
+            pytest.skip("inotify is Linux only")
+        received = []
+        watcher = ChangeWatcher(widget, received.append, use_inotify=use_inotify)
+        if use_inotify and watcher.backend != 'inotify':
+            pytest.skip("inotify unavailable")
+        watcher.watch(templates)
+        watcher.start()
+
+        (templates / 'noel' / 'noel_1.png').write_bytes(b'modifie')
+
+        assert _run_until_quiet(widget, received) == [{templates: {'noel'}}]
+        watcher.stop()
+
+    @pytest.mark.parametrize('use_inotify', [False, True])
+    def test_reports_added_and_removed_projects(self, widget, templates, use_inotify):
+        """Création et suppression de projets ; les entrées cachées sont ignorées."""
+        if use_inotify and not sys.platform.startswith('linux'):
+            pytest.skip("inotify is Linux only")
+        import shutil
+        received = []
+        watcher = ChangeWatcher(widget, received.append, use_inotify=use_inotify)
+        if use_inotify and watcher.backend != 'inotify':
+            pytest.skip("inotify unavailable")
+        watcher.watch(templates)
+        watcher.start()
+
+        (templates / 'paques').mkdir()
+        shutil.rmtree(templates / 'mariage')
+        (templates / '.trash').mkdir()
+
+        assert _run_until_quiet(widget, received) == [{templates: {'paques', 'mariage'}}]
+        watcher.stop()
+
+    def test_no_callback_without_changes(self, widget, templates):
+        received = []
+        watcher = ChangeWatcher(widget, received.append, use_inotify=False)
+        watcher.watch(templates)
+        watcher.start()
+
+        assert _run_until_quiet(widget, received) == []
+
+    def test_stop_cancels_polling(self, widget, templates):
+        watcher = ChangeWatcher(widget, lambda changes: None, use_inotify=False)
+        watcher.watch(templates)
+        watcher.start()
+        watcher.stop()
+
+        assert widget._callbacks == {}
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour la ligne de commande (sans Tk).
+
+Valide que:
+1. list affiche les projets installables
+2. install installe un projet puis ne recopie rien s'il est déjà installé
+3. Aucun module graphique n'est importé par la ligne de commande
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from CadreSelecteur.cli import main
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def templates(tmp_path):
+    root = tmp_path / 'Templates'
+    for name in ('noel', 'mariage'):
+        (root / name).mkdir(parents=True)
+        (root / name / f'{name}_1.png').write_bytes(b'1' + name.encode())
+        (root / name / f'{name}_4.png').write_bytes(b'4' + name.encode())
+    (root / 'incomplet').mkdir()
+    (root / 'incomplet' / 'incomplet_1.png').write_bytes(b'1')
+    (root / 'template_1.xml').write_text('<standard/>')
+    return root
+
+
+@pytest.fixture
+def destination(tmp_path):
+    dest = tmp_path / 'Cadres'
+    dest.mkdir()
+    return dest
+
+
+class TestCli:
+    """Tests des commandes list et install."""
+
+    def test_list(self, templates, capsys):
+        assert main(['--templates', str(templates), 'list']) == 0
+        assert capsys.readouterr().out.split() == ['mariage', 'noel']
+
+    def test_list_all(self, templates, capsys):
+        assert main(['--templates', str(templates), 'list', '--all']) == 0
+        assert capsys.readouterr().out.split() == ['incomplet', 'mariage', 'noel']
+
+    def test_install_then_unchanged(self, templates, destination, capsys):
+        args = ['--templates', str(templates), '--destination', str(destination), 'install', 'noel']
+
+        assert main(args) == 0
+        assert capsys.readouterr().out.startswith('installed: noel')
+        assert (destination / 'cadre_1.png').read_bytes() == b'1noel'
+        # pas de template propre au projet : template standard
+        assert (destination / 'template.xml').read_text() == '<standard/>'
+
+        assert main(args) == 0
+        assert capsys.readouterr().out.startswith('unchanged: noel')
+
+    @pytest.mark.parametrize('project', ['absent', 'incomplet'])
+    def test_install_errors(self, templates, destination, project, capsys):
+        args = ['--templates', str(templates), '--destination', str(destination), 'install', project]
+        assert main(args) == 1
+        assert capsys.readouterr().err.startswith('error:')
+        assert list(destination.iterdir()) == []
+
+    def test_no_gui_modules_imported(self):
+        code = ("import sys; from CadreSelecteur.cli import main; "
+                "main(['list']); "
+                "gui = [m for m in sys.modules if m.split('.')[0] in ('tkinter', 'PIL') "
+                "or m.startswith('CadreSelecteur.CadreEditeur')]; "
+                "assert not gui, gui")
+        result = subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
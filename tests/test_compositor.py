@@ -0,0 +1,255 @@
+"""
+Tests de la composition de l'aperçu de l'éditeur (compositor).
+
+Valide que:
+1. L'aperçu composé est identique au rendu complet calque par calque
+2. Déplacer le calque actif ne recalcule pas les images aplaties dessous / dessus
+3. Une modification d'un calque (version), du fond ou du calque actif invalide le cache
+4. Le raster d'affichage d'un calque texte reproduit draw.text() sans recharger la police
+5. update() ne recompose que l'union des rectangles avant / après du calque actif
+"""
+from types import SimpleNamespace
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+import CadreSelecteur.CadreEditeur.layertext as layertext_mod
+from CadreSelecteur.CadreEditeur.compositor import LayerCompositor
+from CadreSelecteur.CadreEditeur.layer import Layer
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage
+from CadreSelecteur.CadreEditeur.layertext import LayerText
+
+SIZE = (120, 80)
+
+
+class DummyStringVar:
+    def __init__(self, value=''):
+        self._v = value
+
+    def set(self, v):
+        self._v = v
+
+    def get(self):
+        return self._v
+
+    def trace_add(self, *_args):
+        pass
+
+
+class DrawnLayer(Layer):
+    """Calque sans raster d'affichage : redessiné à chaque image."""
+
+    def __init__(self, color):
+        super().__init__('drawn', SIZE, SIZE, 1)
+        self.color = color
+        self.draws = 0
+
+    def draw_on_image(self, image, export=False):
+        self.draws += 1
+        ImageDraw.Draw(image).rectangle((0, 0, 5, 5), fill=self.color)
+
+
+def _image_layer(color, position, size=(30, 20)):
+    layer = LayerImage(None, SimpleNamespace(frame_dir=None), SIZE, SIZE, 1)
+    layer.display_imported_image = Image.new('RGBA', size, color)
+    layer.display_imported_image_size = size
+    layer.display_position = position
+    return layer
+
+
+def _full_redraw(layers, background):
+    image = Image.new('RGBA', SIZE, background)
+    for layer in reversed(layers):
+        layer.draw_on_image(image, export=False)
+    return image
+
+
+def _same(a, b):
+    return ImageChops.difference(a, b).getbbox() is None
+
+
+class TestComposition:
+    """Résultat de la composition."""
+
+    def test_matches_full_redraw(self):
+        layers = [_image_layer((255, 0, 0, 255), (10, 10)),
+                  _image_layer((0, 255, 0, 255), (20, 15)),
+                  _image_layer((0, 0, 255, 255), (-10, 40)),
+                  _image_layer((255, 255, 0, 255), (100, 70))]
+        compositor = LayerCompositor(SIZE)
+
+        for active in (-1, 0, 1, 3):
+            frame = compositor.render(layers, active, '#808080')
+            assert _same(frame, _full_redraw(layers, '#808080')), active
+
+    def test_hidden_layers_skipped(self):
+        layers = [_image_layer((255, 0, 0, 255), (10, 10)),
+                  _image_layer((0, 255, 0, 255), (20, 15))]
+        layers[0].visible = False
+        frame = LayerCompositor(SIZE).render(layers, 1, '#ffffff')
+        assert frame.getpixel((12, 12)) == (255, 255, 255, 255)
+
+    def test_uncacheable_layer_redrawn(self):
+        drawn = DrawnLayer('#00ffff')
+        layers = [_image_layer((255, 0, 0, 255), (10, 10)), drawn]
+        compositor = LayerCompositor(SIZE)
+
+        compositor.render(layers, 0, '#ffffff')
+        frame = compositor.render(layers, 0, '#ffffff')
+
+        assert drawn.draws == 2
+        assert frame.getpixel((1, 1)) == (0, 255, 255, 255)
+
+
+class TestCache:
+    """Images aplaties en cache."""
+
+    def _stack(self, count=6):
+        return [_image_layer((40 * i % 256, 0, 0, 255), (i * 5, i * 3)) for i in range(count)]
+
+    def test_drag_reuses_flattened_images(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.render(layers, 2, '#ffffff')
+
+        active = layers[2]
+        for step in range(5):
+            active.display_position = (step, step)
+            frame = compositor.render(layers, 2, '#ffffff')
+
+        assert (compositor.below_renders, compositor.above_renders) == (1, 1)
+        assert _same(frame, _full_redraw(layers, '#ffffff'))
+
+    def test_layer_change_invalidates(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.render(layers, 2, '#ffffff')
+
+        layers[4].display_imported_image = Image.new('RGBA', (30, 20), (0, 0, 255, 255))
+        layers[4].invalidate()
+        frame = compositor.render(layers, 2, '#ffffff')
+
+        assert compositor.below_renders == 2
+        assert compositor.above_renders == 1
+        assert _same(frame, _full_redraw(layers, '#ffffff'))
+
+    def test_background_and_active_layer_invalidate(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.render(layers, 2, '#ffffff')
+
+        compositor.render(layers, 2, '#000000')
+        assert compositor.below_renders == 2
+
+        compositor.render(layers, 3, '#000000')
+        assert (compositor.below_renders, compositor.above_renders) == (3, 2)
+
+    def test_layer_raster_cached_by_version(self):
+        layer = _image_layer((255, 0, 0, 255), (0, 0))
+        first = layer.display_raster()
+        assert layer.display_raster() is first
+        layer.invalidate()
+        assert layer.display_raster() is not first
+
+
+class TestDirtyRegion:
+    """Mise à jour par rectangle modifié."""
+
+    def _stack(self, count=5):
+        return [_image_layer((50 * i % 256, 100, 0, 255), (i * 10, i * 6), size=(20, 12)) for i in range(count)]
+
+    def test_first_update_is_full(self):
+        compositor = LayerCompositor(SIZE)
+        frame, box = compositor.update(self._stack(), 1, '#ffffff')
+        assert box == (0, 0) + SIZE
+        assert compositor.full_updates == 1
+
+    def test_unchanged_returns_no_box(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 1, '#ffffff')
+        assert compositor.update(layers, 1, '#ffffff')[1] is None
+
+    def test_drag_updates_union_of_boxes(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 2, '#ffffff')
+        x, y = layers[2].display_position
+
+        layers[2].display_position = (x + 3, y + 2)
+        frame, box = compositor.update(layers, 2, '#ffffff')
+
+        assert box == (x, y, x + 3 + 20, y + 2 + 12)
+        assert compositor.region_updates == 1
+        assert _same(frame, _full_redraw(layers, '#ffffff'))
+
+    def test_region_clipped_to_canvas(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 0, '#ffffff')
+
+        layers[0].display_position = (-15, -5)
+        frame, box = compositor.update(layers, 0, '#ffffff')
+
+        assert box == (0, 0, 20, 12)
+        assert _same(frame, _full_redraw(layers, '#ffffff'))
+
+    def test_hiding_active_layer_updates_old_box(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 3, '#ffffff')
+
+        layers[3].visible = False
+        frame, box = compositor.update(layers, 3, '#ffffff')
+
+        assert box == (30, 18, 50, 30)
+        assert _same(frame, _full_redraw(layers, '#ffffff'))
+
+    def test_other_changes_update_everything(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 3, '#ffffff')
+
+        assert compositor.update(layers, 2, '#ffffff')[1] == (0, 0) + SIZE
+        assert compositor.update(layers, 2, '#000000')[1] == (0, 0) + SIZE
+        assert compositor.full_updates == 3
+
+    def test_work_scales_with_changed_area(self):
+        layers = self._stack()
+        compositor = LayerCompositor(SIZE)
+        compositor.update(layers, 1, '#ffffff')
+        full_pixels = compositor.pixels_composed
+
+        for step in range(1, 11):
+            layers[1].display_position = (10 + step, 6)
+            compositor.update(layers, 1, '#ffffff')
+
+        assert compositor.pixels_composed - full_pixels == 10 * 21 * 12
+
+
+class TestTextRaster:
+    """Raster d'affichage d'un calque texte."""
+
+    def test_matches_draw_text(self, monkeypatch):
+        monkeypatch.setattr(layertext_mod.tk, 'StringVar', DummyStringVar)
+        layer = LayerText(None, None, SIZE, SIZE, 1, name='T')
+        layer.text.set('Ab\ncd')
+        layer.font_color = '#ffcc00'
+        layer.display_position = (7, 3)
+
+        cached = Image.new('RGBA', SIZE, '#336699')
+        layer.draw_on_image(cached, export=False)
+
+        expected = Image.new('RGBA', SIZE, '#336699')
+        font = ImageFont.truetype(layer.font_name, layer.sel_font['size'])
+        ImageDraw.Draw(expected).text((7, 3), 'Ab\ncd', fill='#ffcc00', font=font)
+
+        assert _same(cached, expected)
+
+    def test_text_change_invalidates(self, monkeypatch):
+        monkeypatch.setattr(layertext_mod.tk, 'StringVar', DummyStringVar)
+        layer = LayerText(None, None, SIZE, SIZE, 1, name='T')
+        first = layer.display_raster()
+
+        layer.resize_font(4)
+
+        assert layer.display_raster() is not first
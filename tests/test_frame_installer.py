@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour FrameInstaller.
+
+Valide que:
+1. Les fichiers sont installés puis sautés s'ils sont déjà identiques
+2. Un échec de préparation laisse la destination intacte
+3. Un échec pendant la mise en place restaure les fichiers déjà remplacés
+4. Aucun répertoire temporaire ne reste dans la destination
+"""
+
+import os
+
+import pytest
+
+from CadreSelecteur.frame_installer import FrameInstaller, files_identical
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src = tmp_path / 'Templates' / 'noel'
+    src.mkdir(parents=True)
+    (src / 'noel_1.png').write_bytes(b'un' * 100)
+    (src / 'noel_4.png').write_bytes(b'quatre' * 100)
+    (src / 'noel.xml').write_text('<template/>')
+    return src
+
+
+@pytest.fixture
+def destination(tmp_path):
+    dest = tmp_path / 'Cadres'
+    dest.mkdir()
+    return dest
+
+
+def _files(src):
+    return {
+        'cadre_1.png': src / 'noel_1.png',
+        'cadre_4.png': src / 'noel_4.png',
+        'template.xml': src / 'noel.xml',
+    }
+
+
+class TestFilesIdentical:
+    """Tests de la comparaison de contenu."""
+
+    def test_identical_and_different(self, tmp_path):
+        a, b, c = tmp_path / 'a', tmp_path / 'b', tmp_path / 'c'
+        a.write_bytes(b'abc')
+        b.write_bytes(b'abc')
+        c.write_bytes(b'abd')
+        assert files_identical(a, b)
+        assert not files_identical(a, c)
+        assert not files_identical(a, tmp_path / 'absent')
+
+
+class TestFrameInstaller:
+    """Tests de l'installation atomique."""
+
+    @pytest.mark.parametrize('link_mode', ['reflink', 'hardlink', 'copy'])
+    def test_install_then_skip(self, sources, destination, link_mode):
+        installer = FrameInstaller(destination, link_mode=link_mode)
+
+        first = installer.install(_files(sources))
+        assert first.installed == ['cadre_1.png', 'cadre_4.png', 'template.xml']
+        assert (destination / 'cadre_4.png').read_bytes() == b'quatre' * 100
+
+        second = installer.install(_files(sources))
+        assert not second.changed
+        assert second.skipped == ['cadre_1.png', 'cadre_4.png', 'template.xml']
+
+        assert sorted(os.listdir(destination)) == ['cadre_1.png', 'cadre_4.png', 'template.xml']
+
+    def test_only_modified_file_is_replaced(self, sources, destination):
+        installer = FrameInstaller(destination, link_mode='copy')
+        installer.install(_files(sources))
+        (sources / 'noel_1.png').write_bytes(b'nouveau' * 100)
+
+        result = installer.install(_files(sources))
+
+        assert result.installed == ['cadre_1.png']
+        assert (destination / 'cadre_1.png').read_bytes() == b'nouveau' * 100
+
+    def test_hardlink_shares_inode(self, sources, destination):
+        FrameInstaller(destination, link_mode='hardlink').install(_files(sources))
+        assert os.stat(destination / 'cadre_1.png').st_ino == os.stat(sources / 'noel_1.png').st_ino
+
+    def test_failure_leaves_destination_intact(self, sources, destination):
+        (destination / 'cadre_1.png').write_bytes(b'ancien')
+        files = _files(sources)
+        files['template.xml'] = sources / 'absent.xml'
+
+        with pytest.raises(FileNotFoundError):
+            FrameInstaller(destination).install(files)
+
+        assert (destination / 'cadre_1.png').read_bytes() == b'ancien'
+        assert os.listdir(destination) == ['cadre_1.png']
+
+    def test_failed_replace_restores_previous_files(self, sources, destination, monkeypatch):
+        (destination / 'cadre_1.png').write_bytes(b'ancien')
+        real_replace = os.replace
+        calls = []
+
+        def failing_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError('disk full')
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', failing_replace)
+        with pytest.raises(OSError, match='disk full'):
+            FrameInstaller(destination, link_mode='copy').install(_files(sources))
+        monkeypatch.setattr(os, 'replace', real_replace)
+
+        assert (destination / 'cadre_1.png').read_bytes() == b'ancien'
+        assert os.listdir(destination) == ['cadre_1.png']
+
+    def test_failed_replace_removes_new_files(self, sources, destination, monkeypatch):
+        real_replace = os.replace
+
+        def failing_replace(src, dst):
+            if str(dst).endswith('template.xml'):
+                raise OSError('disk full')
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, 'replace', failing_replace)
+        with pytest.raises(OSError):
+            FrameInstaller(destination, link_mode='copy').install(_files(sources))
+
+        assert os.listdir(destination) == []
+
+    def test_unknown_link_mode(self, destination):
+        with pytest.raises(ValueError):
+            FrameInstaller(destination, link_mode='symlink')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour le décodage à résolution réduite.
+
+Valide que:
+1. Les dimensions cibles respectent les proportions (vignette) ou la taille exacte (aperçu)
+2. Les sources PNG et JPEG produisent une image chargée à la bonne taille
+"""
+
+from PIL import Image
+
+from CadreSelecteur.image_decode import decode_preview, fit_size, reduce_factor
+
+
+class TestSizes:
+    """Tests des calculs de dimensions."""
+
+    def test_fit_size_keeps_ratio(self):
+        assert fit_size((1800, 1200), (128, 85)) == (128, 85)
+        assert fit_size((1200, 1800), (128, 85)) == (57, 85)
+
+    def test_fit_size_never_upscales(self):
+        assert fit_size((100, 50), (128, 85)) == (100, 50)
+
+    def test_reduce_factor(self):
+        assert reduce_factor((1800, 1200), (128, 85)) == 7
+        assert reduce_factor((1800, 1200), (720, 480)) == 1
+        assert reduce_factor((1800, 1200), (720, 480), gap=1.0) == 2
+
+
+class TestDecodePreview:
+    """Tests du décodage d'images."""
+
+    def test_png_thumbnail(self, tmp_path):
+        src = tmp_path / 'cadre_1.png'
+        Image.new('RGBA', (1800, 1200), (255, 0, 0, 128)).save(src)
+
+        thumb = decode_preview(src, (128, 85))
+
+        assert thumb.size == (128, 85)
+        assert thumb.mode == 'RGBA'
+        assert thumb.getpixel((10, 10)) == (255, 0, 0, 128)
+
+    def test_jpeg_uses_draft(self, tmp_path):
+        src = tmp_path / 'photo.jpg'
+        Image.new('RGB', (1800, 1200), (0, 0, 255)).save(src, quality=90)
+
+        thumb = decode_preview(src, (128, 85))
+
+        assert thumb.size == (128, 85)
+        assert thumb.mode == 'RGB'
+
+    def test_exact_preview_size(self, tmp_path):
+        src = tmp_path / 'cadre_4.png'
+        Image.new('RGBA', (1800, 1200)).save(src)
+
+        preview = decode_preview(src, (720, 480), exact=True, reducing_gap=1.0)
+
+        assert preview.size == (720, 480)
@@ -0,0 +1,106 @@
+"""
+Tests du décodage des images importées dans l'éditeur (image_import).
+
+Valide que:
+1. L'image est limitée à la taille qui couvre l'image export, jamais agrandie
+2. Les JPEG sont décodés à échelle réduite (Image.draft)
+3. L'orientation EXIF est appliquée
+4. L'image réduite est enregistrée en JPEG si opaque, en PNG sinon, sans écraser de fichier existant
+"""
+import os
+
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from CadreSelecteur.CadreEditeur.image_import import cover_size, load_import_image, save_import_derivative
+
+EXPORT = (1800, 1200)
+
+
+def _jpeg(path, size, orientation=None):
+    image = Image.new('RGB', size, (0, 0, 255))
+    # repère rouge dans le coin haut gauche du fichier
+    image.paste((255, 0, 0), (0, 0, size[0] // 4, size[1] // 4))
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    image.save(path, exif=exif)
+    return path
+
+
+class TestCoverSize:
+    """Taille utile à l'export."""
+
+    def test_cover_size(self):
+        assert cover_size((6000, 4000), EXPORT) == (1800, 1200)
+        assert cover_size((4000, 6000), EXPORT) == (1800, 2700)
+        assert cover_size((6000, 1000), EXPORT) == (6000, 1000)
+        assert cover_size((800, 600), EXPORT) == (800, 600)
+
+
+class TestLoadImportImage:
+    """Décodage à mémoire bornée."""
+
+    def test_large_jpeg_capped_with_draft(self, tmp_path, monkeypatch):
+        path = _jpeg(tmp_path / 'photo.jpg', (4800, 3200))
+        drafts = []
+        original_draft = JpegImageFile.draft
+
+        def record_draft(self, mode, size):
+            drafts.append(size)
+            return original_draft(self, mode, size)
+
+        monkeypatch.setattr(JpegImageFile, 'draft', record_draft)
+
+        image = load_import_image(path, EXPORT)
+
+        assert image.size == (1800, 1200)
+        assert image.mode == 'RGBA'
+        assert drafts == [(1800, 1200)]
+
+    def test_small_image_not_enlarged(self, tmp_path):
+        path = tmp_path / 'logo.png'
+        Image.new('P', (300, 200)).save(path)
+        image = load_import_image(path, EXPORT)
+        assert (image.size, image.mode) == ((300, 200), 'RGBA')
+
+    def test_exif_orientation_applied(self, tmp_path):
+        # orientation 6 : l'image est à tourner de 90° dans le sens horaire
+        path = _jpeg(tmp_path / 'portrait.jpg', (3000, 2000), orientation=6)
+
+        image = load_import_image(path, EXPORT)
+
+        assert image.size == (1800, 2700)
+        red, _, blue, _ = image.getpixel((image.width - 10, 10))
+        assert red > 200 and blue < 50
+        red, _, blue, _ = image.getpixel((10, 10))
+        assert blue > 200 and red < 50
+
+
+class TestDerivative:
+    """Enregistrement de l'image réduite."""
+
+    def test_opaque_saved_as_jpeg(self, tmp_path):
+        filename = save_import_derivative(Image.new('RGBA', (40, 30), (1, 2, 3, 255)),
+                                          '/photos/IMG_0001.HEIC.jpeg', tmp_path)
+        assert filename == 'IMG_0001.HEIC.jpg'
+        with Image.open(tmp_path / filename) as img:
+            assert (img.format, img.size) == ('JPEG', (40, 30))
+
+    def test_transparent_saved_as_png(self, tmp_path):
+        filename = save_import_derivative(Image.new('RGBA', (40, 30), (1, 2, 3, 0)), 'logo.gif', tmp_path)
+        assert filename == 'logo.png'
+        with Image.open(tmp_path / filename) as img:
+            assert img.mode == 'RGBA'
+
+    def test_existing_files_not_overwritten(self, tmp_path):
+        source = tmp_path / 'photo.jpg'
+        source.write_bytes(b'original')
+        (tmp_path / 'photo_2.jpg').write_bytes(b'autre')
+
+        filename = save_import_derivative(Image.new('RGBA', (40, 30), (1, 2, 3, 255)), source, tmp_path)
+
+        assert filename == 'photo_3.jpg'
+        assert source.read_bytes() == b'original'
+        assert (tmp_path / 'photo_2.jpg').read_bytes() == b'autre'
+        assert sorted(os.listdir(tmp_path)) == ['photo.jpg', 'photo_2.jpg', 'photo_3.jpg']
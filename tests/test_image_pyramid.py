@@ -0,0 +1,101 @@
+"""
+Tests de la pyramide de réductions des images importées (image_pyramid).
+
+Valide que:
+1. Le niveau choisi est le plus petit encore au moins aussi grand que la cible
+2. Les niveaux sont calculés à la demande, une seule fois tant qu'ils restent en cache
+3. Les niveaux évincés par le budget mémoire sont recalculés au besoin
+4. Un calque image redimensionne depuis sa pyramide
+"""
+from types import SimpleNamespace
+
+from PIL import Image, ImageChops
+
+from CadreSelecteur.CadreEditeur.image_pyramid import ImagePyramid, PyramidLevelCache
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage, FINAL_RESAMPLE
+
+MB = 1024 * 1024
+
+
+def _source(size=(1000, 600)):
+    return Image.new('RGBA', size, (10, 20, 30, 255))
+
+
+class TestLevels:
+    """Choix et calcul des niveaux."""
+
+    def test_level_sizes_match_reduce(self):
+        pyramid = ImagePyramid(_source((1001, 601)), PyramidLevelCache(64 * MB))
+        for level in range(1, 5):
+            assert pyramid.level(level).size == pyramid.level_size(level)
+
+    def test_level_for_target(self):
+        pyramid = ImagePyramid(_source(), PyramidLevelCache(64 * MB))
+        assert pyramid.level_for((2000, 1200)) == 0
+        assert pyramid.level_for((1000, 600)) == 0
+        assert pyramid.level_for((500, 300)) == 1
+        assert pyramid.level_for((499, 300)) == 1
+        assert pyramid.level_for((120, 70)) == 3
+        assert pyramid.level_for((1, 1)) == 10
+
+    def test_levels_built_lazily_once(self):
+        pyramid = ImagePyramid(_source(), PyramidLevelCache(64 * MB))
+        assert pyramid.levels_built == 0
+
+        for _ in range(3):
+            image = pyramid.resize((120, 72))
+
+        assert image.size == (120, 72)
+        assert pyramid.levels_built == 1
+        # un niveau plus grand est réduit depuis la source, un plus petit depuis le niveau en cache
+        pyramid.level(2)
+        assert pyramid.levels_built == 2
+
+    def test_resized_from_level_close_to_direct_resize(self):
+        source = Image.linear_gradient('L').resize((1024, 1024)).convert('RGBA')
+        pyramid = ImagePyramid(source, PyramidLevelCache(64 * MB))
+        direct = source.resize((100, 100), FINAL_RESAMPLE)
+        from_level = pyramid.resize((100, 100))
+        assert max(hi for _, hi in ImageChops.difference(direct, from_level).getextrema()) <= 4
+
+
+class TestEviction:
+    """Budget mémoire des niveaux."""
+
+    def test_evicted_level_rebuilt(self):
+        cache = PyramidLevelCache(300 * 200 * 4)
+        first = ImagePyramid(_source(), cache)
+        second = ImagePyramid(_source(), cache)
+
+        first.level(2)
+        second.level(2)
+        second.level(1)
+
+        assert cache.evictions >= 1
+        assert cache.total_bytes <= cache.max_bytes
+        first.level(2)
+        assert first.levels_built == 2
+
+    def test_release_discards_levels(self):
+        cache = PyramidLevelCache(64 * MB)
+        pyramid = ImagePyramid(_source(), cache)
+        pyramid.level(1)
+        pyramid.level(3)
+
+        pyramid.release()
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+
+def test_layer_image_resizes_from_pyramid():
+    layer = LayerImage(None, SimpleNamespace(frame_dir=None), (60, 40), (180, 120), 3)
+    layer.set_original_image(_source((4000, 2000)))
+    layer.display_imported_image_size = (60, 30)
+    layer.image_imported_image_size = (180, 90)
+
+    layer.resize(10, draft=True)
+
+    assert layer.display_imported_image.size == (70, 35)
+    assert layer.pyramid.levels_built == 1
+    assert layer.pyramid.level_for((70, 35)) == 5
@@ -6,6 +6,8 @@ Valide que:
 1. Les références sont conservées correctement
 2. Le caching par catégorie fonctionne
 3. Les opérations clear fonctionnent
+4. La mémoire retenue est comptée et le budget respecté par éviction LRU
+5. Une image évincée est recréée à la demande (get_ref)
 """
 
 import pytest
@@ -152,6 +154,140 @@ class TestImageRefManager:
         assert manager.get_count() == 0
 
 
+class FakePhoto:
+    """PhotoImage factice (sans Tk) : seules width() et height() sont utilisées."""
+
+    def __init__(self, width=10, height=10):
+        self._size = (width, height)
+
+    def width(self):
+        return self._size[0]
+
+    def height(self):
+        return self._size[1]
+
+
+class TestMemoryBudget:
+    """Comptage des octets et éviction LRU (sans Tk)."""
+
+    def test_bytes_per_category(self):
+        manager = ImageRefManager()
+        manager.add_ref(FakePhoto(10, 10), 'thumbnails')
+        manager.add_ref(FakePhoto(20, 10), 'icons')
+
+        assert manager.get_bytes('thumbnails') == 400
+        assert manager.get_bytes('icons') == 800
+        assert manager.get_bytes() == 1200
+
+    def test_remove_and_clear_update_bytes(self):
+        manager = ImageRefManager()
+        photo = FakePhoto()
+        manager.add_ref(photo, 'thumbnails')
+        manager.add_ref(FakePhoto(), 'thumbnails')
+        manager.remove_ref(photo, 'thumbnails')
+        assert manager.get_bytes('thumbnails') == 400
+
+        manager.clear_category('thumbnails')
+        assert manager.get_bytes() == 0
+
+    def test_budget_evicts_least_recently_used(self):
+        manager = ImageRefManager(budget_bytes=1200)
+        photos = {key: FakePhoto() for key in 'abc'}
+        for key, photo in photos.items():
+            manager.add_ref(photo, 'thumbnails', key=key)
+        manager.get_ref('a', 'thumbnails')  # 'b' devient la plus ancienne
+
+        manager.add_ref(FakePhoto(), 'thumbnails', key='d')
+
+        assert manager.get_bytes() == 1200
+        assert manager.get_ref('b', 'thumbnails') is None
+        assert manager.get_ref('a', 'thumbnails') is photos['a']
+        assert manager.get_stats()['evictions'] == 1
+
+    def test_non_evictable_categories_kept(self):
+        manager = ImageRefManager(budget_bytes=400, evictable=('thumbnails',))
+        icon = FakePhoto()
+        manager.add_ref(icon, 'icons')
+        manager.add_ref(FakePhoto(), 'thumbnails', key='a')
+        manager.add_ref(FakePhoto(), 'thumbnails', key='b')
+
+        assert manager.get_count('icons') == 1
+        assert manager.get_count('thumbnails') == 1
+        # le budget ne peut pas être tenu sans toucher aux icônes
+        assert manager.get_bytes() == 800
+
+    def test_evicted_image_rematerialized(self):
+        manager = ImageRefManager(budget_bytes=400)
+        created = []
+
+        def rematerialize(key):
+            created.append(key)
+            return FakePhoto()
+
+        manager.add_ref(FakePhoto(), 'thumbnails', key='a', rematerialize=rematerialize)
+        manager.add_ref(FakePhoto(), 'thumbnails', key='b', rematerialize=rematerialize)
+        assert manager.get_stats()['evicted'] == 1
+
+        photo = manager.get_ref('a', 'thumbnails')
+
+        assert created == ['a']
+        assert manager.get_ref('a', 'thumbnails') is photo
+        # 'b' évincée à son tour pour faire de la place
+        stats = manager.get_stats()
+        assert stats['rematerializations'] == 1
+        assert stats['evictions'] == 2
+        assert stats['bytes'] == 400
+
+    def test_pinned_keys_not_evicted(self):
+        pinned = {'a'}
+        manager = ImageRefManager(budget_bytes=800, pinned=lambda: pinned)
+        photo_a = FakePhoto()
+        manager.add_ref(photo_a, 'thumbnails', key='a')
+        manager.add_ref(FakePhoto(), 'thumbnails', key='b')
+        manager.add_ref(FakePhoto(), 'thumbnails', key='c')
+
+        # 'a' est la plus ancienne mais épinglée : 'b' est évincée à sa place
+        assert manager.get_ref('a', 'thumbnails') is photo_a
+        assert manager.get_ref('b', 'thumbnails') is None
+        assert manager.get_bytes() == 800
+
+    def test_on_evict_called_and_kept_after_rematerialize(self):
+        manager = ImageRefManager(budget_bytes=400)
+        evicted = []
+
+        def on_evict(key):
+            evicted.append(key)
+
+        manager.add_ref(FakePhoto(), 'thumbnails', key='a', rematerialize=lambda k: FakePhoto(), on_evict=on_evict)
+        manager.add_ref(FakePhoto(), 'thumbnails', key='b', rematerialize=lambda k: FakePhoto(), on_evict=on_evict)
+        assert evicted == ['a'] and manager.is_evicted('a', 'thumbnails')
+
+        manager.get_ref('a', 'thumbnails')
+        manager.get_ref('b', 'thumbnails')
+
+        assert evicted == ['a', 'b', 'a']
+        assert not manager.is_evicted('b', 'thumbnails')
+
+    def test_same_key_replaces_image(self):
+        manager = ImageRefManager()
+        manager.add_ref(FakePhoto(), 'thumbnails', key='a')
+        replacement = FakePhoto(20, 20)
+        manager.add_ref(replacement, 'thumbnails', key='a')
+
+        assert manager.get_count('thumbnails') == 1
+        assert manager.get_ref('a', 'thumbnails') is replacement
+        assert manager.get_bytes() == 1600
+
+    def test_set_budget_applies_immediately(self):
+        manager = ImageRefManager()
+        for key in range(4):
+            manager.add_ref(FakePhoto(), 'thumbnails', key=key)
+
+        assert manager.set_budget(800) == 2
+        assert manager.get_stats()['categories']['thumbnails'] == {
+            'count': 2, 'bytes': 800, 'evictable': True}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
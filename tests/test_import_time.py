@@ -0,0 +1,163 @@
+"""
+Test de non-régression du temps d'import du package.
+
+Valide que:
+1. L'import du sélecteur ne charge ni l'éditeur, ni le sélecteur de police, ni PIL.ImageTk
+2. Le temps d'import cumulé (python -X importtime) reste sous un budget
+3. L'import ne configure pas le logging (aucun fichier ouvert) ; setup_logging() le fait
+4. L'import de config_loader ne lit pas config.json ; load_config() le lit une seule fois
+"""
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Budget généreux (µs) : l'import mesuré est d'environ 0,1 s sans bytecode en cache ;
+# l'éditeur chargé à l'import le faisait dépasser 0,17 s
+IMPORT_BUDGET_US = 600_000
+
+LAZY_MODULES = (
+    'CadreSelecteur.CadreEditeur.imageeditorapp',
+    'CadreSelecteur.CadreEditeur.imageeditor',
+    'CadreSelecteur.CadreEditeur.layertext',
+    'CadreSelecteur.CadreEditeur.text.tkfontchooser',
+    'CadreSelecteur.frame_installer',
+    'PIL.ImageTk',
+    'ctypes',
+)
+
+
+def _importtime(module: str) -> dict:
+    """Importe `module` dans un interpréteur neuf ; retourne {module: temps cumulé (µs)}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, timeout=60,
+        env={**os.environ, 'PYTHONPATH': str(ROOT)},
+    )
+    assert result.returncode == 0, result.stderr
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # en-tête
+        timings[fields[2].strip()] = int(fields[1])
+    return timings
+
+
+@pytest.fixture(scope='module')
+def timings():
+    return _importtime('CadreSelecteur.cadreselecteur')
+
+
+class TestSelectorImport:
+    """Import de CadreSelecteur.cadreselecteur."""
+
+    @pytest.mark.parametrize('module', LAZY_MODULES)
+    def test_heavy_modules_not_imported(self, timings, module):
+        """L'éditeur, le sélecteur de police et PIL.ImageTk sont importés à la première utilisation."""
+        assert 'CadreSelecteur.cadreselecteur' in timings
+        assert module not in timings
+
+    def test_cumulative_import_time_within_budget(self, timings):
+        """Le temps d'import cumulé du sélecteur reste sous le budget."""
+        assert timings['CadreSelecteur.cadreselecteur'] < IMPORT_BUDGET_US
+
+
+class TestEditorImport:
+    """L'éditeur reste importable et charge le sélecteur de police à la demande."""
+
+    def test_editor_does_not_import_font_chooser(self):
+        timings = _importtime('CadreSelecteur.CadreEditeur.imageeditorapp')
+        assert 'CadreSelecteur.CadreEditeur.layertext' in timings
+        assert 'CadreSelecteur.CadreEditeur.text.tkfontchooser' not in timings
+
+
+class TestLoggingSetup:
+    """Configuration du logging déplacée dans setup_logging()."""
+
+    def test_import_opens_no_log_file(self):
+        """Importer le package n'ajoute aucun FileHandler."""
+        code = ('import logging, CadreSelecteur.cadreselecteur; '
+                'print(sum(isinstance(h, logging.FileHandler) '
+                'for h in logging.getLogger("CadreSelecteur").handlers))')
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                                timeout=60, env={**os.environ, 'PYTHONPATH': str(ROOT)})
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == '0'
+
+    def test_setup_logging_is_idempotent(self, tmp_path, monkeypatch):
+        """setup_logging() crée le dossier et n'ajoute qu'un seul FileHandler."""
+        from CadreSelecteur import logging_config
+        log_dir = tmp_path / 'logs'
+        monkeypatch.setattr(logging_config, 'RESOURCES_DIR', log_dir)
+        monkeypatch.setattr(logging_config, 'LOG_PATH', log_dir / 'image_editor.log')
+        pkg_logger = logging.getLogger('CadreSelecteur')
+        before = list(pkg_logger.handlers)
+        try:
+            assert logging_config.setup_logging() == log_dir / 'image_editor.log'
+            logging_config.setup_logging()
+            added = [h for h in pkg_logger.handlers if h not in before]
+            assert len(added) == 1
+            assert log_dir.is_dir()
+        finally:
+            for handler in pkg_logger.handlers[:]:
+                if handler not in before:
+                    pkg_logger.removeHandler(handler)
+                    handler.close()
+
+
+class TestConfigLoading:
+    """Lecture de config.json déplacée dans load_config()."""
+
+    def test_import_reads_no_config(self):
+        """Importer config_loader ne lit pas config.json."""
+        code = 'import CadreSelecteur.config_loader as c; print(c._config is None)'
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True,
+                                timeout=60, env={**os.environ, 'PYTHONPATH': str(ROOT)})
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == 'True'
+
+    def test_load_config_reads_once(self, tmp_path, monkeypatch):
+        """load_config() fusionne le fichier avec les valeurs par défaut, puis ne le relit plus."""
+        from CadreSelecteur import config_loader
+        config_path = tmp_path / 'config.json'
+        config_path.write_text('{"THUMBNAIL_H": 99}', encoding='utf-8')
+        monkeypatch.setattr(config_loader, 'CONFIG_PATH', config_path)
+        monkeypatch.setattr(config_loader, '_config', None)
+
+        config = config_loader.load_config()
+        config_path.write_text('{"THUMBNAIL_H": 1}', encoding='utf-8')
+
+        assert config['THUMBNAIL_H'] == 99
+        assert config['WINDOWS_SIZE'] == config_loader._defaults['WINDOWS_SIZE']
+        assert config_loader.load_config() is config
+
+    @pytest.mark.parametrize('name, raw, expected', [
+        ('ASSET_STORE', 'false', False),
+        ('ASSET_STORE', '0', False),
+        ('ASSET_STORE', 'True', True),
+        ('ASSET_STORE', 1, True),
+        ('ASSET_STORE', 'peut-être', False),
+        ('THUMBNAIL_H', '140', 140),
+        ('THUMBNAIL_H', 'grand', 128),
+    ])
+    def test_constant_parsing(self, monkeypatch, name, raw, expected):
+        """Booléens lus explicitement ; une valeur invalide donne la valeur par défaut."""
+        from CadreSelecteur import config_loader
+        module_vars = vars(config_loader)
+        missing = object()
+        saved = module_vars.pop(name, missing)
+        monkeypatch.setattr(config_loader, '_config', {**config_loader._defaults, name: raw})
+        try:
+            assert getattr(config_loader, name) == expected
+        finally:
+            module_vars.pop(name, None)
+            if saved is not missing:
+                module_vars[name] = saved
@@ -0,0 +1,79 @@
+"""
+Tests de la qualité progressive du redimensionnement d'un calque image (layerimage).
+
+Valide que:
+1. Un cran de molette ne rééchantillonne que l'affichage, en qualité rapide
+2. refine() recalcule l'affichage en qualité finale, une seule fois
+3. L'image export n'est calculée qu'à l'enregistrement, puis gardée jusqu'au redimensionnement suivant
+"""
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage, DRAFT_RESAMPLE, FINAL_RESAMPLE
+
+
+class RecordingImage:
+    """Enveloppe une image PIL et note les appels à resize()."""
+
+    def __init__(self, image):
+        self.image = image
+        self.size = image.size
+        self.calls = []
+
+    def resize(self, size, resample=None):
+        self.calls.append((tuple(size), resample))
+        return self.image.resize(size, resample)
+
+
+@pytest.fixture
+def layer():
+    layer = LayerImage(None, SimpleNamespace(frame_dir=None), (60, 40), (180, 120), 3)
+    layer.original_image = RecordingImage(Image.new('RGBA', (200, 100), (255, 0, 0, 255)))
+    layer.display_imported_image_size = (60, 30)
+    layer.image_imported_image_size = (180, 90)
+    layer._resample_display()
+    layer.original_image.calls.clear()
+    return layer
+
+
+class TestProgressiveResize:
+    """Redimensionnement pendant et après le geste."""
+
+    def test_draft_resize_only_resamples_display(self, layer):
+        version = layer.version
+        layer.resize(10, draft=True)
+
+        assert layer.original_image.calls == [((70, 35), DRAFT_RESAMPLE)]
+        assert layer.draft
+        assert layer.image_imported_image is None
+        assert layer.image_imported_image_size == (210, 105)
+        assert layer.version == version + 1
+
+    def test_refine_after_gesture(self, layer):
+        for _ in range(5):
+            layer.resize(10, draft=True)
+        layer.original_image.calls.clear()
+
+        assert layer.refine()
+        assert not layer.refine()
+        assert layer.original_image.calls == [((110, 55), FINAL_RESAMPLE)]
+        assert not layer.draft
+
+    def test_export_image_is_lazy(self, layer):
+        layer.resize(10, draft=True)
+        layer.original_image.calls.clear()
+
+        export = Image.new('RGBA', (180, 120))
+        layer.draw_on_image(export, export=True)
+        layer.draw_on_image(export, export=True)
+
+        assert layer.original_image.calls == [((210, 105), FINAL_RESAMPLE)]
+        assert export.getpixel((1, 1)) == (255, 0, 0, 255)
+
+    def test_resize_forgets_export_image(self, layer):
+        first = layer.export_image()
+        layer.resize(-10)
+        assert layer.export_image() is not first
+        assert layer.export_image().size == (150, 75)
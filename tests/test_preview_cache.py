@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour PreviewCache.
+
+Valide que:
+1. Une prévisualisation n'est décodée qu'une fois
+2. Le budget en octets est respecté (éviction LRU)
+3. La modification du fichier source produit une nouvelle entrée
+"""
+
+import os
+
+import pytest
+from PIL import Image
+
+from CadreSelecteur.preview_cache import PreviewCache, image_bytes, PREVIEW_SIZE
+
+
+@pytest.fixture
+def frames(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'cadre{i}_1.png'
+        Image.new('RGBA', (1800, 1200), (i, 0, 0, 255)).save(path)
+        paths.append(path)
+    return paths
+
+
+def counting_loader(calls):
+    def loader(file_path, size):
+        calls.append(file_path)
+        return Image.new('RGBA', size)
+    return loader
+
+
+class TestPreviewCache:
+    """Tests du cache des prévisualisations."""
+
+    def test_decoded_once(self, frames):
+        calls = []
+        cache = PreviewCache(10 * 1024 * 1024, loader=counting_loader(calls))
+
+        first = cache.get_or_create(frames[0])
+        second = cache.get_or_create(frames[0])
+
+        assert first is second
+        assert first.size == PREVIEW_SIZE
+        assert calls == [frames[0]]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_byte_budget_evicts_least_recently_used(self, frames):
+        one = image_bytes(Image.new('RGBA', PREVIEW_SIZE))
+        calls = []
+        cache = PreviewCache(2 * one, loader=counting_loader(calls))
+
+        cache.get_or_create(frames[0])
+        cache.get_or_create(frames[1])
+        cache.get_or_create(frames[0])  # frames[0] devient le plus récent
+        cache.get_or_create(frames[2])  # évince frames[1]
+
+        assert len(cache) == 2
+        assert cache.total_bytes == 2 * one
+        assert cache.contains(frames[0])
+        assert not cache.contains(frames[1])
+
+    def test_modified_source_is_reloaded(self, frames):
+        calls = []
+        cache = PreviewCache(10 * 1024 * 1024, loader=counting_loader(calls))
+        cache.get_or_create(frames[0])
+
+        st = os.stat(frames[0])
+        os.utime(frames[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        cache.get_or_create(frames[0])
+
+        assert len(calls) == 2
+
+    def test_default_loader_decodes_exact_size(self, frames):
+        cache = PreviewCache(10 * 1024 * 1024)
+        assert cache.get_or_create(frames[0], (360, 240)).size == (360, 240)
+
+    def test_missing_file_raises(self, tmp_path):
+        cache = PreviewCache(1024)
+        with pytest.raises(FileNotFoundError):
+            cache.get_or_create(tmp_path / 'absent.png')
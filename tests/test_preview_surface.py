@@ -0,0 +1,82 @@
+"""
+Tests de la surface d'affichage de l'aperçu de l'éditeur (preview_surface).
+
+Valide que:
+1. Le premier rendu crée un seul item et une seule PhotoImage
+2. Les rendus suivants mettent à jour la PhotoImage sur place, sans nouvel item
+3. Un rectangle modifié passe par un tampon alloué une seule fois puis par `image copy`
+"""
+from PIL import Image
+
+from CadreSelecteur.CadreEditeur.preview_surface import PreviewSurface
+
+SIZE = (120, 80)
+
+
+class FakePhoto:
+    def __init__(self, image):
+        self.size = image.size
+        self.pasted = []
+
+    def paste(self, image):
+        self.pasted.append(image.size)
+
+
+class FakeTk:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, *args):
+        self.calls.append(args)
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.tk = FakeTk()
+        self.items = []
+
+    def create_image(self, x, y, **kwargs):
+        self.items.append((x, y, kwargs))
+        return len(self.items)
+
+    def find_all(self):
+        return tuple(range(1, len(self.items) + 1))
+
+
+def _surface():
+    canvas = FakeCanvas()
+    return canvas, PreviewSurface(canvas, SIZE, photo_factory=FakePhoto)
+
+
+class TestPreviewSurface:
+    """Item et PhotoImage persistants."""
+
+    def test_first_show_creates_item(self):
+        canvas, surface = _surface()
+        surface.show(Image.new('RGBA', SIZE), (0, 0) + SIZE)
+        assert surface.item_count() == 1
+        assert (surface.items_created, surface.photo_allocations) == (1, 1)
+
+    def test_full_updates_paste_in_place(self):
+        canvas, surface = _surface()
+        frame = Image.new('RGBA', SIZE)
+        for _ in range(50):
+            surface.show(frame, (0, 0) + SIZE)
+
+        assert surface.item_count() == 1
+        assert surface.photo_allocations == 1
+        assert surface.photo.pasted == [SIZE] * 49
+
+    def test_region_updates_reuse_staging(self):
+        canvas, surface = _surface()
+        frame = Image.new('RGBA', SIZE)
+        surface.show(frame)
+
+        surface.show(frame, (10, 5, 40, 25))
+        surface.show(frame, (0, 0, 7, 3))
+
+        assert surface.item_count() == 1
+        assert surface.photo_allocations == 2
+        assert surface._staging.pasted == [(30, 20), (7, 3)]
+        assert canvas.tk.calls[0][3:] == ('-from', 0, 0, 30, 20, '-to', 10, 5, '-compositingrule', 'set')
+        assert canvas.tk.calls[1][3:] == ('-from', 0, 0, 7, 3, '-to', 0, 0, '-compositingrule', 'set')
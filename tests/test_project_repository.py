@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour ProjectRepository.
+
+Valide que:
+1. Les fichiers de chaque projet sont classés par rôle avec leurs infos stat
+2. Les projets incomplets et les entrées cachées sont gérés
+3. Un projet peut être réinventorié seul
+"""
+
+import pytest
+
+from CadreSelecteur.project_repository import (
+    ProjectRepository,
+    file_role,
+    ROLE_ASSET,
+    ROLE_FRAME_1,
+    ROLE_FRAME_4,
+    ROLE_PROJECT_JSON,
+    ROLE_TEMPLATE_XML,
+)
+
+
+def _make_project(root, name, files):
+    project_dir = root / name
+    project_dir.mkdir()
+    for filename in files:
+        (project_dir / filename).write_bytes(b'x' * 10)
+    return project_dir
+
+
+@pytest.fixture
+def templates(tmp_path):
+    """Répertoire Templates avec un projet complet, un incomplet et des entrées ignorées."""
+    _make_project(tmp_path, 'noel', ['noel_1.png', 'noel_4.png', 'noel.json', 'noel.xml', 'sapin.png'])
+    _make_project(tmp_path, 'incomplet', ['incomplet_1.png'])
+    _make_project(tmp_path, '.trash', ['vieux_1.png', 'vieux_4.png'])
+    (tmp_path / 'template_std.xml').write_text('<xml/>')
+    return tmp_path
+
+
+class TestFileRole:
+    """Tests du classement des fichiers par rôle."""
+
+    def test_roles(self):
+        """Chaque suffixe correspond à son rôle."""
+        assert file_role('a_1.png') == ROLE_FRAME_1
+        assert file_role('a_4.png') == ROLE_FRAME_4
+        assert file_role('a.json') == ROLE_PROJECT_JSON
+        assert file_role('a.xml') == ROLE_TEMPLATE_XML
+        assert file_role('photo.png') == ROLE_ASSET
+
+
+class TestProjectRepository:
+    """Tests de l'inventaire des projets."""
+
+    def test_scan_classifies_files(self, templates):
+        """Les fichiers d'un projet sont accessibles par rôle."""
+        repo = ProjectRepository(templates).scan()
+        project = repo.get('noel')
+
+        assert project.frame_1.endswith('noel_1.png')
+        assert project.frame_4.endswith('noel_4.png')
+        assert project.json.endswith('noel.json')
+        assert project.xml.endswith('noel.xml')
+        assert [f.name for f in project.assets] == ['sapin.png']
+        assert project.files[ROLE_FRAME_1].size == 10
+        assert project.files[ROLE_FRAME_1].mtime_ns > 0
+
+    def test_scan_ignores_files_and_hidden_dirs(self, templates):
+        """Seuls les répertoires visibles sont des projets."""
+        repo = ProjectRepository(templates).scan()
+
+        assert repo.names() == ['incomplet', 'noel']
+        assert len(repo) == 2
+        assert '.trash' not in repo
+
+    def test_complete_projects(self, templates):
+        """Un projet sans _4.png n'est pas installable."""
+        repo = ProjectRepository(templates).scan()
+
+        assert not repo.get('incomplet').is_complete
+        assert [p.name for p in repo.complete_projects()] == ['noel']
+
+    def test_prefers_file_named_after_project(self, tmp_path):
+        """En cas de doublon de rôle, le fichier portant le nom du projet est retenu."""
+        _make_project(tmp_path, 'mariage', ['ancien_1.png', 'mariage_1.png', 'mariage_4.png'])
+        project = ProjectRepository(tmp_path).scan().get('mariage')
+
+        assert project.frame_1.endswith('mariage_1.png')
+
+    def test_missing_root_raises(self, tmp_path):
+        """Un répertoire Templates absent lève FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            ProjectRepository(tmp_path / 'absent').scan()
+
+    def test_scan_project_refreshes_single_project(self, templates):
+        """scan_project met à jour un seul projet, ou le retire s'il a disparu."""
+        repo = ProjectRepository(templates).scan()
+        (templates / 'incomplet' / 'incomplet_4.png').write_bytes(b'y')
+
+        assert repo.scan_project('incomplet').is_complete
+        assert repo.get('incomplet').is_complete
+
+        assert repo.scan_project('absent') is None
+        assert 'absent' not in repo
+
+    def test_signature_changes_with_content(self, templates):
+        """La signature change quand un fichier du projet change."""
+        repo = ProjectRepository(templates).scan()
+        before = repo.get('noel').signature
+        (templates / 'noel' / 'noel_1.png').write_bytes(b'plus long')
+
+        assert repo.scan_project('noel').signature != before
@@ -0,0 +1,84 @@
+"""
+Tests du partage des images entre calques clonés (raster_store).
+
+Valide que:
+1. Un clone partage l'image d'origine, sa pyramide et les images redimensionnées
+2. Seul le calque redimensionné alloue de nouvelles images
+3. Une image et ses réductions sont libérées quand plus aucun calque ne les utilise
+"""
+import gc
+from types import SimpleNamespace
+
+from PIL import Image
+
+from CadreSelecteur.CadreEditeur.image_pyramid import PyramidLevelCache
+from CadreSelecteur.CadreEditeur.layerimage import LayerImage
+from CadreSelecteur.CadreEditeur.raster_store import RasterStore, raster_store
+
+MB = 1024 * 1024
+
+
+def _layer(source_size=(900, 600)):
+    layer = LayerImage(None, SimpleNamespace(frame_dir=None), (60, 40), (180, 120), 3)
+    layer.set_original_image(Image.new('RGBA', source_size, (0, 128, 0, 255)))
+    layer.display_imported_image_size = (60, 40)
+    layer.image_imported_image_size = (180, 120)
+    layer._resample_display()
+    layer.export_image()
+    return layer
+
+
+class TestCloneSharing:
+    """Copie à l'écriture des images d'un calque cloné."""
+
+    def test_clone_shares_pixels(self):
+        layer = _layer()
+        clone = layer.clone(None, SimpleNamespace(frame_dir=None))
+
+        assert clone.original_image is layer.original_image
+        assert clone.pyramid is layer.pyramid
+        assert clone.display_imported_image is layer.display_imported_image
+        assert clone.image_imported_image is layer.image_imported_image
+
+    def test_resized_clone_diverges(self):
+        layer = _layer()
+        display, export = layer.display_imported_image, layer.image_imported_image
+        clone = layer.clone(None, SimpleNamespace(frame_dir=None))
+
+        clone.resize(10)
+
+        assert clone.display_imported_image is not display
+        assert clone.display_imported_image.size == (70, 46)
+        assert clone.export_image().size == (210, 138)
+        assert (layer.display_imported_image, layer.image_imported_image) == (display, export)
+        assert clone.original_image is layer.original_image
+
+    def test_shared_original_counted_once(self):
+        before = raster_store.total_bytes
+        layer = _layer((500, 400))
+        clones = [layer.clone(None, SimpleNamespace(frame_dir=None)) for _ in range(3)]
+
+        assert raster_store.total_bytes - before == 500 * 400 * 4
+        assert len({id(c.pyramid) for c in clones}) == 1
+
+
+class TestRelease:
+    """Libération quand plus aucun calque n'utilise l'image."""
+
+    def test_entry_and_levels_freed(self, monkeypatch):
+        store = RasterStore()
+        cache = PyramidLevelCache(64 * MB)
+        monkeypatch.setattr('CadreSelecteur.CadreEditeur.image_pyramid.level_cache', cache)
+        image = Image.new('RGBA', (400, 300))
+
+        pyramid = store.acquire(image)
+        assert store.acquire(image) is pyramid
+        assert (store.created, store.shared) == (1, 1)
+        pyramid.level(2)
+        assert len(cache) == 1
+
+        del pyramid
+        gc.collect()
+
+        assert len(store) == 0
+        assert len(cache) == 0
@@ -0,0 +1,163 @@
+"""
+Tests du planificateur de rendu de l'éditeur (render_scheduler).
+
+Valide que:
+1. Plusieurs demandes avant le repos de Tk donnent un seul rendu
+2. Un rendu demandé trop tôt est reporté selon la cadence maximale
+3. flush() rend tout de suite l'état en attente, et rien s'il n'y en a pas
+4. Une demande faite pendant le rendu planifie un nouveau rendu
+"""
+import pytest
+
+from CadreSelecteur.CadreEditeur.render_scheduler import RenderScheduler
+
+
+class FakeWidget:
+    """Remplace after / after_idle / after_cancel de Tk : les callbacks sont exécutés à la demande."""
+
+    def __init__(self):
+        self.idle = []
+        self.timers = []
+        self.cancelled = []
+        self._next_id = 0
+
+    def _add(self, queue, item):
+        self._next_id += 1
+        queue.append((self._next_id, item))
+        return self._next_id
+
+    def after_idle(self, callback):
+        return self._add(self.idle, callback)
+
+    def after(self, delay_ms, callback):
+        return self._add(self.timers, (delay_ms, callback))
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+        self.idle = [(i, c) for i, c in self.idle if i != after_id]
+        self.timers = [(i, c) for i, c in self.timers if i != after_id]
+
+    def run_idle(self):
+        pending, self.idle = self.idle, []
+        for _, callback in pending:
+            callback()
+
+    def run_timers(self):
+        pending, self.timers = self.timers, []
+        for _, (_, callback) in pending:
+            callback()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def widget():
+    return FakeWidget()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestCoalescing:
+    """Regroupement des demandes."""
+
+    def test_requests_coalesced_into_one_render(self, widget, clock):
+        renders = []
+        scheduler = RenderScheduler(widget, lambda: renders.append(1), max_fps=0, clock=clock)
+
+        for _ in range(10):
+            scheduler.request()
+
+        assert renders == []
+        assert len(widget.idle) == 1
+        widget.run_idle()
+        assert renders == [1]
+        assert (scheduler.requests, scheduler.renders) == (10, 1)
+
+    def test_request_during_render_schedules_again(self, widget, clock):
+        scheduler = None
+        renders = []
+
+        def render():
+            renders.append(1)
+            if len(renders) == 1:
+                # ex : un widget modifié par le rendu redemande un rafraîchissement
+                scheduler.request()
+
+        scheduler = RenderScheduler(widget, render, max_fps=0, clock=clock)
+        scheduler.request()
+        widget.run_idle()
+        widget.run_idle()
+        widget.run_idle()
+
+        assert len(renders) == 2
+        assert not scheduler.pending
+
+
+class TestFrameRateCap:
+    """Cadence maximale."""
+
+    def test_early_request_delayed(self, widget, clock):
+        renders = []
+        scheduler = RenderScheduler(widget, lambda: renders.append(clock()), max_fps=50, clock=clock)
+        scheduler.request()
+        widget.run_idle()
+
+        clock.now += 0.005
+        scheduler.request()
+        scheduler.request()
+
+        assert widget.idle == []
+        ((_, (delay, _)),) = widget.timers
+        assert delay == 15
+        clock.now += 0.015
+        widget.run_timers()
+        assert len(renders) == 2
+
+    def test_late_request_rendered_on_idle(self, widget, clock):
+        scheduler = RenderScheduler(widget, lambda: None, max_fps=50, clock=clock)
+        scheduler.request()
+        widget.run_idle()
+
+        clock.now += 1
+        scheduler.request()
+
+        assert len(widget.idle) == 1
+        assert widget.timers == []
+
+
+class TestFlush:
+    """Rendu immédiat et annulation."""
+
+    def test_flush_renders_pending_state(self, widget, clock):
+        renders = []
+        scheduler = RenderScheduler(widget, lambda: renders.append(1), clock=clock)
+        scheduler.request()
+
+        scheduler.flush()
+        widget.run_idle()
+
+        assert renders == [1]
+        assert widget.cancelled
+
+    def test_flush_without_request_does_nothing(self, widget, clock):
+        renders = []
+        scheduler = RenderScheduler(widget, lambda: renders.append(1), clock=clock)
+        scheduler.flush()
+        assert renders == []
+
+    def test_cancel_keeps_dirty(self, widget, clock):
+        scheduler = RenderScheduler(widget, lambda: None, clock=clock)
+        scheduler.request()
+        scheduler.cancel()
+
+        assert not scheduler.pending
+        assert scheduler.dirty
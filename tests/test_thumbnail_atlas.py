@@ -0,0 +1,133 @@
+"""
+Tests de l'atlas de vignettes (thumbnail_atlas).
+
+Valide que:
+1. Les vignettes sont rangées dans les cases d'une grille, page par page
+2. Ranger à nouveau la même image ne modifie rien ; une nouvelle image remplace la case
+3. Les cases sont recyclées dans l'ordre LRU quand l'atlas est plein
+4. Un rafraîchissement coûte au plus un appel Tk par page, quel que soit le nombre de vignettes
+"""
+import pytest
+from PIL import Image
+
+from CadreSelecteur.thumbnail_atlas import ThumbnailAtlas
+
+
+class FakePhoto:
+    """PhotoImage factice : enregistre les recopies."""
+
+    def __init__(self, image):
+        self.size = image.size
+        self.pastes = 0
+
+    def paste(self, image):
+        assert image.size == self.size
+        self.pastes += 1
+
+
+def _thumb(color, size=(16, 10)):
+    return Image.new('RGB', size, color)
+
+
+def _atlas(capacity=8, columns=2, rows=2, scheduler=None):
+    return ThumbnailAtlas((16, 10), capacity, columns=columns, rows=rows,
+                          photo_factory=FakePhoto, scheduler=scheduler)
+
+
+class TestLayout:
+    """Placement des vignettes."""
+
+    def test_regions_fill_grid_then_next_page(self):
+        atlas = _atlas()
+        regions = [atlas.add(i, _thumb('red')) for i in range(5)]
+
+        assert [(r.page, r.x, r.y) for r in regions[:4]] == [(0, 0, 0), (0, 16, 0), (0, 0, 10), (0, 16, 10)]
+        assert (regions[4].page, regions[4].x, regions[4].y) == (1, 0, 0)
+        assert atlas.page_size == (32, 20)
+
+    def test_smaller_thumbnail_keeps_its_size(self):
+        region = _atlas().add('a', _thumb('red', (12, 10)))
+        assert (region.width, region.height) == (12, 10)
+
+    def test_pixels_pasted_in_cell(self):
+        atlas = _atlas()
+        atlas.add('a', _thumb('red'))
+        region = atlas.add('b', _thumb('blue'))
+        page = atlas._pages[region.page]
+        assert page.getpixel((region.x + 1, region.y + 1)) == (0, 0, 255, 255)
+
+    def test_oversize_thumbnail_rejected(self):
+        with pytest.raises(ValueError):
+            _atlas().add('a', _thumb('red', (17, 10)))
+
+
+class TestUpdates:
+    """Remplacement et recyclage des cases."""
+
+    def test_same_image_is_noop(self):
+        scheduled = []
+        atlas = _atlas(scheduler=scheduled.append)
+        image = _thumb('red')
+        first = atlas.add('a', image)
+        atlas.flush()
+
+        assert atlas.add('a', image) is first
+        assert atlas._dirty == set()
+        assert len(scheduled) == 1
+
+    def test_new_image_replaces_cell(self):
+        atlas = _atlas()
+        first = atlas.add('a', _thumb('red'))
+        second = atlas.add('a', _thumb('blue'))
+
+        assert (second.page, second.x, second.y) == (first.page, first.x, first.y)
+        assert len(atlas) == 1
+
+    def test_lru_slot_recycled_when_full(self):
+        atlas = _atlas(capacity=4, columns=2, rows=2)
+        regions = {key: atlas.add(key, _thumb('red')) for key in 'abcd'}
+        atlas.region('a')  # 'a' récemment utilisée : 'b' est la plus ancienne
+
+        region = atlas.add('e', _thumb('blue'))
+
+        assert 'b' not in atlas and 'a' in atlas
+        assert (region.x, region.y) == (regions['b'].x, regions['b'].y)
+
+    def test_discard_frees_cell(self):
+        atlas = _atlas(capacity=4, columns=2, rows=2)
+        for key in 'abcd':
+            atlas.add(key, _thumb('red'))
+        assert atlas.discard('c') is True
+        assert atlas.discard('c') is False
+
+        atlas.add('e', _thumb('blue'))
+        assert all(key in atlas for key in 'abde')
+
+
+class TestTkCalls:
+    """Coût Tk d'un rafraîchissement."""
+
+    def test_many_thumbnails_one_call_per_page(self):
+        scheduled = []
+        atlas = ThumbnailAtlas((16, 10), 128, photo_factory=FakePhoto, scheduler=scheduled.append)
+        for i in range(100):
+            atlas.add(i, _thumb((i, 0, 0)))
+        photos = [atlas.photo(page) for page in range(atlas.page_count)]
+
+        # création des pages : un appel Tk par page, aucune recopie en attente
+        assert atlas.tk_calls == 2
+        assert atlas.flush() == 0
+
+        for i in range(100):
+            atlas.add(i, _thumb((0, i, 0)))
+        assert len(scheduled) == 2  # une planification par rafraîchissement
+        scheduled[-1]()
+
+        assert [p.pastes for p in photos] == [1, 1]
+        assert atlas.stats()['tk_calls'] == 4
+
+    def test_photo_none_for_unused_page(self):
+        atlas = _atlas()
+        atlas.add('a', _thumb('red'))
+        assert atlas.photo(1) is None
+        assert len(atlas.photos()) == 0
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour ThumbnailCache.
+
+Valide que:
+1. Une vignette est générée au premier accès puis relue depuis le disque
+2. La modification du fichier source invalide l'entrée
+3. Le cache respecte son budget disque
+"""
+
+import os
+
+import pytest
+from PIL import Image
+
+from CadreSelecteur.thumbnail_cache import ThumbnailCache, make_thumbnail
+
+
+@pytest.fixture
+def source_image(tmp_path):
+    """Crée une image source 1800x1200."""
+    src = tmp_path / 'cadre_1.png'
+    Image.new('RGBA', (1800, 1200), (255, 0, 0, 255)).save(src)
+    return src
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ThumbnailCache(tmp_path / 'cache', (128, 85))
+
+
+class TestThumbnailCache:
+    """Tests du cache disque des vignettes."""
+
+    def test_make_thumbnail_size(self, source_image):
+        thumb = make_thumbnail(source_image, (128, 85))
+        assert thumb.size[0] <= 128 and thumb.size[1] <= 85
+
+    def test_miss_then_hit(self, cache, source_image):
+        first = cache.get_or_create(source_image)
+        assert cache.misses == 1 and cache.hits == 0
+
+        second = cache.get_or_create(source_image)
+        assert cache.hits == 1
+        assert second.size == first.size
+
+    def test_factory_not_called_on_hit(self, cache, source_image):
+        cache.get_or_create(source_image)
+        calls = []
+
+        def factory(path, size):
+            calls.append(path)
+            return make_thumbnail(path, size)
+
+        cache.get_or_create(source_image, factory=factory)
+        assert calls == []
+
+    def test_source_change_invalidates(self, cache, source_image):
+        key_before = cache.key_for(source_image)
+        cache.get_or_create(source_image)
+
+        Image.new('RGBA', (900, 600), (0, 0, 255, 255)).save(source_image)
+        st = os.stat(source_image)
+        os.utime(source_image, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+        assert cache.key_for(source_image) != key_before
+        assert cache.get(source_image) is None
+
+    def test_key_depends_on_thumbnail_size(self, tmp_path, source_image):
+        small = ThumbnailCache(tmp_path / 'cache', (64, 40))
+        big = ThumbnailCache(tmp_path / 'cache', (128, 85))
+        assert small.key_for(source_image) != big.key_for(source_image)
+
+    def test_missing_source(self, cache, tmp_path):
+        assert cache.get(tmp_path / 'absent.png') is None
+        with pytest.raises(FileNotFoundError):
+            cache.get_or_create(tmp_path / 'absent.png')
+
+    def test_eviction_respects_budget(self, tmp_path):
+        cache = ThumbnailCache(tmp_path / 'cache', (128, 85), max_bytes=1)
+        for i in range(3):
+            src = tmp_path / f'img_{i}.png'
+            Image.effect_noise((300, 200), 64).save(src)
+            cache.get_or_create(src)
+        assert cache._get_total_bytes() <= 1
+
+    def test_clear(self, cache, source_image):
+        cache.get_or_create(source_image)
+        assert cache.clear() == 1
+        assert cache.get(source_image) is None
@@ -0,0 +1,107 @@
+"""
+Tests de la mesure des phases de démarrage (timing).
+
+Valide que:
+1. span() et timed() enregistrent une span, même en cas d'exception
+2. Le rapport indente les spans imbriquées et ne garde que celles de la span racine
+3. report=True écrit le rapport dans le log et la trace Chrome si elle est configurée
+4. La trace Chrome est un JSON d'événements complets ('X') en microsecondes
+"""
+import json
+import logging
+import threading
+
+import pytest
+
+from CadreSelecteur.timing import Tracer, now_ns
+
+
+@pytest.fixture
+def tracer():
+    return Tracer()
+
+
+class TestSpans:
+    """Enregistrement des spans."""
+
+    def test_span_records_duration(self, tracer):
+        with tracer.span('phase', count=3):
+            pass
+        (item,) = tracer.spans()
+        assert item.name == 'phase'
+        assert item.end_ns >= item.start_ns
+        assert item.args == {'count': 3}
+
+    def test_span_recorded_on_exception(self, tracer):
+        with pytest.raises(ValueError):
+            with tracer.span('failing'):
+                raise ValueError('boom')
+        assert [s.name for s in tracer.spans()] == ['failing']
+
+    def test_timed_uses_qualified_name_and_returns_value(self, tracer):
+        class Loader:
+            @tracer.timed()
+            def load(self, value):
+                return value * 2
+
+        assert Loader().load(21) == 42
+        assert [s.name for s in tracer.spans()] == ['TestSpans.test_timed_uses_qualified_name_and_returns_value'
+                                                    '.<locals>.Loader.load']
+
+    def test_record_measured_span(self, tracer):
+        start = now_ns()
+        item = tracer.record('async', start, start + 2_000_000)
+        assert item.duration_ms == pytest.approx(2.0)
+
+    def test_spans_are_bounded(self):
+        tracer = Tracer(max_spans=3)
+        for i in range(5):
+            tracer.record(f's{i}', now_ns())
+        assert [s.name for s in tracer.spans()] == ['s2', 's3', 's4']
+
+
+class TestReport:
+    """Rapport texte et trace Chrome."""
+
+    def test_report_indents_nested_spans(self, tracer):
+        with tracer.span('outer'):
+            with tracer.span('inner'):
+                pass
+        lines = tracer.format_report().splitlines()
+        assert lines[1].startswith('  outer')
+        assert lines[2].startswith('    inner')
+
+    def test_report_limited_to_root(self, tracer):
+        tracer.record('before', now_ns())
+        start = now_ns()
+        with tracer.span('child'):
+            pass
+        root = tracer.record('root', start)
+        report = tracer.format_report(root)
+        assert 'child' in report
+        assert 'before' not in report
+        assert report.splitlines()[0] == 'Timing report: root'
+
+    def test_report_true_logs_and_writes_trace(self, tracer, tmp_path, caplog):
+        tracer.trace_file = tmp_path / 'trace.json'
+        with caplog.at_level(logging.INFO, logger='CadreSelecteur.timing'):
+            with tracer.span('startup', report=True):
+                with tracer.span('scan'):
+                    pass
+        assert 'Timing report: startup' in caplog.text
+        events = json.loads(tracer.trace_file.read_text())['traceEvents']
+        assert {e['name'] for e in events if e['ph'] == 'X'} == {'startup', 'scan'}
+
+    def test_chrome_trace_format(self, tracer):
+        start = now_ns()
+        tracer.record('phase', start, start + 1_500_000)
+        worker = threading.Thread(target=lambda: tracer.record('decode', now_ns()), name='worker')
+        worker.start()
+        worker.join()
+
+        trace = tracer.chrome_trace()
+        complete = {e['name']: e for e in trace['traceEvents'] if e['ph'] == 'X'}
+        assert complete['phase']['dur'] == pytest.approx(1500.0)
+        assert complete['phase']['tid'] != complete['decode']['tid']
+        thread_names = {e['args']['name'] for e in trace['traceEvents'] if e['ph'] == 'M'}
+        assert 'worker' in thread_names
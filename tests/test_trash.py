@@ -0,0 +1,148 @@
+"""
+Tests de la corbeille des projets (trash).
+
+Valide que:
+1. move() renomme le projet dans .trash, ignoré par l'inventaire
+2. restore() remet le projet à sa place, sauf si le nom a été réutilisé
+3. purge_entry() efface l'entrée avec un nombre borné de tentatives
+4. purge() reprend les entrées restantes (toutes, ou les plus anciennes)
+"""
+import os
+import shutil
+
+import pytest
+
+from CadreSelecteur.project_repository import ProjectRepository
+from CadreSelecteur.trash import Trash, TRASH_DIR_NAME
+
+
+def _make_project(root, name):
+    project = root / name
+    project.mkdir()
+    (project / f'{name}_1.png').write_bytes(b'1')
+    (project / f'{name}_4.png').write_bytes(b'4')
+    return project
+
+
+class TestMoveRestore:
+    """Mise à la corbeille et annulation."""
+
+    def test_move_hides_project_from_repository(self, tmp_path):
+        _make_project(tmp_path, 'a')
+        _make_project(tmp_path, 'b')
+
+        entry = Trash(tmp_path).move('a')
+
+        assert not (tmp_path / 'a').exists()
+        assert (entry.path / 'a_1.png').read_bytes() == b'1'
+        assert entry.path.parent.parent == tmp_path / TRASH_DIR_NAME
+        assert ProjectRepository(tmp_path).scan().names() == ['b']
+
+    def test_restore_puts_project_back(self, tmp_path):
+        _make_project(tmp_path, 'a')
+        trash = Trash(tmp_path)
+        entry = trash.move('a')
+
+        assert trash.restore(entry) == tmp_path / 'a'
+        assert (tmp_path / 'a' / 'a_4.png').read_bytes() == b'4'
+        assert trash.entries() == []
+
+    def test_restore_refuses_to_overwrite(self, tmp_path):
+        _make_project(tmp_path, 'a')
+        trash = Trash(tmp_path)
+        entry = trash.move('a')
+        _make_project(tmp_path, 'a')
+
+        with pytest.raises(FileExistsError):
+            trash.restore(entry)
+        assert entry.path.exists()
+
+    def test_same_name_deleted_twice(self, tmp_path):
+        trash = Trash(tmp_path)
+        _make_project(tmp_path, 'a')
+        first = trash.move('a')
+        _make_project(tmp_path, 'a')
+        second = trash.move('a')
+
+        assert first.container != second.container
+        assert [e.name for e in trash.entries()] == ['a', 'a']
+
+    @pytest.mark.parametrize('name', ['', '.', '..', TRASH_DIR_NAME, '../a', 'a/b'])
+    def test_invalid_names_rejected(self, tmp_path, name):
+        with pytest.raises(ValueError):
+            Trash(tmp_path).move(name)
+
+    def test_missing_project(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            Trash(tmp_path).move('absent')
+
+
+class TestPurge:
+    """Effacement définitif."""
+
+    def test_purge_entry_removes_files(self, tmp_path):
+        _make_project(tmp_path, 'a')
+        trash = Trash(tmp_path)
+        entry = trash.move('a')
+
+        assert trash.purge_entry(entry) is True
+        assert not entry.container.exists()
+        # déjà effacée : rien à faire
+        assert trash.purge_entry(entry) is True
+
+    def test_purge_entry_bounded_retries(self, tmp_path, monkeypatch):
+        _make_project(tmp_path, 'a')
+        trash = Trash(tmp_path, retries=3, retry_delay=0)
+        entry = trash.move('a')
+        calls = []
+
+        def locked(path):
+            calls.append(path)
+            raise PermissionError('locked')
+
+        monkeypatch.setattr(shutil, 'rmtree', locked)
+
+        assert trash.purge_entry(entry) is False
+        assert len(calls) == 3
+        assert entry.path.exists()
+
+    def test_purge_retries_leftovers(self, tmp_path):
+        for name in ('a', 'b'):
+            _make_project(tmp_path, name)
+        trash = Trash(tmp_path)
+        trash.move('a')
+        trash.move('b')
+
+        assert trash.purge() == 2
+        assert not (tmp_path / TRASH_DIR_NAME).exists()
+
+    def test_entries_skips_container_purged_while_listing(self, tmp_path, monkeypatch):
+        for name in ('a', 'b'):
+            _make_project(tmp_path, name)
+        trash = Trash(tmp_path)
+        purged = trash.move('a')
+        trash.move('b')
+        real_listdir = os.listdir
+
+        def listdir_racing_purge(path):
+            # la purge en arrière-plan efface le conteneur juste avant sa lecture
+            if os.fspath(path) == str(purged.container):
+                shutil.rmtree(purged.container)
+            return real_listdir(path)
+
+        monkeypatch.setattr(os, 'listdir', listdir_racing_purge)
+
+        assert [e.name for e in trash.entries()] == ['b']
+
+    def test_purge_older_than_keeps_recent(self, tmp_path):
+        _make_project(tmp_path, 'old')
+        _make_project(tmp_path, 'new')
+        trash = Trash(tmp_path)
+        old = trash.move('old')
+        # simule une suppression ancienne
+        aged = old.container.with_name('1000-' + old.container.name.split('-', 1)[1])
+        os.rename(old.container, aged)
+        trash.move('new')
+
+        assert trash.purge(older_than=3600) == 1
+        assert [e.name for e in trash.entries()] == ['new']
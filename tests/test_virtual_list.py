@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Tests pour VirtualList.
+
+Valide que:
+1. Seules les lignes visibles (+ overscan) sont créées
+2. Les lignes sont recyclées lors du défilement
+3. Le nombre de widgets ne dépend pas du nombre d'éléments
+"""
+
+from CadreSelecteur.virtual_list import VirtualList
+
+
+class FakeCanvas:
+    """Canvas minimal : fenêtres positionnées et zone visible pilotable."""
+
+    def __init__(self, height=300):
+        self.height = height
+        self.top = 0
+        self.windows = {}
+        self.options = {}
+        self.bindings = {}
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def create_window(self, x, y, window=None, anchor=None):
+        window_id = len(self.windows) + 1
+        self.windows[window_id] = {'coords': (x, y), 'window': window}
+        return window_id
+
+    def coords(self, window_id, x, y):
+        self.windows[window_id]['coords'] = (x, y)
+
+    def itemconfigure(self, window_id, **kwargs):
+        self.windows[window_id].update(kwargs)
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    def canvasy(self, y):
+        return self.top + y
+
+    def winfo_height(self):
+        return self.height
+
+
+class FakeRow:
+    def __init__(self):
+        self.frame = object()
+        self.item = None
+
+
+def make_list(canvas, bound_log=None):
+    def binder(row, item, index):
+        row.item = item
+        if bound_log is not None:
+            bound_log.append(index)
+    return VirtualList(canvas, lambda parent: FakeRow(), binder, row_height=100, overscan=1)
+
+
+class TestVirtualList:
+    """Tests de la liste virtualisée."""
+
+    def test_only_visible_rows_are_created(self):
+        canvas = FakeCanvas(height=300)
+        vlist = make_list(canvas)
+        vlist.set_items(range(1000))
+
+        assert vlist.visible_range() == (0, 4)
+        assert vlist.materialized_range() == (0, 5)
+        assert vlist.row_count() == 5
+        assert canvas.options['scrollregion'][3] == 100 * 1000
+
+    def test_rows_are_recycled_on_scroll(self):
+        canvas = FakeCanvas(height=300)
+        vlist = make_list(canvas)
+        vlist.set_items(range(1000))
+        rows_before = set(vlist.bound_rows().values())
+
+        canvas.top = 50_000
+        vlist.refresh()
+
+        bound = vlist.bound_rows()
+        assert sorted(bound) == list(range(499, 505))
+        assert bound[500].item == 500
+        # une seule ligne supplémentaire (overscan haut), les autres sont recyclées
+        assert vlist.row_count() == 6
+        assert rows_before <= set(bound.values())
+        window_id = vlist._window_ids[bound[500]]
+        assert canvas.windows[window_id]['coords'] == (0, 50_000)
+
+    def test_widget_count_independent_of_item_count(self):
+        small, large = FakeCanvas(), FakeCanvas()
+        vsmall, vlarge = make_list(small), make_list(large)
+        vsmall.set_items(range(20))
+        vlarge.set_items(range(5000))
+        assert vsmall.row_count() == vlarge.row_count()
+
+    def test_set_items_rebinds_visible_rows(self):
+        canvas = FakeCanvas(height=300)
+        log = []
+        vlist = make_list(canvas, log)
+        vlist.set_items(['a', 'b'])
+        log.clear()
+        vlist.set_items(['c', 'd', 'e'])
+        assert sorted(log) == [0, 1, 2]
+        assert vlist.row_for_index(0).item == 'c'
+        assert vlist.row_for_index(10) is None
+
+    def test_update_item_rebinds_only_that_row(self):
+        canvas = FakeCanvas(height=300)
+        log = []
+        vlist = make_list(canvas, log)
+        vlist.set_items(['a', 'b', 'c'])
+        log.clear()
+        vlist.update_item(1, 'B')
+        assert log == [1]
+        assert vlist.row_for_index(1).item == 'B'
+
+    def test_empty_list(self):
+        canvas = FakeCanvas()
+        vlist = make_list(canvas)
+        vlist.set_items([])
+        assert vlist.row_count() == 0
+        assert vlist.visible_range() == (0, 0)